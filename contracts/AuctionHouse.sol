@@ -0,0 +1,180 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.4;
+
+import "OpenZeppelin/openzeppelin-contracts@4.4.2/contracts/token/ERC20/utils/SafeERC20.sol";
+
+contract AuctionHouse {
+    using SafeERC20 for IERC20;
+
+    // Every lot is an independent Dutch auction, with the same semantics as DutchAuction. As the tokens of many lots (of
+    // possibly the same token) are held by this contract, every lot keeps its own token count instead of reading its balance
+    struct Lot {
+        address payable seller;             // Slot 1
+        uint64          endTimestamp;
+        address payable buyer;              // Slot 2
+        uint64          startTimestamp;
+        IERC20          token;              // Slot 3
+        uint128         startPrice;         // Slot 4
+        uint128         reservationPrice;
+        uint256         tokenCount;         // Slot 5
+    }
+
+    mapping(uint256 => Lot) private lots;
+    uint256 public lotCount;
+
+    event LotCreated(uint256 indexed lotId, address indexed seller, IERC20 indexed token, uint256 tokenCount);
+    event LotLaunched(uint256 indexed lotId, uint256 startTimestamp, uint256 endTimestamp, uint256 startPrice, uint256 reservationPrice);
+    event LotSold(uint256 indexed lotId, address indexed buyer, uint256 price, uint256 tokenCount);
+    event TokensRetrieved(uint256 indexed lotId, address indexed seller, uint256 tokenCount);
+
+    // Bid path errors (as in DutchAuction)
+    error AuctionNotStarted();
+    error AuctionFinished();
+    error BuyerIsSeller();
+    error InsufficientFunds(uint256 price, uint256 value);
+
+    modifier onlySeller(uint256 _lotId) {
+        require(lots[_lotId].seller == msg.sender, 'The caller is not the seller of the lot');
+        _;
+    }
+
+
+    // Lot Parameters
+    function getLot(uint256 _lotId) external view returns (Lot memory) {
+        return lots[_lotId];
+    }
+
+    function getTokenCount(uint256 _lotId) external view returns (uint256) {
+        return lots[_lotId].tokenCount;
+    }
+
+
+    // State Functions
+    function isLotReady(uint256 _lotId) public view returns (bool) {
+        return lots[_lotId].startTimestamp != 0;
+    }
+
+    function hasLotFinished(uint256 _lotId) public view returns (bool) {
+        Lot storage lot = lots[_lotId];
+        return lot.startTimestamp != 0 && block.timestamp >= lot.endTimestamp;
+    }
+
+    function isLotDeserted(uint256 _lotId) public view returns (bool) {
+        Lot storage lot = lots[_lotId];
+        require(lot.startTimestamp != 0, 'The auction has not been launched');
+        require(block.timestamp >= lot.endTimestamp || lot.buyer != address(0), 'The auction has not finished.');
+
+        return lot.buyer == address(0);
+    }
+
+
+    // Lot Functions
+    function createLot(IERC20 _token, uint256 _tokenCount) external returns (uint256 lotId) {
+        // Equivalent to deploying and funding a DutchAuction: the tokens are pulled from the seller, who must have allowed
+        // this contract to transfer them (standard ERC20 tokens are assumed, i.e. without transfer fees)
+        lotId = lotCount++;
+
+        Lot storage lot = lots[lotId];
+        lot.seller     = payable(msg.sender);
+        lot.token      = _token;
+        lot.tokenCount = _tokenCount;
+
+        _token.safeTransferFrom(msg.sender, address(this), _tokenCount);
+
+        emit LotCreated(lotId, msg.sender, _token, _tokenCount);
+    }
+
+    function launch(
+        uint256 _lotId,
+        uint256 _startTimestamp,
+        uint256 _endTimestamp,
+        uint256 _startPrice,
+        uint256 _reservationPrice
+    ) external onlySeller(_lotId) {
+        Lot storage lot = lots[_lotId];
+
+        require(lot.startTimestamp == 0, 'The auction has already been launched');
+        require(lot.tokenCount > 0, 'There are no tokens to auction');
+        require(_startTimestamp > block.timestamp, 'The start date has to be after the current date.');
+        require(_startTimestamp < _endTimestamp, 'The start date cannot be after the end date');
+        require(_endTimestamp <= type(uint64).max, 'The end date is too large');
+        require(_startPrice > 0, 'The start price must be non-zero.');
+        require(_startPrice <= type(uint128).max, 'The start price is too large');
+        require(_reservationPrice < _startPrice, 'The reservation price must be smaller than the start price.');
+
+        lot.startTimestamp   = uint64(_startTimestamp);
+        lot.endTimestamp     = uint64(_endTimestamp);
+        lot.startPrice       = uint128(_startPrice);
+        lot.reservationPrice = uint128(_reservationPrice);
+
+        emit LotLaunched(_lotId, _startTimestamp, _endTimestamp, _startPrice, _reservationPrice);
+    }
+
+    function getCurrentPrice(uint256 _lotId) public view returns (uint256) {
+        return _getCurrentPrice(lots[_lotId]);
+    }
+
+    function _getCurrentPrice(Lot memory _lot) internal view returns (uint256) {
+        uint256 nowTimestamp = block.timestamp;
+
+        // Check that the auction is ongoing (for lots that have not been launched, or do not exist, endTimestamp is zero)
+        if (nowTimestamp < _lot.startTimestamp) revert AuctionNotStarted();
+        if (nowTimestamp >= _lot.endTimestamp || _lot.buyer != address(0)) revert AuctionFinished();
+
+        uint256 currentPrice;
+        unchecked {
+            // As in DutchAuction._computePrice (the auction is ongoing, so this cannot overflow)
+            currentPrice = _lot.startPrice - (
+                uint256(_lot.startPrice - _lot.reservationPrice) * (nowTimestamp - _lot.startTimestamp)
+            ) / (_lot.endTimestamp - _lot.startTimestamp);
+        }
+        if (currentPrice <= _lot.reservationPrice) revert AuctionFinished();
+
+        return currentPrice;
+    }
+
+    function buy(uint256 _lotId) external payable returns (uint256) {
+        Lot memory lot = lots[_lotId]; // Read the (packed) lot storage once
+
+        uint256 price = _getCurrentPrice(lot); // Note that this call checks if the auction is ongoing
+
+        if (msg.sender == lot.seller) revert BuyerIsSeller();
+        if (msg.value < price) revert InsufficientFunds(price, msg.value);
+
+        lots[_lotId].buyer      = payable(msg.sender);
+        lots[_lotId].tokenCount = 0;
+
+        // Send auction price to seller
+        lot.seller.transfer(price);
+
+        // Send tokens to buyer
+        lot.token.safeTransfer(msg.sender, lot.tokenCount);
+
+        // Return excess funds to buyer
+        uint256 refund;
+        unchecked { refund = msg.value - price; } // msg.value >= price is checked above
+        if (refund > 0) payable(msg.sender).transfer(refund);
+
+        emit LotSold(_lotId, msg.sender, price, lot.tokenCount);
+
+        return price;
+    }
+
+    function retrieveTokens(uint256 _lotId) external onlySeller(_lotId) {
+        // Tokens can only be recovered by the seller before the auction is launched and after the auction has completed
+        Lot storage lot = lots[_lotId];
+        require(
+            lot.startTimestamp == 0 ||
+            block.timestamp >= lot.endTimestamp ||
+            lot.buyer != address(0)
+            , 'Tokens cannot be recovered once the auction has been launched and it hasn\'t finished.'
+        );
+
+        uint256 tokenCount = lot.tokenCount;
+        lot.tokenCount = 0;
+        lot.token.safeTransfer(lot.seller, tokenCount);
+
+        emit TokensRetrieved(_lotId, lot.seller, tokenCount);
+    }
+
+}
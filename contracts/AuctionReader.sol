@@ -0,0 +1,45 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+import "./DutchAuction.sol";
+
+// Reads the state of many auctions in a single call (meant to be used through eth_call)
+contract AuctionReader {
+    // Size of an ABI encoded DutchAuction.AuctionState (17 static fields)
+    uint256 private constant AUCTION_STATE_SIZE = 17*32;
+
+    struct AuctionReading {
+        bool                      success;  // False if the auction state could not be read
+        DutchAuction.AuctionState state;
+    }
+
+    function readAuctions(DutchAuction[] calldata _auctions) external view returns (AuctionReading[] memory) {
+        AuctionReading[] memory readings = new AuctionReading[](_auctions.length);
+
+        for (uint256 i = 0; i < _auctions.length; i++) {
+            // A failing auction does not make the whole batch fail (note that the current price of the snapshot is
+            // zero whenever getCurrentPrice() would revert). A high-level call would revert the batch on addresses
+            // without code, and on returned data that cannot be decoded, so the state is read with a low-level call,
+            // and decoded (through an external call, so that decoding errors can be caught) only if its size matches
+            address target = address(_auctions[i]);
+            if (target.code.length == 0) continue;
+
+            (bool success, bytes memory data) = target.staticcall(
+                abi.encodeWithSelector(DutchAuction.getAuctionState.selector)
+            );
+            if (!success || data.length != AUCTION_STATE_SIZE) continue;
+
+            try this.decodeAuctionState(data) returns (DutchAuction.AuctionState memory state) {
+                readings[i].success = true;
+                readings[i].state   = state;
+            } catch {}
+        }
+
+        return readings;
+    }
+
+    function decodeAuctionState(bytes calldata _data) external pure returns (DutchAuction.AuctionState memory) {
+        return abi.decode(_data, (DutchAuction.AuctionState));
+    }
+
+}
@@ -1,56 +1,209 @@
 // SPDX-License-Identifier: MIT
-pragma solidity ^0.8.0;
+pragma solidity ^0.8.4;
 
 import "OpenZeppelin/openzeppelin-contracts@4.4.2/contracts/access/Ownable.sol";
 import "OpenZeppelin/openzeppelin-contracts@4.4.2/contracts/token/ERC20/utils/SafeERC20.sol";
 
 contract DutchAuction is Ownable {
-    address payable public immutable seller;
-    IERC20 public immutable token;
+    // The auction storage is packed in 4 slots (the owner is stored in the first slot, by Ownable)
+    struct Auction {
+        address payable seller;             // Slot 1
+        uint64          endTimestamp;
+        address payable buyer;              // Slot 2
+        uint64          startTimestamp;
+        IERC20          token;              // Slot 3
+        uint128         startPrice;         // Slot 4
+        uint128         reservationPrice;
+    }
+
+    Auction private auction;
 
-    address payable public buyer;
+    // Clones (see DutchAuctionFactory) run the code of an implementation deployed by the factory, hence they share these
+    // immutables: a clone can tell that it is one as its address differs from the implementation's, and it lets the factory
+    // retrieve its tokens and funds on behalf of its owner (see DutchAuctionFactory.sweepAuctions). No storage is used
+    address private immutable factory;
+    address private immutable implementation;
 
-    uint256 public startTimestamp;
-    uint256 public endTimestamp;
-    uint256 public startPrice;
-    uint256 public reservationPrice;
+    // Snapshot of the whole auction, returned by getAuctionState()
+    struct AuctionState {
+        bool    ready;
+        bool    started;
+        bool    finished;
+        bool    ongoing;
+        bool    deserted;           // False until the auction has finished
+        address seller;
+        address owner;              // May differ from the seller, as ownership is transferable
+        address buyer;
+        IERC20  token;
+        uint256 startTimestamp;
+        uint256 endTimestamp;
+        uint256 startPrice;
+        uint256 reservationPrice;
+        uint256 currentPrice;       // Zero if the auction is not accepting bids
+        uint256 tokenBalance;
+        uint256 balance;            // ETH balance
+        uint256 timestamp;          // Block timestamp at which the snapshot was taken
+    }
 
-    uint256 public duration;
-    uint256 public priceRange;
+    event AuctionLaunched(uint256 startTimestamp, uint256 endTimestamp, uint256 startPrice, uint256 reservationPrice, uint256 tokenCount);
+    event AuctionSold(address indexed buyer, uint256 price, uint256 tokenCount);
+    event TokensRetrieved(address indexed seller, uint256 tokenCount);
+    event FundsRetrieved(address indexed seller, uint256 amount);
+
+    // Bid path errors (custom errors are cheaper than revert strings, both to deploy and to revert with)
+    error AuctionNotStarted();
+    error AuctionFinished();
+    error BuyerIsSeller();
+    error InsufficientFunds(uint256 price, uint256 value);
 
     constructor(IERC20 _token) {
-        seller = payable(msg.sender);
-        token  = _token;
+        auction.seller = payable(msg.sender);
+        auction.token  = _token;
+
+        factory        = msg.sender;
+        implementation = address(this);
+    }
+
+    modifier onlyOwnerOrFactory() {
+        require(
+            msg.sender == owner() || (msg.sender == factory && address(this) != implementation),
+            'Ownable: caller is not the owner'
+        );
+        _;
     }
-    
+
+    // Initializer used by minimal proxy clones (see DutchAuctionFactory), which do not run the constructor
+    function initialize(IERC20 _token, address payable _seller) public {
+        require(auction.seller == address(0), 'The auction has already been initialized');
+        require(_seller != address(0), 'The seller cannot be the zero address');
+
+        auction.seller = _seller;
+        auction.token  = _token;
+
+        _transferOwnership(_seller);
+    }
+
+    // Initializes and launches a clone already funded with the auctioned tokens (see DutchAuctionFactory.createAndLaunchAuction)
+    function initializeAndLaunch(
+        IERC20 _token,
+        address payable _seller,
+        uint256 _startTimestamp,
+        uint256 _endTimestamp,
+        uint256 _startPrice,
+        uint256 _reservationPrice
+    ) external {
+        initialize(_token, _seller);
+        _launchAuction(_startTimestamp, _endTimestamp, _startPrice, _reservationPrice);
+    }
+
     receive() payable external {
         revert('This contract cannot store ETH');
     }
-    
+
+
+    // Auction Parameters
+    function seller() public view returns (address payable) {
+        return auction.seller;
+    }
+
+    function token() public view returns (IERC20) {
+        return auction.token;
+    }
+
+    function buyer() public view returns (address payable) {
+        return auction.buyer;
+    }
+
+    function startTimestamp() public view returns (uint256) {
+        return auction.startTimestamp;
+    }
+
+    function endTimestamp() public view returns (uint256) {
+        return auction.endTimestamp;
+    }
+
+    function startPrice() public view returns (uint256) {
+        return auction.startPrice;
+    }
+
+    function reservationPrice() public view returns (uint256) {
+        return auction.reservationPrice;
+    }
+
+    function duration() public view returns (uint256) {
+        return auction.endTimestamp - auction.startTimestamp;
+    }
+
+    function priceRange() public view returns (uint256) {
+        return auction.startPrice - auction.reservationPrice;
+    }
+
 
     // State Functions
     function isAuctionReady() public view returns (bool) {
-        return startTimestamp != 0;
+        return auction.startTimestamp != 0;
     }
 
     function hasAuctionStarted() public view returns (bool) {
-        return startTimestamp != 0 && block.timestamp >= startTimestamp;
+        return auction.startTimestamp != 0 && block.timestamp >= auction.startTimestamp;
     }
 
     function hasAuctionFinished() public view returns (bool) {
-        return startTimestamp != 0 && block.timestamp >= endTimestamp;
+        return auction.startTimestamp != 0 && block.timestamp >= auction.endTimestamp;
     }
 
     function isAuctionOngoing() public view returns (bool) {
-        return startTimestamp != 0 && block.timestamp >= startTimestamp && block.timestamp < endTimestamp;
+        return auction.startTimestamp != 0 && block.timestamp >= auction.startTimestamp && block.timestamp < auction.endTimestamp;
     }
 
     function isAuctionDeserted() public view returns (bool) {
-        require(startTimestamp != 0, 'The auction has not been launched');
-        require(block.timestamp >= endTimestamp || buyer != address(0), 'The auction has not finished.');
+        require(auction.startTimestamp != 0, 'The auction has not been launched');
+        require(block.timestamp >= auction.endTimestamp || auction.buyer != address(0), 'The auction has not finished.');
+
+        return auction.buyer == address(0);
+    }
+
+    function getAuctionState() external view returns (AuctionState memory state) {
+        // Unlike the individual state functions, this function never reverts (not even on uninitialized clones, on the
+        // implementation contract of the factory, whose token is unset, or on tokens without code or whose balanceOf reverts)
+        Auction memory _auction = auction;
+        uint256 nowTimestamp    = block.timestamp;
+
+        state.ready    = _auction.startTimestamp != 0;
+        state.started  = state.ready && nowTimestamp >= _auction.startTimestamp;
+        state.finished = state.ready && nowTimestamp >= _auction.endTimestamp;
+        state.ongoing  = state.started && !state.finished;
+        state.deserted = state.finished && _auction.buyer == address(0);
+
+        state.seller           = _auction.seller;
+        state.owner            = owner();
+        state.buyer            = _auction.buyer;
+        state.token            = _auction.token;
+        state.startTimestamp   = _auction.startTimestamp;
+        state.endTimestamp     = _auction.endTimestamp;
+        state.startPrice       = _auction.startPrice;
+        state.reservationPrice = _auction.reservationPrice;
+        state.tokenBalance     = _tokenBalance(_auction.token);
+        state.balance          = address(this).balance;
+        state.timestamp        = nowTimestamp;
+
+        if (state.ongoing && _auction.buyer == address(0)) {
+            uint256 currentPrice = _computePrice(_auction, nowTimestamp);
+            if (currentPrice > _auction.reservationPrice) state.currentPrice = currentPrice;
+        }
+    }
+
+
+    function _tokenBalance(IERC20 _token) internal view returns (uint256) {
+        // Zero if the token has no code (the call would revert when decoding the missing return data) or balanceOf reverts
+        if (address(_token).code.length == 0) return 0;
 
-        return buyer == address(0);
-    }   
+        try _token.balanceOf(address(this)) returns (uint256 balance) {
+            return balance;
+        } catch {
+            return 0;
+        }
+    }
 
 
     // Auction Functions
@@ -60,76 +213,114 @@ contract DutchAuction is Ownable {
         uint256 _startPrice,
         uint256 _reservationPrice
     ) external onlyOwner {
-        require(startTimestamp == 0, 'The auction has already been launched');
-        require(token.balanceOf(address(this)) > 0, 'There are no tokens to auction');
+        _launchAuction(_startTimestamp, _endTimestamp, _startPrice, _reservationPrice);
+    }
+
+    function _launchAuction(
+        uint256 _startTimestamp,
+        uint256 _endTimestamp,
+        uint256 _startPrice,
+        uint256 _reservationPrice
+    ) internal {
+        require(auction.startTimestamp == 0, 'The auction has already been launched');
+        uint256 tokenCount = auction.token.balanceOf(address(this));
+        require(tokenCount > 0, 'There are no tokens to auction');
         require(_startTimestamp > block.timestamp, 'The start date has to be after the current date.');
         require(_startTimestamp < _endTimestamp, 'The start date cannot be after the end date');
+        require(_endTimestamp <= type(uint64).max, 'The end date is too large');
         require(_startPrice > 0, 'The start price must be non-zero.');
+        require(_startPrice <= type(uint128).max, 'The start price is too large');
         require(_reservationPrice < _startPrice, 'The reservation price must be smaller than the start price.');
 
-        startTimestamp   = _startTimestamp;
-        endTimestamp     = _endTimestamp;
-        startPrice       = _startPrice;
-        reservationPrice = _reservationPrice;
+        auction.startTimestamp   = uint64(_startTimestamp);
+        auction.endTimestamp     = uint64(_endTimestamp);
+        auction.startPrice       = uint128(_startPrice);
+        auction.reservationPrice = uint128(_reservationPrice);
 
-        duration         = _endTimestamp - _startTimestamp;
-        priceRange       = _startPrice - _reservationPrice;
+        emit AuctionLaunched(_startTimestamp, _endTimestamp, _startPrice, _reservationPrice, tokenCount);
     }
 
     function getCurrentPrice() public view returns (uint256) {
+        return _getCurrentPrice(auction);
+    }
+
+    function _getCurrentPrice(Auction memory _auction) internal view returns (uint256) {
         uint256 nowTimestamp = block.timestamp;
 
         // Check that the auction is ongoing
-        require(nowTimestamp >= startTimestamp, 'Auction has not started.');
-        require(nowTimestamp < endTimestamp && buyer == address(0), 'Auction has finished');
+        if (nowTimestamp < _auction.startTimestamp) revert AuctionNotStarted();
+        if (nowTimestamp >= _auction.endTimestamp || _auction.buyer != address(0)) revert AuctionFinished();
 
-        uint256 currentPrice = startPrice - (priceRange * (nowTimestamp - startTimestamp)) / duration;
-        require(currentPrice > reservationPrice, 'Auction has finished');
+        uint256 currentPrice = _computePrice(_auction, nowTimestamp);
+        if (currentPrice <= _auction.reservationPrice) revert AuctionFinished();
         // The currentPrice is checked to be larger than the reservationPrice to take care of possible rounding errors
 
         return currentPrice;
     }
 
+    function _computePrice(Auction memory _auction, uint256 _timestamp) internal pure returns (uint256) {
+        // Linear price decrease from the start price (at the start timestamp) to the reservation price (at the end timestamp)
+        // Only called whilst the auction is ongoing (startTimestamp <= _timestamp < endTimestamp), hence the price range
+        // (uint128) times the elapsed time (uint64) cannot overflow, and the price drop is smaller than the start price
+        unchecked {
+            return _auction.startPrice - (
+                uint256(_auction.startPrice - _auction.reservationPrice) * (_timestamp - _auction.startTimestamp)
+            ) / (_auction.endTimestamp - _auction.startTimestamp);
+        }
+    }
+
     function buy() external payable returns (uint256) {
-        uint256 price = getCurrentPrice(); // Note that this call checks if the auction is ongoing
+        Auction memory _auction = auction; // Read the (packed) auction storage once
+
+        uint256 price = _getCurrentPrice(_auction); // Note that this call checks if the auction is ongoing
 
-        require(msg.sender != seller, 'The buyer cannot be the seller');
-        require(msg.value >= price, 'Not enough funds to buy at the current price');
+        if (msg.sender == _auction.seller) revert BuyerIsSeller();
+        if (msg.value < price) revert InsufficientFunds(price, msg.value);
 
-        buyer = payable(msg.sender);
+        auction.buyer = payable(msg.sender);
 
         // Send auction price to seller
-        seller.transfer(price);
+        _auction.seller.transfer(price);
 
         // Send tokens to buyer
-        token.transfer(buyer, getTokenBalance());
-        
-        // Return excess funds to buyer        
-        uint256 refund = msg.value - price;
-        if (refund > 0) buyer.transfer(refund);
+        uint256 tokenCount = _auction.token.balanceOf(address(this));
+        _auction.token.transfer(msg.sender, tokenCount);
+
+        // Return excess funds to buyer (only if any, as every value transfer costs at least 2,300 gas)
+        uint256 refund;
+        unchecked { refund = msg.value - price; } // msg.value >= price is checked above
+        if (refund > 0) payable(msg.sender).transfer(refund);
+
+        emit AuctionSold(msg.sender, price, tokenCount);
 
         return price;
     }
 
     function getTokenBalance() public view returns (uint256) {
-        return token.balanceOf(address(this));
+        return auction.token.balanceOf(address(this));
     }
 
-    function retrieveTokens() external onlyOwner {
+    function retrieveTokens() external onlyOwnerOrFactory {
         // Tokens can only be recovered by the owner before the auction is launched and after the auction has completed
         require(
-            startTimestamp == 0 || 
-            block.timestamp >= endTimestamp ||
-            buyer != address(0)
+            auction.startTimestamp == 0 ||
+            block.timestamp >= auction.endTimestamp ||
+            auction.buyer != address(0)
             , 'Tokens cannot be recovered once the auction has been launched and it hasn\'t finished.'
         );
 
-        token.transfer(seller, getTokenBalance());
+        uint256 tokenCount = getTokenBalance();
+        auction.token.transfer(auction.seller, tokenCount);
+
+        emit TokensRetrieved(auction.seller, tokenCount);
     }
 
-    function retrieveFunds() external payable onlyOwner {
+    function retrieveFunds() external payable onlyOwnerOrFactory {
         // Precaution: always allow the seller to recover the ETH funds of the contract
-        seller.transfer(address(this).balance);
+        uint256 amount = address(this).balance;
+        auction.seller.transfer(amount);
+
+        emit FundsRetrieved(auction.seller, amount);
     }
 
-}
\ No newline at end of file
+}
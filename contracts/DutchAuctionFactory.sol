@@ -0,0 +1,74 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+import "OpenZeppelin/openzeppelin-contracts@4.4.2/contracts/proxy/Clones.sol";
+import "OpenZeppelin/openzeppelin-contracts@4.4.2/contracts/token/ERC20/utils/SafeERC20.sol";
+import "./DutchAuction.sol";
+
+contract DutchAuctionFactory {
+    using SafeERC20 for IERC20;
+
+    address public immutable implementation;
+
+    event AuctionCreated(address indexed auction, address indexed seller, IERC20 indexed token);
+
+    constructor() {
+        // The implementation is initialized by its own constructor (seller = this factory), so it cannot be taken over
+        implementation = address(new DutchAuction(IERC20(address(0))));
+    }
+
+
+    // Factory Functions
+    function createAuction(IERC20 _token) public returns (DutchAuction) {
+        DutchAuction auction = DutchAuction(payable(Clones.clone(implementation)));
+        auction.initialize(_token, payable(msg.sender));
+
+        emit AuctionCreated(address(auction), msg.sender, _token);
+
+        return auction;
+    }
+
+    function createAuctions(IERC20 _token, uint256 _count) external returns (DutchAuction[] memory) {
+        require(_count > 0, 'At least one auction must be created');
+
+        DutchAuction[] memory auctions = new DutchAuction[](_count);
+        for (uint256 i = 0; i < _count; i++) {
+            auctions[i] = createAuction(_token);
+        }
+
+        return auctions;
+    }
+
+    function createAndLaunchAuction(
+        IERC20 _token,
+        uint256 _tokenCount,
+        uint256 _startTimestamp,
+        uint256 _endTimestamp,
+        uint256 _startPrice,
+        uint256 _reservationPrice
+    ) external returns (DutchAuction) {
+        // Creates, funds and launches an auction in a single transaction. The tokens are pulled from the caller, who must
+        // have allowed this factory to transfer them (a single approval can be used for any number of auctions)
+        DutchAuction auction = DutchAuction(payable(Clones.clone(implementation)));
+
+        _token.safeTransferFrom(msg.sender, address(auction), _tokenCount);
+        auction.initializeAndLaunch(_token, payable(msg.sender), _startTimestamp, _endTimestamp, _startPrice, _reservationPrice);
+
+        emit AuctionCreated(address(auction), msg.sender, _token);
+
+        return auction;
+    }
+
+    function sweepAuctions(DutchAuction[] calldata _auctions) external {
+        // Retrieves the tokens (and funds, if any) of many finished, deserted or not launched auctions owned by the caller,
+        // in a single transaction. The auctions only accept this factory on behalf of their owner if they are its clones
+        for (uint256 i = 0; i < _auctions.length; i++) {
+            DutchAuction auction = _auctions[i];
+            require(auction.owner() == msg.sender, 'The caller is not the owner of the auction');
+
+            auction.retrieveTokens();
+            if (address(auction).balance > 0) auction.retrieveFunds();
+        }
+    }
+
+}
@@ -0,0 +1,15 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+// Answers any call with the same data (a contract which is not an auction, but does not revert)
+contract TestFallback {
+    bytes private data;
+
+    constructor(bytes memory _data) {
+        data = _data;
+    }
+
+    fallback(bytes calldata) external returns (bytes memory) {
+        return data;
+    }
+}
@@ -0,0 +1,171 @@
+from collections import OrderedDict
+
+from brownie import DutchAuction, web3
+from brownie.exceptions import VirtualMachineError
+
+from scripts.auction_state import ZERO_ADDRESS, AuctionState
+
+# Block-keyed read cache for the DutchAuction views, for dashboards and bots that poll the same views many times per block.
+#
+# Every read is pinned to the block the client was last refreshed at (AuctionClient.refresh, a single eth_blockNumber
+# call), so that all the views read between two refreshes are consistent. The views are cached for that block, and dropped
+# when a new block is seen. The fields that can no longer change (the seller and token once set, the launch parameters once
+# launched, and the buyer once sold) are cached across blocks. Both caches are LRU bounded. Reverts (e.g. getCurrentPrice
+# before the auction starts) are cached as well.
+
+DEFAULT_MAX_ENTRIES = 10000
+
+# Views that never change once they hold a final value: the seller and token once the auction has been initialized, and the
+# buyer once it has been sold. The launch parameters (LAUNCH_VIEWS) are final once the auction has been launched.
+FINAL_ADDRESS_VIEWS = ("seller", "token", "buyer")
+LAUNCH_VIEWS        = ("startTimestamp", "endTimestamp", "startPrice", "reservationPrice", "duration", "priceRange")
+
+# Views that may change with every block
+BLOCK_VIEWS = (
+    "owner",
+    "isAuctionReady",
+    "hasAuctionStarted",
+    "hasAuctionFinished",
+    "isAuctionOngoing",
+    "isAuctionDeserted",
+    "getAuctionState",
+    "getCurrentPrice",
+    "getTokenBalance"
+)
+
+VIEWS = FINAL_ADDRESS_VIEWS + LAUNCH_VIEWS + BLOCK_VIEWS
+
+
+class LRUCache:
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.evictions   = 0
+        self._entries    = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+
+class _Revert:
+    # Cached revert of a view, raised again on every hit
+    __slots__ = ("exc",)
+
+    def __init__(self, exc):
+        self.exc = exc
+
+
+class AuctionClient:
+    """
+        Reads DutchAuction views (of any number of auctions) through the block-keyed cache. hits and misses count the reads
+        served from the cache and the view calls sent to the node (refresh calls are counted in refreshes).
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.block_number = None
+        self.hits         = 0
+        self.misses       = 0
+        self.refreshes    = 0
+
+        self._final     = LRUCache(max_entries)     # (address, view) -> value, across blocks
+        self._per_block = LRUCache(max_entries)     # (address, view) -> value, at block_number
+        self._auctions  = {}
+
+    def refresh(self):
+        """
+            Pins the reads to the latest block, dropping the views cached for the previous one if a new block was mined.
+        """
+
+        block_number = web3.eth.block_number
+        self.refreshes += 1
+
+        if block_number != self.block_number:
+            self._per_block.clear()
+            self.block_number = block_number
+
+        return block_number
+
+    def _contract(self, address):
+        if address not in self._auctions:
+            self._auctions[address] = DutchAuction.at(address)
+        return self._auctions[address]
+
+    def _read(self, address, view):
+        self.misses += 1
+        try:
+            return getattr(self._contract(address), view)(block_identifier=self.block_number)
+        except VirtualMachineError as exc:
+            return _Revert(exc)
+
+    def _is_final(self, address, view, value):
+        if isinstance(value, _Revert):
+            return False
+        if view in FINAL_ADDRESS_VIEWS:
+            return value != ZERO_ADDRESS
+        if view in LAUNCH_VIEWS:
+            # A launched auction has a non-zero start timestamp
+            return (value if view == "startTimestamp" else self.call(address, "startTimestamp")) != 0
+        return False
+
+    def call(self, auction, view):
+        """
+            Returns the value of a view of an auction (a DutchAuction or an address) at the pinned block, raising the
+            VirtualMachineError of the view if it reverts.
+        """
+
+        if view not in VIEWS:
+            raise ValueError(f"Unknown DutchAuction view: {view}")
+        if self.block_number is None:
+            self.refresh()
+
+        key = (str(auction), view)
+
+        if key in self._final:
+            self.hits += 1
+            value = self._final.get(key)
+        elif key in self._per_block:
+            self.hits += 1
+            value = self._per_block.get(key)
+        else:
+            value = self._read(key[0], view)
+            if self._is_final(key[0], view, value):
+                self._final.put(key, value)
+            else:
+                self._per_block.put(key, value)
+
+        if isinstance(value, _Revert):
+            raise value.exc
+        return value
+
+    def get_auction_state(self, auction):
+        return AuctionState(str(auction), self.call(auction, "getAuctionState"))
+
+    def stats(self):
+        reads = self.hits + self.misses
+        return {
+            "block_number" : self.block_number,
+            "hits"         : self.hits,
+            "misses"       : self.misses,
+            "hit_rate"     : self.hits/reads if reads else 0,
+            "refreshes"    : self.refreshes,
+            "evictions"    : self._final.evictions + self._per_block.evictions,
+            "final"        : len(self._final),
+            "per_block"    : len(self._per_block)
+        }
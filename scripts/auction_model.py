@@ -0,0 +1,106 @@
+from scripts.auction_state import ZERO_ADDRESS
+from scripts.price_engine import current_price
+
+# Pure Python reference model of a single DutchAuction (deployed via the constructor).
+#
+# Every transition takes the caller and the timestamp of the block in which the transaction is mined, and returns whether
+# the contract should accept it, applying it to the model only if so. Used by the stateful tests to check the contract
+# against, step by step.
+
+UINT64_MAX  = 2**64 - 1
+UINT128_MAX = 2**128 - 1
+
+
+class AuctionModel:
+
+    def __init__(self, seller):
+        self.seller            = str(seller)
+        self.owner             = str(seller)
+        self.buyer             = ZERO_ADDRESS
+        self.token_balance     = 0
+        self.start_timestamp   = 0
+        self.end_timestamp     = 0
+        self.start_price       = 0
+        self.reservation_price = 0
+
+    # State (as the DutchAuction state functions, at the given timestamp)
+    @property
+    def ready(self):
+        return self.start_timestamp != 0
+
+    @property
+    def has_buyer(self):
+        return self.buyer != ZERO_ADDRESS
+
+    def started(self, timestamp):
+        return self.ready and timestamp >= self.start_timestamp
+
+    def finished(self, timestamp):
+        return self.ready and timestamp >= self.end_timestamp
+
+    def ongoing(self, timestamp):
+        return self.started(timestamp) and not self.finished(timestamp)
+
+    def deserted(self, timestamp):
+        return self.finished(timestamp) and not self.has_buyer
+
+    def price(self, timestamp):
+        # Zero if getCurrentPrice reverts
+        return current_price(
+            self.start_timestamp, self.end_timestamp, self.start_price, self.reservation_price, timestamp, self.has_buyer
+        )
+
+    # Transitions
+    def fund(self, token_count):
+        self.token_balance += token_count
+        return True
+
+    def launch(self, caller, start_timestamp, end_timestamp, start_price, reservation_price, timestamp):
+        if (
+            str(caller) != self.owner or
+            self.ready or
+            self.token_balance == 0 or
+            start_timestamp <= timestamp or
+            start_timestamp >= end_timestamp or
+            end_timestamp > UINT64_MAX or
+            start_price == 0 or
+            start_price > UINT128_MAX or
+            reservation_price >= start_price
+        ):
+            return False
+
+        self.start_timestamp   = start_timestamp
+        self.end_timestamp     = end_timestamp
+        self.start_price       = start_price
+        self.reservation_price = reservation_price
+        return True
+
+    def buy(self, caller, value, timestamp):
+        """
+            Returns the price paid (zero if the bid should revert).
+        """
+
+        price = self.price(timestamp)
+        if price == 0 or str(caller) == self.seller or value < price:
+            return 0
+
+        self.buyer         = str(caller)
+        self.token_balance = 0
+        return price
+
+    def retrieve_tokens(self, caller, timestamp):
+        """
+            Returns whether the call should succeed; the retrieved tokens (all of them) are then sent to the seller.
+        """
+
+        if str(caller) != self.owner:
+            return False
+        if self.ready and not self.finished(timestamp) and not self.has_buyer:
+            return False
+
+        self.token_balance = 0
+        return True
+
+    def retrieve_funds(self, caller):
+        # The contract never holds ETH, so there is nothing else to model
+        return str(caller) == self.owner
@@ -0,0 +1,33 @@
+from brownie import AuctionReader, web3
+
+from scripts.auction_state import AuctionState
+
+DEFAULT_CHUNK_SIZE = 100 # Auctions read per call
+
+
+def deploy_auction_reader(account):
+    return AuctionReader.deploy({"from": account})
+
+
+def read_auctions(reader, auctions, chunk_size=DEFAULT_CHUNK_SIZE, block_identifier=None):
+    """
+        Reads the state of many auctions (DutchAuction contracts or addresses) through an AuctionReader, in chunks of
+        chunk_size auctions per call. All chunks are read at the same block.
+
+        Returns a list with an AuctionState per auction, or None for the auctions whose state could not be read.
+    """
+
+    if block_identifier is None:
+        block_identifier = web3.eth.block_number
+
+    addresses = [str(auction) for auction in auctions]
+
+    states = []
+    for i in range(0, len(addresses), chunk_size):
+        chunk    = addresses[i:i + chunk_size]
+        readings = reader.readAuctions(chunk, block_identifier=block_identifier)
+
+        for address, (success, state) in zip(chunk, readings):
+            states.append(AuctionState(address, state) if success else None)
+
+    return states
@@ -0,0 +1,66 @@
+from brownie import DutchAuction
+
+# Fields of the DutchAuction.AuctionState struct, in declaration order
+AUCTION_STATE_FIELDS = (
+    "ready",
+    "started",
+    "finished",
+    "ongoing",
+    "deserted",
+    "seller",
+    "owner",
+    "buyer",
+    "token",
+    "start_timestamp",
+    "end_timestamp",
+    "start_price",
+    "reservation_price",
+    "current_price",
+    "token_balance",
+    "balance",
+    "timestamp"
+)
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+class AuctionState:
+    """
+        Snapshot of a DutchAuction, decoded from the tuple returned by its getAuctionState() view.
+    """
+
+    __slots__ = ("address",) + AUCTION_STATE_FIELDS
+
+    def __init__(self, address, values):
+        self.address = str(address)
+        for field, value in zip(AUCTION_STATE_FIELDS, values):
+            setattr(self, field, value)
+
+    @property
+    def has_buyer(self):
+        return self.buyer != ZERO_ADDRESS
+
+    @property
+    def accepting_bids(self):
+        return self.current_price > 0
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __repr__(self):
+        return f"<AuctionState {self.address} ready={self.ready} ongoing={self.ongoing} finished={self.finished} price={self.current_price}>"
+
+
+def get_auction_state(auction, block_identifier=None):
+    """
+        Reads the whole state of an auction (given as a DutchAuction or an address) with a single call.
+    """
+
+    if isinstance(auction, str):
+        auction = DutchAuction.at(auction)
+
+    return AuctionState(auction.address, auction.getAuctionState(block_identifier=block_identifier))
+
+
+def get_auction_states(auctions, block_identifier=None):
+    return [get_auction_state(auction, block_identifier) for auction in auctions]
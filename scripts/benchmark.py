@@ -0,0 +1,244 @@
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+
+from brownie import accounts, chain, TestToken
+from web3 import Web3
+
+from scripts.deploy import deploy_auction
+
+# Benchmark of the gas used and wall-clock time of every DutchAuction entry point, across a grid of auction parameters.
+#
+#   brownie run benchmark                           Run the grid, writing reports/benchmark.json and reports/benchmark.csv
+#   brownie run benchmark baseline                  Run the grid, and store the gas of every grid point as the baseline
+#   brownie run benchmark compare [baseline_path]   Run the grid, and fail if any call uses more gas than in the baseline, or
+#                                                   if any entry point is missing from either the baseline or the results
+
+REPORT_PATH   = "reports/benchmark"
+BASELINE_PATH = "reports/benchmark_baseline.json"
+
+ENTRY_POINTS = ["deploy", "launchAuction", "getCurrentPrice", "buy", "retrieveTokens", "retrieveFunds"]
+GRID_PARAMS  = ["token_count", "duration", "start_price", "reservation_price", "buy_position"]
+
+BENCHMARK_START_DELAY    = 3600                                         # Delay to start the auction (in seconds)
+BENCHMARK_TOKEN_COUNTS   = [1, 1000, 10**24]                            # Auctioned tokens count
+BENCHMARK_DURATIONS      = [3600, 3600*24*7]                            # Auction duration (in seconds)
+BENCHMARK_PRICES         = [                                            # (Start price, reservation price)
+    (Web3.toWei(10, "gwei"), Web3.toWei(1, "gwei")),
+    (Web3.toWei(10, "ether"), 0)
+]
+BENCHMARK_BUY_POSITIONS  = [0.0, 0.5, 0.99, None]                       # Fraction of the duration at which to bid (None: deserted)
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start)*1000
+
+
+def _record(results, entry_point, params, gas_used, time_ms):
+    results.append({"entry_point": entry_point, **params, "gas_used": gas_used, "time_ms": round(time_ms, 3)})
+
+
+def _run_auction(results, seller_account, buyer_account, token, params):
+    # Deploy and fund
+    auction, time_ms = _timed(deploy_auction, seller_account, token)
+    _record(results, "deploy", params, auction.tx.gas_used, time_ms)
+
+    token.getTokens(params["token_count"], {"from": seller_account})
+    token.transfer(auction, params["token_count"], {"from": seller_account})
+
+    # Launch
+    start_timestamp = chain.time() + BENCHMARK_START_DELAY
+    end_timestamp   = start_timestamp + params["duration"]
+
+    tx, time_ms = _timed(
+        auction.launchAuction,
+        start_timestamp, end_timestamp, params["start_price"], params["reservation_price"], {"from": seller_account}
+    )
+    _record(results, "launchAuction", params, tx.gas_used, time_ms)
+
+    # Bid (or let the auction be deserted)
+    if params["buy_position"] is None:
+        chain.sleep(BENCHMARK_START_DELAY + params["duration"])
+        chain.mine()
+
+    else:
+        chain.sleep(BENCHMARK_START_DELAY + int(params["duration"]*params["buy_position"]))
+        chain.mine()
+
+        price, time_ms = _timed(auction.getCurrentPrice)
+        _record(results, "getCurrentPrice", params, auction.getCurrentPrice.estimate_gas(), time_ms)
+
+        # Overpay to also exercise the refund
+        tx, time_ms = _timed(auction.buy, {"from": buyer_account, "value": price*2})
+        _record(results, "buy", params, tx.gas_used, time_ms)
+
+    # Retrieve
+    tx, time_ms = _timed(auction.retrieveTokens, {"from": seller_account})
+    _record(results, "retrieveTokens", params, tx.gas_used, time_ms)
+
+    tx, time_ms = _timed(auction.retrieveFunds, {"from": seller_account})
+    _record(results, "retrieveFunds", params, tx.gas_used, time_ms)
+
+
+def run_benchmark():
+    """
+        Runs every auction of the parameter grid, returning the gas used and time of each entry point call.
+    """
+
+    seller_account = accounts[0]
+    buyer_account  = accounts[1]
+
+    token = TestToken.deploy("TestToken", "TT", {"from": seller_account})
+    chain.snapshot()
+
+    results = []
+    for token_count in BENCHMARK_TOKEN_COUNTS:
+        for duration in BENCHMARK_DURATIONS:
+            for start_price, reservation_price in BENCHMARK_PRICES:
+                for buy_position in BENCHMARK_BUY_POSITIONS:
+                    params = {
+                        "token_count"       : token_count,
+                        "duration"          : duration,
+                        "start_price"       : start_price,
+                        "reservation_price" : reservation_price,
+                        "buy_position"      : buy_position
+                    }
+                    _run_auction(results, seller_account, buyer_account, token, params)
+                    chain.revert()
+
+    return results
+
+
+def summarize(results):
+    """
+        Aggregates the results per entry point.
+    """
+
+    summary = {}
+    for entry_point in ENTRY_POINTS:
+        entries = [result for result in results if result["entry_point"] == entry_point]
+        if not entries: continue
+
+        gas_used = [entry["gas_used"] for entry in entries]
+        time_ms  = [entry["time_ms"] for entry in entries]
+        summary[entry_point] = {
+            "calls"        : len(entries),
+            "gas_min"      : min(gas_used),
+            "gas_max"      : max(gas_used),
+            "gas_mean"     : sum(gas_used) // len(gas_used),
+            "time_ms_mean" : round(sum(time_ms)/len(time_ms), 3),
+            "time_ms_max"  : max(time_ms)
+        }
+
+    return summary
+
+
+def _grid_key(result):
+    return (result["entry_point"], *(result[param] for param in GRID_PARAMS))
+
+
+def compare_results(baseline_results, results):
+    """
+        Compares the gas used by every call with the same call (entry point and grid point) of the baseline, as the gas is
+        deterministic for a fixed grid.
+
+        Returns a list of (entry_point, params, baseline_gas, gas) for every call that uses more gas than in the baseline,
+        and a list of (entry_point, side) for every entry point missing from the 'baseline' or the 'results' side.
+    """
+
+    baseline_gas = {_grid_key(result): result["gas_used"] for result in baseline_results}
+
+    regressions = []
+    for result in results:
+        key = _grid_key(result)
+        if key in baseline_gas and result["gas_used"] > baseline_gas[key]:
+            params = {param: result[param] for param in GRID_PARAMS}
+            regressions.append((result["entry_point"], params, baseline_gas[key], result["gas_used"]))
+
+    baseline_entry_points = {result["entry_point"] for result in baseline_results}
+    entry_points          = {result["entry_point"] for result in results}
+
+    missing  = [(entry_point, "results") for entry_point in ENTRY_POINTS if entry_point in baseline_entry_points - entry_points]
+    missing += [(entry_point, "baseline") for entry_point in ENTRY_POINTS if entry_point in entry_points - baseline_entry_points]
+
+    return regressions, missing
+
+
+def write_report(results, summary, path=REPORT_PATH):
+    """
+        Writes the summary and the results to {path}.json, and the results to {path}.csv.
+    """
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path.with_suffix(".json"), "w") as json_file:
+        json.dump({"summary": summary, "results": results}, json_file, indent=2)
+
+    with open(path.with_suffix(".csv"), "w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def _print_summary(summary):
+    print(f"{'Entry point':<16} {'Calls':>6} {'Gas min':>10} {'Gas max':>10} {'Gas mean':>10} {'ms mean':>9}")
+    for entry_point, entry in summary.items():
+        print(
+            f"{entry_point:<16} {entry['calls']:>6} {entry['gas_min']:>10} {entry['gas_max']:>10} "
+            f"{entry['gas_mean']:>10} {entry['time_ms_mean']:>9}"
+        )
+
+
+def _print_deltas(baseline_summary, summary):
+    print(f"{'Entry point':<16} {'Baseline mean':>14} {'Gas mean':>10} {'Delta':>8}")
+    for entry_point, entry in summary.items():
+        if entry_point not in baseline_summary: continue
+
+        baseline_gas = baseline_summary[entry_point]["gas_mean"]
+        print(f"{entry_point:<16} {baseline_gas:>14} {entry['gas_mean']:>10} {entry['gas_mean'] - baseline_gas:>+8}")
+
+
+def main(report_path=REPORT_PATH):
+    results = run_benchmark()
+    summary = summarize(results)
+
+    write_report(results, summary, report_path)
+    _print_summary(summary)
+
+    return results, summary
+
+
+def baseline(baseline_path=BASELINE_PATH):
+    results, summary = main()
+
+    # The gas of every grid point is stored (the time is not, as it is not deterministic)
+    baseline_results = [{key: value for key, value in result.items() if key != "time_ms"} for result in results]
+
+    with open(baseline_path, "w") as baseline_file:
+        json.dump({"summary": summary, "results": baseline_results}, baseline_file, indent=2)
+    print(f"Gas baseline stored in {baseline_path}")
+
+
+def compare(baseline_path=BASELINE_PATH):
+    with open(baseline_path) as baseline_file:
+        baseline_report = json.load(baseline_file)
+
+    results, summary     = main()
+    regressions, missing = compare_results(baseline_report["results"], results)
+
+    # Gas delta of every entry point (e.g. of buy, for a change of the bid path)
+    _print_deltas(baseline_report["summary"], summary)
+
+    for entry_point, params, baseline_gas, gas in regressions:
+        print(f"Gas regression in {entry_point} {params}: {baseline_gas} -> {gas} (+{gas - baseline_gas})")
+
+    for entry_point, side in missing:
+        print(f"Entry point {entry_point} is missing from the {side}")
+
+    if regressions or missing: sys.exit(1)
+    print("No gas regressions found")
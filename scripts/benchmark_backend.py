@@ -0,0 +1,98 @@
+import json
+import time
+from pathlib import Path
+
+from brownie import accounts, chain, network, TestToken
+from web3 import Web3
+
+from scripts.benchmark_workers import run_suite
+from scripts.deploy import deploy_and_fund_auction
+
+# Compares the in-process EVM backend (scripts/in_process_evm.py) against Ganache: the mean latency of the operations the tests
+# are made of, and the wall-clock time of the whole test suite on each backend.
+#
+#   brownie run benchmark_backend [main call_count [suite]]     # Any value of suite also times the test suite
+
+CALL_COUNT  = 200
+REPORT_PATH = "reports/backend.json"
+
+AUCTION_START_DELAY = 60
+AUCTION_DURATION    = 3600*24
+AUCTION_START_PRICE = Web3.toWei(10, "gwei")
+AUCTION_RES_PRICE   = Web3.toWei(1, "gwei")
+AUCTION_TOKEN_COUNT = 1000
+
+
+def _mean_latency(fn, call_count):
+    start = time.perf_counter()
+    for _ in range(call_count):
+        fn()
+    return (time.perf_counter() - start)/call_count*1000
+
+
+def measure_latencies(call_count):
+    """
+        Returns the mean latency (in ms) of a call, a transaction, a time jump, a snapshot and revert, and a deployment on the
+        connected network.
+    """
+
+    account = accounts[0]
+    token   = TestToken.deploy("TestToken", "TT", {"from": account})
+    auction = deploy_and_fund_auction(account, token, AUCTION_TOKEN_COUNT)
+
+    start_timestamp = chain.time() + AUCTION_START_DELAY
+    auction.launchAuction(start_timestamp, start_timestamp + AUCTION_DURATION, AUCTION_START_PRICE, AUCTION_RES_PRICE, {"from": account})
+    chain.sleep(AUCTION_START_DELAY)
+    chain.mine()
+
+    def sleep_and_mine():
+        chain.sleep(1)
+        chain.mine()
+
+    def snapshot_and_revert():
+        chain.snapshot()
+        chain.revert()
+
+    return {
+        "getCurrentPrice call"  : _mean_latency(auction.getCurrentPrice, call_count),
+        "getTokens transaction" : _mean_latency(lambda: token.getTokens(1, {"from": account}), call_count),
+        "sleep and mine"        : _mean_latency(sleep_and_mine, call_count),
+        "snapshot and revert"   : _mean_latency(snapshot_and_revert, call_count),
+        "TestToken deployment"  : _mean_latency(lambda: TestToken.deploy("TestToken", "TT", {"from": account}), call_count//10 or 1)
+    }
+
+
+def main(call_count=CALL_COUNT, suite=False):
+    """
+        Measures the operation latencies on Ganache (the network brownie run connected to) and then on the in-process EVM,
+        and, if suite is set, times the whole test suite on both backends.
+    """
+
+    from scripts import in_process_evm # Optional dependency (eth-tester)
+
+    call_count = int(call_count)
+    results    = {"ganache": {}, "in-process": {}}
+
+    results["ganache"]["latency_ms"] = measure_latencies(call_count)
+    network.disconnect()
+
+    in_process_evm.connect()
+    results["in-process"]["latency_ms"] = measure_latencies(call_count)
+
+    print(f"{'Operation':<24} {'Ganache (ms)':>14} {'In-process (ms)':>16} {'Speedup':>8}")
+    for operation, ganache_latency in results["ganache"]["latency_ms"].items():
+        in_process_latency = results["in-process"]["latency_ms"][operation]
+        print(f"{operation:<24} {ganache_latency:>14.2f} {in_process_latency:>16.2f} {ganache_latency/in_process_latency:>7.1f}x")
+
+    if suite:
+        for backend, result in results.items():
+            elapsed, passed = run_suite(options=["--evm", backend])
+            result["suite"] = {"seconds": round(elapsed, 1), "passed": passed}
+
+        print(f"\n{'Backend':<12} {'Suite (s)':>10} {'Passed':>7}")
+        for backend, result in results.items():
+            print(f"{backend:<12} {result['suite']['seconds']:>10} {str(result['suite']['passed']):>7}")
+
+    Path(REPORT_PATH).parent.mkdir(parents=True, exist_ok=True)
+    with open(REPORT_PATH, "w") as report_file:
+        json.dump(results, report_file, indent=2)
@@ -0,0 +1,86 @@
+import time
+
+from brownie import accounts, chain, TestToken
+from web3 import Web3
+
+from scripts.auction_cache import AuctionClient
+from scripts.deploy import deploy_and_fund_auction
+
+# Polling workload of a dashboard: every auction's views are read several times per block (e.g. a 3 s polling interval with
+# 12 s blocks), directly and through the block-keyed cache (scripts/auction_cache.py), counting the RPC calls of each.
+#
+#   brownie run benchmark_cache [main auction_count block_count polls_per_block]
+
+AUCTION_COUNT   = 20
+BLOCK_COUNT     = 20
+POLLS_PER_BLOCK = 4
+BLOCK_TIME      = 12
+
+POLLED_VIEWS = ("seller", "token", "startPrice", "endTimestamp", "buyer", "getTokenBalance", "getCurrentPrice")
+
+AUCTION_START_DELAY = 60
+AUCTION_DURATION    = 3600*24
+AUCTION_START_PRICE = Web3.toWei(10, "gwei")
+AUCTION_RES_PRICE   = Web3.toWei(1, "gwei")
+AUCTION_TOKEN_COUNT = 1000
+
+
+def _poll_direct(auctions):
+    for auction in auctions:
+        for view in POLLED_VIEWS:
+            getattr(auction, view)()
+    return len(auctions)*len(POLLED_VIEWS)
+
+
+def _poll_cached(client, auctions):
+    client.refresh()
+    for auction in auctions:
+        for view in POLLED_VIEWS:
+            client.call(auction, view)
+
+
+def main(auction_count=AUCTION_COUNT, block_count=BLOCK_COUNT, polls_per_block=POLLS_PER_BLOCK):
+    """
+        Compares the RPC calls and wall-clock time of polling auction_count auctions polls_per_block times per block, for
+        block_count blocks, with and without the cache.
+    """
+
+    auction_count, block_count, polls_per_block = int(auction_count), int(block_count), int(polls_per_block)
+
+    account  = accounts[0]
+    token    = TestToken.deploy("TestToken", "TT", {"from": account})
+    auctions = [deploy_and_fund_auction(account, token, AUCTION_TOKEN_COUNT) for _ in range(auction_count)]
+
+    start_timestamp = chain.time() + AUCTION_START_DELAY
+    for auction in auctions:
+        auction.launchAuction(start_timestamp, start_timestamp + AUCTION_DURATION, AUCTION_START_PRICE, AUCTION_RES_PRICE, {"from": account})
+    chain.sleep(AUCTION_START_DELAY)
+    chain.mine()
+
+    client       = AuctionClient()
+    direct_calls = 0
+    direct_time  = 0
+    cached_time  = 0
+    for _ in range(block_count):
+        for _ in range(polls_per_block):
+            start         = time.perf_counter()
+            direct_calls += _poll_direct(auctions)
+            direct_time  += time.perf_counter() - start
+
+            start        = time.perf_counter()
+            _poll_cached(client, auctions)
+            cached_time += time.perf_counter() - start
+
+        chain.sleep(BLOCK_TIME)
+        chain.mine()
+
+    stats        = client.stats()
+    cached_calls = stats["misses"] + stats["refreshes"]
+
+    print(f"{'':<8} {'RPC calls':>10} {'Time (s)':>10}")
+    print(f"{'Direct':<8} {direct_calls:>10} {direct_time:>10.3f}")
+    print(f"{'Cached':<8} {cached_calls:>10} {cached_time:>10.3f}")
+    print(
+        f"\n{direct_calls - cached_calls} RPC calls saved ({1 - cached_calls/direct_calls:.1%}), "
+        f"hit rate {stats['hit_rate']:.1%}, {stats['evictions']} evictions"
+    )
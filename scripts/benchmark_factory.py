@@ -0,0 +1,32 @@
+from brownie import accounts, TestToken
+
+from scripts.deploy import deploy_auction, deploy_auction_factory
+
+BATCH_SIZES = [1, 10, 25, 50]
+
+
+def main():
+    """
+        Compares the gas cost per auction of a plain DutchAuction deployment against batched clones created by
+        DutchAuctionFactory.
+
+        Run with: brownie run benchmark_factory
+    """
+
+    account = accounts[0]
+    token   = TestToken.deploy("TestToken", "TT", {"from": account})
+
+    plain_gas = deploy_auction(account, token).tx.gas_used
+
+    factory = deploy_auction_factory(account)
+    print(f"Factory deployment (one-off): {factory.tx.gas_used} gas")
+    print(f"Plain deploy:                 {plain_gas} gas/auction")
+
+    for batch_size in BATCH_SIZES:
+        tx = factory.createAuctions(token, batch_size, {"from": account})
+        per_auction = tx.gas_used // batch_size
+
+        print(
+            f"Clone batch of {batch_size:>4}:        {per_auction} gas/auction "
+            f"({100 * per_auction / plain_gas:.1f}% of a plain deploy)"
+        )
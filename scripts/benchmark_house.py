@@ -0,0 +1,72 @@
+import time
+
+from brownie import accounts, chain, TestToken
+from web3 import Web3
+
+from scripts.deploy import deploy_auction, deploy_auction_house
+
+LOT_COUNT           = 1000
+AUCTION_START_DELAY = 3600*24
+AUCTION_DURATION    = 3600*24
+AUCTION_START_PRICE = Web3.toWei(10, "gwei")
+AUCTION_RES_PRICE   = Web3.toWei(1, "gwei")
+AUCTION_TOKEN_COUNT = 1000
+
+
+def _launch_parameters():
+    start_timestamp = chain.time() + AUCTION_START_DELAY
+    return start_timestamp, start_timestamp + AUCTION_DURATION, AUCTION_START_PRICE, AUCTION_RES_PRICE
+
+
+def _separate_deployments(account, token, lot_count, house):
+    # deploy, transfer and launchAuction for every auction
+    gas = 0
+    for _ in range(lot_count):
+        auction = deploy_auction(account, token)
+        gas += auction.tx.gas_used
+        gas += token.transfer(auction, AUCTION_TOKEN_COUNT, {"from": account}).gas_used
+        gas += auction.launchAuction(*_launch_parameters(), {"from": account}).gas_used
+
+    return gas
+
+
+def _auction_house(account, token, lot_count, house):
+    # createLot and launch for every lot (the auction house is deployed and approved once, see main)
+    gas = 0
+    for _ in range(lot_count):
+        tx = house.createLot(token, AUCTION_TOKEN_COUNT, {"from": account})
+        gas += tx.gas_used
+        gas += house.launch(tx.events["LotCreated"]["lotId"], *_launch_parameters(), {"from": account}).gas_used
+
+    return gas
+
+
+def main(lot_count=LOT_COUNT):
+    """
+        Compares the gas used and the throughput of setting up (funding and launching) lot_count auctions as separate
+        DutchAuction deployments against lot_count lots of a single AuctionHouse. The tokens are minted beforehand, as
+        minting is the same for both.
+
+        Run with: brownie run benchmark_house [main lot_count]
+    """
+
+    lot_count = int(lot_count)
+
+    account = accounts[0]
+    token   = TestToken.deploy("TestToken", "TT", {"from": account})
+    token.getTokens(2*AUCTION_TOKEN_COUNT*lot_count, {"from": account})
+
+    # One-off costs of the auction house
+    house = deploy_auction_house(account)
+    approve_tx = token.approve(house, 2**256 - 1, {"from": account})
+    print(f"AuctionHouse deployment and approval (one-off): {house.tx.gas_used + approve_tx.gas_used} gas")
+
+    for name, setup in [("Separate deployments", _separate_deployments), ("AuctionHouse lots", _auction_house)]:
+        start = time.perf_counter()
+        gas = setup(account, token, lot_count, house)
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"{name:<22} {lot_count} auctions: {gas // lot_count:>8} gas/auction   {gas:>12} gas total   "
+            f"{lot_count/elapsed:>6.1f} auctions/s"
+        )
@@ -0,0 +1,75 @@
+import time
+
+from brownie import accounts, chain, TestToken
+from web3 import Web3
+
+from scripts.deploy import deploy_auction, deploy_auction_factory, deploy_fund_and_launch
+
+AUCTION_COUNT       = 20
+AUCTION_START_DELAY = 3600
+AUCTION_DURATION    = 3600*24
+AUCTION_START_PRICE = Web3.toWei(10, "gwei")
+AUCTION_RES_PRICE   = Web3.toWei(1, "gwei")
+AUCTION_TOKEN_COUNT = 1000
+
+
+def _launch_parameters():
+    start_timestamp = chain.time() + AUCTION_START_DELAY
+    return start_timestamp, start_timestamp + AUCTION_DURATION, AUCTION_START_PRICE, AUCTION_RES_PRICE
+
+
+def _current_flow(account, token):
+    # deploy, transfer and launchAuction: three transactions per auction (the tokens are minted once, see main)
+    auction = deploy_auction(account, token)
+    token.transfer(auction, AUCTION_TOKEN_COUNT, {"from": account})
+    auction.launchAuction(*_launch_parameters(), {"from": account})
+
+    return sum(tx.gas_used for tx in account.history[-3:]), 3
+
+
+def _single_transaction_flow(account, token, factory):
+    # createAndLaunchAuction: one transaction per auction (the tokens are minted and approved once, see main)
+    deploy_fund_and_launch(account, token, AUCTION_TOKEN_COUNT, *_launch_parameters(), factory)
+
+    return account.history[-1].gas_used, 1
+
+
+def _measure(auction_count, flow, *args):
+    gas, start = 0, time.perf_counter()
+    for _ in range(auction_count):
+        auction_gas, tx_count = flow(*args)
+        gas += auction_gas
+
+    elapsed = time.perf_counter() - start
+
+    return gas // auction_count, tx_count, 1000*elapsed/auction_count
+
+
+def main(auction_count=AUCTION_COUNT):
+    """
+        Compares the gas used and the wall-clock time to get an auction live of the current flow (deploy, fund and
+        launch) against the single transaction path of DutchAuctionFactory.createAndLaunchAuction.
+
+        Run with: brownie run benchmark_launch [main auction_count]
+    """
+
+    auction_count = int(auction_count)
+
+    account = accounts[0]
+    token   = TestToken.deploy("TestToken", "TT", {"from": account})
+
+    # The tokens of both flows are minted up front, outside the measured region
+    token.getTokens(2*AUCTION_TOKEN_COUNT*auction_count, {"from": account})
+
+    # One-off costs of the single transaction path
+    factory = deploy_auction_factory(account)
+    token.approve(factory, AUCTION_TOKEN_COUNT*auction_count, {"from": account})
+    print(f"Factory deployment and approval (one-off): {factory.tx.gas_used + account.history[-1].gas_used} gas")
+
+    results = {
+        "Deploy, fund and launch"  : _measure(auction_count, _current_flow, account, token),
+        "createAndLaunchAuction"   : _measure(auction_count, _single_transaction_flow, account, token, factory)
+    }
+
+    for name, (gas, tx_count, wall_ms) in results.items():
+        print(f"{name:<25} {tx_count} tx/auction   {gas:>8} gas/auction   {wall_ms:>8.2f} ms/auction")
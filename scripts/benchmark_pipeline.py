@@ -0,0 +1,52 @@
+import time
+
+from brownie import accounts, chain, TestToken
+from web3 import Web3
+
+from scripts.deploy import deploy_and_fund_auction, deploy_fund_and_launch_pipelined
+
+AUCTION_COUNT       = 100
+AUCTION_START_DELAY = 3600*24
+AUCTION_DURATION    = 3600*24
+AUCTION_START_PRICE = Web3.toWei(10, "gwei")
+AUCTION_RES_PRICE   = Web3.toWei(1, "gwei")
+AUCTION_TOKEN_COUNT = 1000
+
+
+def _launch_parameters(auction_count):
+    start_timestamp = chain.time() + AUCTION_START_DELAY
+    return [(start_timestamp, start_timestamp + AUCTION_DURATION, AUCTION_START_PRICE, AUCTION_RES_PRICE)]*auction_count
+
+
+def _sequential_setup(account, token, launch_parameters):
+    # Every transaction waits for its receipt before the next one is sent
+    for parameters in launch_parameters:
+        auction = deploy_and_fund_auction(account, token, AUCTION_TOKEN_COUNT)
+        auction.launchAuction(*parameters, {"from": account})
+
+
+def _pipelined_setup(account, token, launch_parameters):
+    deploy_fund_and_launch_pipelined(account, token, AUCTION_TOKEN_COUNT, launch_parameters)
+
+
+def main(auction_count=AUCTION_COUNT):
+    """
+        Compares the wall-clock time to set up (deploy, fund and launch) auction_count auctions sending one transaction at a
+        time against the nonce-pipelined submitter (scripts/pipeline.py).
+
+        Run with: brownie run benchmark_pipeline [main auction_count]
+    """
+
+    auction_count = int(auction_count)
+
+    account = accounts[0]
+    token   = TestToken.deploy("TestToken", "TT", {"from": account})
+
+    for name, setup in [("Sequential", _sequential_setup), ("Pipelined", _pipelined_setup)]:
+        launch_parameters = _launch_parameters(auction_count)
+
+        start = time.perf_counter()
+        setup(account, token, launch_parameters)
+        elapsed = time.perf_counter() - start
+
+        print(f"{name:<12} {auction_count} auctions in {elapsed:>8.2f} s   ({auction_count/elapsed:.1f} auctions/s)")
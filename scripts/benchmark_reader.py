@@ -0,0 +1,60 @@
+import time
+
+from brownie import accounts, chain, DutchAuction, TestToken
+
+from scripts.auction_reader import deploy_auction_reader, read_auctions
+from scripts.auction_state import get_auction_states
+from scripts.deploy import deploy_auction_factory
+
+AUCTION_COUNT    = 1000
+LAUNCHED_COUNT   = 100              # Auctions which are funded and launched (the rest revert on getCurrentPrice)
+CREATE_BATCH     = 50               # Auctions created per factory transaction
+CHUNK_SIZES      = [50, 100, 250]
+
+
+def _create_auctions(account, token):
+    factory  = deploy_auction_factory(account)
+    auctions = []
+    for i in range(0, AUCTION_COUNT, CREATE_BATCH):
+        tx = factory.createAuctions(token, min(CREATE_BATCH, AUCTION_COUNT - i), {"from": account})
+        auctions += [event["auction"] for event in tx.events["AuctionCreated"]]
+
+    return auctions
+
+
+def _report(label, calls, elapsed):
+    print(f"{label:<32} {calls:>6} calls  {elapsed:>8.3f} s  {AUCTION_COUNT/elapsed:>10.1f} auctions/s")
+
+
+def main():
+    """
+        Compares reading the state of many auctions one call at a time against batched AuctionReader calls.
+
+        Run with: brownie run benchmark_reader
+    """
+
+    account = accounts[0]
+    token   = TestToken.deploy("TestToken", "TT", {"from": account})
+
+    auctions = _create_auctions(account, token)
+
+    start_timestamp = chain.time() + 3600
+    token.getTokens(LAUNCHED_COUNT, {"from": account})
+    for auction in auctions[:LAUNCHED_COUNT]:
+        token.transfer(auction, 1, {"from": account})
+        DutchAuction.at(auction).launchAuction(start_timestamp, start_timestamp + 3600, 10**10, 10**9, {"from": account})
+
+    chain.sleep(3600 + 60)
+    chain.mine()
+
+    start = time.perf_counter()
+    loop_states = get_auction_states(auctions)
+    _report("Per-auction getAuctionState", AUCTION_COUNT, time.perf_counter() - start)
+
+    reader = deploy_auction_reader(account)
+    for chunk_size in CHUNK_SIZES:
+        start = time.perf_counter()
+        states = read_auctions(reader, auctions, chunk_size)
+        _report(f"AuctionReader (chunks of {chunk_size})", -(-AUCTION_COUNT // chunk_size), time.perf_counter() - start)
+
+        assert [(state.address, state.ready) for state in states] == [(state.address, state.ready) for state in loop_states]
@@ -0,0 +1,62 @@
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Measures the wall-clock time of the whole test suite when run serially and across several xdist workers (each worker runs
+# its own local chain, on its own port).
+#
+#   python -m scripts.benchmark_workers [worker_count ...]
+
+WORKER_COUNTS = [1, 2, 4, 8]
+REPORT_PATH   = "reports/test_scaling.json"
+TABLE_PATH    = "reports/test_scaling.md"           # Markdown table, as documented in the README
+
+
+def run_suite(worker_count=None, options=()):
+    command = ["brownie", "test", *options] + (["-n", str(worker_count)] if worker_count else [])
+
+    start  = time.perf_counter()
+    result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    return time.perf_counter() - start, result.returncode == 0
+
+
+def markdown_table(results):
+    lines = ["| Workers | Time (s) | Speedup | Passed |", "|---------|----------|---------|--------|"]
+    for result in results:
+        workers = result["workers"] or "serial"
+        lines.append(f"| {workers} | {result['seconds']} | {result['speedup']} | {'yes' if result['passed'] else 'no'} |")
+
+    return "\n".join(lines) + "\n"
+
+
+def main(worker_counts=WORKER_COUNTS):
+    serial_time, passed = run_suite()
+    results = [{"workers": 0, "seconds": round(serial_time, 1), "speedup": 1.0, "passed": passed}]
+
+    for worker_count in worker_counts:
+        elapsed, passed = run_suite(worker_count)
+        results.append({
+            "workers" : worker_count,
+            "seconds" : round(elapsed, 1),
+            "speedup" : round(serial_time/elapsed, 2),
+            "passed"  : passed
+        })
+
+    print(f"{'Workers':>8} {'Time (s)':>10} {'Speedup':>8} {'Passed':>7}")
+    for result in results:
+        workers = result["workers"] or "serial"
+        print(f"{workers:>8} {result['seconds']:>10} {result['speedup']:>8} {str(result['passed']):>7}")
+
+    Path(REPORT_PATH).parent.mkdir(parents=True, exist_ok=True)
+    with open(REPORT_PATH, "w") as report_file:
+        json.dump(results, report_file, indent=2)
+
+    with open(TABLE_PATH, "w") as table_file:
+        table_file.write(markdown_table(results))
+
+
+if __name__ == "__main__":
+    main([int(worker_count) for worker_count in sys.argv[1:]] or WORKER_COUNTS)
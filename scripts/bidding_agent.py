@@ -0,0 +1,129 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from brownie import DutchAuction, chain, web3
+
+from scripts.auction_state import get_auction_state
+from scripts.price_engine import time_at_price
+
+# Asyncio bidding agent: bids on auctions as soon as their price reaches a target price.
+#
+# The launch parameters of every auction are read once, and the timestamp at which the price reaches the target is computed
+# off-chain (see price_engine.time_at_price), so the auction is never polled. The buy() transaction is prepared (and signed,
+# if the private key of the account is available) in advance, and submitted as soon as the target timestamp is reached.
+
+BUY_GAS_LIMIT = 200000
+
+
+class BiddingAgent:
+    """
+        Bids from the given account (a brownie account). Pre-signing the transactions requires a local account (with a
+        private key), e.g. from accounts.add(); otherwise the prepared transactions are sent through the node (which only
+        works with unlocked accounts, such as the development accounts).
+
+        Note that, as the transactions are prepared in advance, the nonces of the bids placed by an agent are assigned in the
+        order of their target timestamps: if a bid cannot be submitted, the later ones will not be mined.
+    """
+
+    def __init__(self, account, clock=chain.time):
+        self.account = account
+        self.clock   = clock
+        self._nonce  = None
+
+        # Bids are sent from a single thread, so that they reach the node in nonce order
+        self._sender = ThreadPoolExecutor(max_workers=1)
+
+    def _prepare(self, auction, value):
+        if self._nonce is None:
+            self._nonce = web3.eth.get_transaction_count(self.account.address, "pending")
+
+        tx = {
+            "from"     : self.account.address,
+            "to"       : auction.address,
+            "value"    : value,
+            "data"     : auction.buy.encode_input(),
+            "gas"      : BUY_GAS_LIMIT,
+            "gasPrice" : web3.eth.gas_price,
+            "nonce"    : self._nonce
+        }
+        self._nonce += 1
+
+        if hasattr(self.account, "private_key"):
+            return web3.eth.account.sign_transaction({**tx, "chainId": web3.eth.chain_id}, self.account.private_key).rawTransaction
+
+        return tx
+
+    def _send(self, prepared):
+        if isinstance(prepared, dict):
+            return web3.eth.send_transaction(prepared)
+
+        return web3.eth.send_raw_transaction(prepared)
+
+    def _wait(self, tx_hash):
+        web3.eth.wait_for_transaction_receipt(tx_hash)
+        return chain.get_transaction(tx_hash)
+
+    def target_timestamp(self, auction, target_price):
+        """
+            Reads the auction once, and returns the timestamp at which its price reaches target_price.
+
+            Raises ValueError if the price never reaches target_price whilst the auction is accepting bids.
+        """
+
+        state = get_auction_state(auction)
+        if not state.ready or state.has_buyer:
+            raise ValueError(f"Auction {state.address} is not accepting bids")
+
+        timestamp = time_at_price(
+            state.start_timestamp, state.end_timestamp, state.start_price, state.reservation_price, target_price
+        )
+        if timestamp is None:
+            raise ValueError(f"The price of auction {state.address} never reaches {target_price}")
+
+        return timestamp
+
+    async def bid(self, timestamp, prepared):
+        """
+            Waits until the target timestamp (by the agent's clock) and submits the prepared bid, returning its receipt.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        while (remaining := timestamp - self.clock()) > 0:
+            await asyncio.sleep(remaining)
+
+        tx_hash = await loop.run_in_executor(self._sender, self._send, prepared)
+        return await loop.run_in_executor(None, self._wait, tx_hash)
+
+    async def run(self, bids):
+        """
+            Watches many auctions concurrently. bids is a list of (auction, target_price) pairs, where the auctions are
+            DutchAuction contracts or addresses, and every bid is placed with a value of its target price.
+
+            Returns a list with the receipt of every bid (or the raised exception), in the order of the given bids. The bids
+            whose target price is never reached (see target_timestamp) get their ValueError, and are neither prepared nor
+            given a nonce, so that they do not hold back the other bids.
+        """
+
+        auctions = [DutchAuction.at(auction) if isinstance(auction, str) else auction for auction, _ in bids]
+        results  = [None]*len(bids)
+
+        timestamps = {}
+        for i, (auction, (_, target_price)) in enumerate(zip(auctions, bids)):
+            try:
+                timestamps[i] = self.target_timestamp(auction, target_price)
+            except ValueError as exc:
+                results[i] = exc
+
+        # The transactions are prepared, and scheduled, in the order in which they will be submitted (see the nonces note above)
+        order    = sorted(timestamps, key=lambda i: timestamps[i])
+        prepared = [self._prepare(auctions[i], bids[i][1]) for i in order]
+
+        receipts = await asyncio.gather(
+            *(self.bid(timestamps[i], tx) for i, tx in zip(order, prepared)), return_exceptions=True
+        )
+
+        for i, receipt in zip(order, receipts):
+            results[i] = receipt
+
+        return results
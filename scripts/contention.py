@@ -0,0 +1,154 @@
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from brownie import DutchAuction, TestToken, accounts, chain, web3
+from web3 import Web3
+
+from scripts.deploy import deploy_and_fund_auction
+from scripts.price_engine import time_at_price
+
+# Load harness for concurrent buyers racing on buy() around the price crossing.
+#
+# N buyer accounts bid the same value (the crossing price) on a single auction. With automining stopped, every block
+# around the crossing time collects bids_per_block bids from random buyers, and is then mined with a fixed timestamp. Bids
+# mined before the crossing revert (insufficient funds), as do all the bids mined after the winning one (the auction has
+# finished). The report includes the throughput, the winner latency, the revert count, and the gas wasted by the losers.
+#
+#   brownie run contention [main buyer_count bids_per_block window_blocks block_time]
+
+BUYER_COUNT     = 20
+BIDS_PER_BLOCK  = 5                     # Bids submitted before mining each block
+WINDOW_BLOCKS   = 3                     # Blocks mined before (and after) the crossing block
+BLOCK_TIME      = 12                    # Seconds between blocks
+BUY_GAS_LIMIT   = 200000
+REPORT_PATH     = "reports/contention.json"
+
+AUCTION_START_DELAY = 3600
+AUCTION_DURATION    = 3600*24
+AUCTION_START_PRICE = Web3.toWei(10, "gwei")
+AUCTION_RES_PRICE   = Web3.toWei(1, "gwei")
+AUCTION_TOKEN_COUNT = 1000
+
+
+def _get_buyers(count):
+    buyers = list(accounts[1:count + 1])
+    while len(buyers) < count:
+        buyer = accounts.add()
+        accounts[0].transfer(buyer, "1 ether")
+        buyers.append(buyer)
+
+    return buyers
+
+
+def _send_bid(buyer, auction, value, nonce):
+    tx = {
+        "from"     : buyer.address,
+        "to"       : auction.address,
+        "value"    : value,
+        "data"     : auction.buy.encode_input(),
+        "gas"      : BUY_GAS_LIMIT,
+        "gasPrice" : web3.eth.gas_price,
+        "nonce"    : nonce
+    }
+
+    submitted = time.perf_counter()
+    if hasattr(buyer, "private_key"):
+        signed  = web3.eth.account.sign_transaction({**tx, "chainId": web3.eth.chain_id}, buyer.private_key)
+        tx_hash = web3.eth.send_raw_transaction(signed.rawTransaction)
+    else:
+        tx_hash = web3.eth.send_transaction(tx)
+
+    return tx_hash, submitted
+
+
+def run_contention(buyer_count=BUYER_COUNT, bids_per_block=BIDS_PER_BLOCK, window_blocks=WINDOW_BLOCKS, block_time=BLOCK_TIME):
+    """
+        Runs a single contended auction, returning the report as a dictionary.
+    """
+
+    seller = accounts[0]
+    buyers = _get_buyers(buyer_count)
+    token  = TestToken.deploy("TestToken", "TT", {"from": seller})
+
+    auction = deploy_and_fund_auction(seller, token, AUCTION_TOKEN_COUNT)
+    start_timestamp = chain.time() + AUCTION_START_DELAY
+    end_timestamp   = start_timestamp + AUCTION_DURATION
+    auction.launchAuction(start_timestamp, end_timestamp, AUCTION_START_PRICE, AUCTION_RES_PRICE, {"from": seller})
+
+    # Every buyer bids the price at the middle of the auction
+    crossing_price     = (AUCTION_START_PRICE + AUCTION_RES_PRICE) // 2
+    crossing_timestamp = time_at_price(start_timestamp, end_timestamp, AUCTION_START_PRICE, AUCTION_RES_PRICE, crossing_price)
+
+    nonces = {buyer.address: web3.eth.get_transaction_count(buyer.address) for buyer in buyers}
+    bids   = [] # (tx_hash, submitted time, mined time, block timestamp)
+
+    web3.provider.make_request("miner_stop", [])
+    start = time.perf_counter()
+
+    try:
+        with ThreadPoolExecutor(max_workers=bids_per_block) as executor:
+            for block in range(-window_blocks, window_blocks + 1):
+                block_timestamp = crossing_timestamp + block*block_time
+
+                block_buyers = random.sample(buyers, min(bids_per_block, len(buyers)))
+                futures = []
+                for buyer in block_buyers:
+                    futures.append(executor.submit(_send_bid, buyer, auction, crossing_price, nonces[buyer.address]))
+                    nonces[buyer.address] += 1
+
+                submitted_bids = [future.result() for future in futures]
+
+                chain.mine(timestamp=block_timestamp)
+                mined = time.perf_counter()
+
+                bids += [(tx_hash, submitted, mined, block_timestamp) for tx_hash, submitted in submitted_bids]
+    finally:
+        web3.provider.make_request("miner_start", [])
+
+    elapsed = time.perf_counter() - start
+
+    # Collect the outcome of every bid
+    winner, reverted, gas_wasted, wei_wasted = None, 0, 0, 0
+    for tx_hash, submitted, mined, block_timestamp in bids:
+        receipt = web3.eth.wait_for_transaction_receipt(tx_hash)
+
+        if receipt.status:
+            winner = {
+                "tx_hash"          : tx_hash.hex(),
+                "block_timestamp"  : block_timestamp,
+                "chain_latency"    : block_timestamp - crossing_timestamp,     # Seconds from the crossing to the winning block
+                "wall_latency_ms"  : round((mined - submitted)*1000, 3),     # From the submission to the mined block
+                "gas_used"         : receipt.gasUsed
+            }
+        else:
+            reverted   += 1
+            gas_wasted += receipt.gasUsed
+            wei_wasted += receipt.gasUsed*web3.eth.get_transaction(tx_hash).gasPrice
+
+    return {
+        "revision"        : Web3.keccak(hexstr=DutchAuction.bytecode).hex()[:18],
+        "buyers"          : buyer_count,
+        "bids_per_block"  : bids_per_block,
+        "window_blocks"   : window_blocks,
+        "block_time"      : block_time,
+        "bids"            : len(bids),
+        "bids_per_sec"    : round(len(bids)/elapsed, 2),
+        "reverted"        : reverted,
+        "gas_wasted"      : gas_wasted,
+        "wei_wasted"      : wei_wasted,
+        "winner"          : winner,
+        "sold"            : auction.buyer() != "0x0000000000000000000000000000000000000000"
+    }
+
+
+def main(buyer_count=BUYER_COUNT, bids_per_block=BIDS_PER_BLOCK, window_blocks=WINDOW_BLOCKS, block_time=BLOCK_TIME):
+    report = run_contention(int(buyer_count), int(bids_per_block), int(window_blocks), int(block_time))
+
+    Path(REPORT_PATH).parent.mkdir(parents=True, exist_ok=True)
+    with open(REPORT_PATH, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+
+    print(json.dumps(report, indent=2))
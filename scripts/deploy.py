@@ -1,8 +1,13 @@
-from brownie import DutchAuction, network, config
+from brownie import AuctionHouse, DutchAuction, DutchAuctionFactory, TestToken, network, config
 
+from scripts.pipeline import TransactionPipeline
+from scripts.tracing import traced
+
+@traced
 def deploy_auction(account, token):
     return DutchAuction.deploy(token, {"from": account})
 
+@traced
 def deploy_and_fund_auction(account, token, tokenCount):
     auction = deploy_auction(account, token)
 
@@ -12,5 +17,74 @@ def deploy_and_fund_auction(account, token, tokenCount):
     return auction
 
 
+@traced
+def deploy_auction_factory(account):
+    return DutchAuctionFactory.deploy({"from": account})
+
+@traced
+def deploy_auctions_batch(account, token, n, factory=None):
+    # Create n auction clones in a single transaction (the factory is deployed if not provided)
+    if factory is None:
+        factory = deploy_auction_factory(account)
+
+    tx = factory.createAuctions(token, n, {"from": account})
+
+    return [DutchAuction.at(event["auction"]) for event in tx.events["AuctionCreated"]]
+
+@traced
+def deploy_fund_and_launch(account, token, tokenCount, startTimestamp, endTimestamp, startPrice, reservationPrice, factory=None):
+    # Create, fund and launch an auction clone in a single transaction (the factory is deployed if not provided). The tokens
+    # are pulled from the account, so the factory is approved first (for tokenCount only) if its allowance is not enough
+    if factory is None:
+        factory = deploy_auction_factory(account)
+
+    if token.allowance(account, factory) < tokenCount:
+        token.approve(factory, tokenCount, {"from": account})
+
+    tx = factory.createAndLaunchAuction(
+        token, tokenCount, startTimestamp, endTimestamp, startPrice, reservationPrice, {"from": account}
+    )
+
+    return DutchAuction.at(tx.events["AuctionCreated"]["auction"])
+
+
+@traced
+def deploy_fund_and_launch_pipelined(account, token, tokenCount, launchParameters):
+    # Deploy, fund and launch an auction for every (startTimestamp, endTimestamp, startPrice, reservationPrice) tuple of
+    # launchParameters, broadcasting all the transactions at once (see scripts/pipeline.py). The tokens are minted in a single
+    # transaction, so the token must be a TestToken
+    pipeline = TransactionPipeline(account)
+    pipeline.transact(TestToken, token, "getTokens", tokenCount*len(launchParameters))
+
+    addresses = []
+    for parameters in launchParameters:
+        address = pipeline.deploy(DutchAuction, token)
+        pipeline.transact(TestToken, token, "transfer", address, tokenCount)
+        pipeline.transact(DutchAuction, address, "launchAuction", *parameters)
+        addresses.append(address)
+
+    pipeline.run()
+
+    return [DutchAuction.at(address) for address in addresses]
+
+
+@traced
+def deploy_auction_house(account):
+    return AuctionHouse.deploy({"from": account})
+
+@traced
+def create_funded_lot(account, house, token, tokenCount):
+    # Create a lot in the auction house, funded with tokenCount newly minted tokens (the equivalent of deploy_and_fund_auction),
+    # returning the lot id. The auction house is approved first if its allowance is not enough (a one-off approval)
+    token.getTokens(tokenCount, {"from": account})
+
+    if token.allowance(account, house) < tokenCount:
+        token.approve(house, 2**256 - 1, {"from": account})
+
+    tx = house.createLot(token, tokenCount, {"from": account})
+
+    return tx.events["LotCreated"]["lotId"]
+
+
 def main():
-    pass
\ No newline at end of file
+    pass
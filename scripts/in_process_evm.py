@@ -0,0 +1,234 @@
+import time
+
+from brownie import chain, web3
+from brownie._config import CONFIG
+from brownie.network import is_connected
+from brownie.network.rpc import Rpc, ganache
+from eth_abi import decode_abi
+
+try:
+    from eth.vm.forks import BerlinVM
+    from eth_tester import EthereumTester, PyEVMBackend
+    from eth_tester.backends.pyevm.main import get_default_genesis_params
+    from eth_tester.exceptions import TransactionFailed
+    from web3.providers.eth_tester import EthereumTesterProvider
+except ImportError as exc:
+    raise ImportError(
+        "The in-process EVM backend requires eth-tester with py-evm: pip install \"web3[tester]==5.25.0\""
+    ) from exc
+
+# In-process EVM backend for the tests and scripts: the contracts are run by py-evm (through eth-tester) inside the Python
+# process, rather than by a Ganache subprocess, so that no call pays the JSON-RPC serialization and IPC round-trips.
+#
+# InProcessProvider speaks the Ganache dialect brownie relies on for development networks: evm_increaseTime (chain.sleep),
+# evm_mine (chain.mine), evm_snapshot/evm_revert (chain.snapshot/revert and test isolation), reverted transactions that are
+# still mined and reported with their revert reason (brownie.reverts), and debug_traceTransaction, reduced to the return
+# value of successful transactions (tx.return_value). Full traces are not available, so coverage and gas profiling
+# (brownie test --coverage/--gas) still require Ganache.
+#
+#   brownie test --evm in-process
+#
+# Pre-London (Berlin) rules are used, as in Ganache v6, so that transactions with brownie's default gas price of zero are valid.
+
+ZERO_HASH      = "0x" + "00"*32
+ERROR_SELECTOR = bytes.fromhex("08c379a0") # Error(string)
+FEE_FIELDS     = ("gas_price", "max_fee_per_gas", "max_priority_fee_per_gas")
+
+
+def _revert_reason(data):
+    # Revert reason in brownie's format (see TransactionReceipt._reverted_trace)
+    if isinstance(data, str):
+        return data.replace("execution reverted: ", "", 1) or None
+    if data[:4] == ERROR_SELECTOR:
+        return decode_abi(["string"], data[4:])[0]
+    return f"typed error: 0x{data.hex()}" if data else None
+
+
+def _vm_error(txid, data):
+    # Ganache v6 error, as parsed by brownie.exceptions.VirtualMachineError
+    reason = _revert_reason(data)
+    return {
+        "error": {
+            "code"    : -32000,
+            "message" : "VM Exception while processing transaction: revert" + (f" {reason}" if reason else ""),
+            "data"    : {
+                txid: {
+                    "error"           : "revert",
+                    "program_counter" : None,
+                    "return"          : "0x" + data.hex() if isinstance(data, bytes) else "0x",
+                    "reason"          : reason
+                }
+            }
+        }
+    }
+
+
+def _recording_chain_class(chain_class):
+    # py-evm chain recording the computation of the last applied transaction, so that the data returned by a sent
+    # transaction is known without executing it again (eth-tester only returns its hash). Reverting to a snapshot builds a
+    # new chain of the same class, so the recording survives test isolation
+    class RecordingChain(chain_class):
+        last_computation = None
+
+        def apply_transaction(self, transaction):
+            block, receipt, computation = super().apply_transaction(transaction)
+            self.last_computation = computation
+            return block, receipt, computation
+
+    return RecordingChain
+
+
+def _failure_data(exc):
+    # Revert data (or message) of a failed eth-tester call
+    data = exc.args[0] if exc.args else b""
+    if isinstance(data, Exception):
+        data = data.args[0] if data.args else b""
+    return data
+
+
+class InProcessProvider(EthereumTesterProvider):
+
+    def __init__(self, gas_limit=12000000):
+        backend = PyEVMBackend(
+            genesis_parameters=get_default_genesis_params({"gas_limit": gas_limit}), vm_configuration=((0, BerlinVM),)
+        )
+        backend.chain.__class__ = _recording_chain_class(type(backend.chain))
+        super().__init__(EthereumTester(backend))
+
+        self._time_offset     = 0
+        self._snapshot_offset = {}
+        self._return_data     = {}          # Transaction hash -> returned data (None if reverted)
+
+    # Time
+    def _now(self):
+        return int(time.time()) + self._time_offset
+
+    def _advance_pending_block(self, timestamp=None):
+        # Moves the timestamp of the pending block forward (to the current time, as in Ganache), without mining it
+        timestamp = self._now() if timestamp is None else timestamp
+        pyevm     = self.ethereum_tester.backend.chain
+        if timestamp > pyevm.header.timestamp:
+            # The difficulty depends on the timestamp, and is validated when a snapshot block is imported again on revert
+            parent       = pyevm.chaindb.get_block_header_by_hash(pyevm.header.parent_hash)
+            difficulty   = BerlinVM.compute_difficulty(parent, timestamp)
+            pyevm.header = pyevm.header.copy(timestamp=timestamp, difficulty=difficulty)
+
+    def _increase_time(self, seconds):
+        self._time_offset += int(seconds)
+        self._advance_pending_block()
+        return self._time_offset
+
+    def _mine(self, timestamp=None):
+        if timestamp is not None:
+            self._time_offset = int(timestamp) - int(time.time())
+        self._advance_pending_block(timestamp)
+        self.ethereum_tester.mine_blocks()
+        return "0x0"
+
+    def _snapshot(self):
+        snapshot_id = self.ethereum_tester.take_snapshot()
+        self._snapshot_offset[snapshot_id] = self._time_offset
+        return snapshot_id
+
+    def _revert(self, snapshot_id):
+        self.ethereum_tester.revert_to_snapshot(snapshot_id)
+        self._time_offset = self._snapshot_offset[snapshot_id]
+        self._advance_pending_block()
+        return True
+
+    # Execution
+    def _send_transaction(self, params):
+        # The transaction is executed once: its returned (or revert) data is taken from the computation recorded when it
+        # was applied to the pending block
+        transaction = params[0]
+        self._advance_pending_block()
+
+        txid        = self.ethereum_tester.send_transaction(transaction)
+        computation = self.ethereum_tester.backend.chain.last_computation
+
+        if computation.is_error:
+            self._return_data[txid] = None
+            return _vm_error(txid, computation.output)
+
+        self._return_data[txid] = computation.output if transaction.get("to") else b""
+        return {"result": txid}
+
+    def _get_transaction(self, params):
+        # eth-tester names the calldata "data", where Ganache (and brownie's TransactionReceipt) expects "input"
+        response    = super().make_request("eth_getTransactionByHash", params)
+        transaction = response.get("result")
+        if transaction and "input" not in transaction:
+            transaction["input"] = transaction.get("data", "0x")
+        return response
+
+    def _trace_transaction(self, params):
+        # Single RETURN step holding the returned data in memory (see TransactionReceipt._confirmed_trace); reverted
+        # transactions get an empty trace, as their revert reason is already known
+        if not params or params[0] not in self._return_data:
+            return {"error": {"code": -32602, "message": "Unknown transaction"}}
+
+        data = self._return_data[params[0]]
+        if data is None:
+            return {"result": {"structLogs": []}}
+
+        data = data if isinstance(data, bytes) else bytes.fromhex(data[2:])
+        step = {
+            "op"      : "RETURN",
+            "pc"      : 0,
+            "depth"   : 1,
+            "gas"     : 0,
+            "gasCost" : 0,
+            "stack"   : [f"{len(data):064x}", "00"*32],
+            "memory"  : [data.hex()]
+        }
+        return {"result": {"structLogs": [step]}}
+
+    def make_request(self, method, params):
+        if method == "evm_increaseTime":
+            return {"result": self._increase_time(params[0])}
+        if method == "evm_mine":
+            return {"result": self._mine(*params)}
+        if method == "evm_snapshot":
+            return {"result": self._snapshot()}
+        if method == "evm_revert":
+            return {"result": self._revert(params[0])}
+        if method == "eth_sendTransaction":
+            return self._send_transaction(params)
+        if method == "debug_traceTransaction":
+            return self._trace_transaction(params)
+        if method == "eth_getTransactionByHash":
+            return self._get_transaction(params)
+
+        if method in ("eth_call", "eth_estimateGas"):
+            self._advance_pending_block()
+            if not any(field in params[0] for field in FEE_FIELDS):
+                # Legacy (zero) gas price, as eth-tester would otherwise build an EIP-1559 transaction, invalid before London
+                params = [{**params[0], "gas_price": 0}, *params[1:]]
+            try:
+                return super().make_request(method, params)
+            except TransactionFailed as exc:
+                return _vm_error(ZERO_HASH, _failure_data(exc))
+
+        return super().make_request(method, params)
+
+
+def connect(network_id=None):
+    """
+        Connects brownie to a new in-process EVM, with the settings of a development network (the default network if None),
+        instead of launching Ganache. Disconnect with brownie.network.disconnect().
+    """
+
+    if is_connected():
+        raise ConnectionError(f"Already connected to network '{CONFIG.active_network['id']}'")
+
+    active = CONFIG.set_active_network(network_id)
+    if "cmd" not in active:
+        CONFIG.clear_active()
+        raise ValueError(f"'{active['id']}' is not a development network")
+
+    web3.provider = InProcessProvider(active["cmd_settings"].get("gas_limit", 12000000))
+    web3.reset_middlewares()
+
+    # Time travel and snapshots are requested with Ganache's evm_* methods
+    Rpc().backend = ganache
+    chain._network_connected()
@@ -0,0 +1,242 @@
+import sqlite3
+import time
+
+from brownie import DutchAuction, DutchAuctionFactory, web3
+from eth_utils import event_abi_to_log_topic
+
+# Incremental indexer of the DutchAuction lifecycle events.
+#
+# Logs are fetched in block range chunks and applied to a local SQLite database, together with the last indexed block
+# (the checkpoint), in a single database transaction per chunk. Hence an interrupted run resumes from the last fully
+# indexed chunk. Note that uint256 values (and the uint64 timestamps) are stored as decimal strings, as they may not fit in
+# an SQLite integer.
+#
+# As any contract may emit the auction events, only the events of known auctions are indexed: the auctions registered from
+# the AuctionCreated events of a DutchAuctionFactory, and any auction addresses given explicitly.
+#
+#   brownie run indexer main <factory address> [db_path]
+
+DEFAULT_DB_PATH    = "auctions.db"
+DEFAULT_CHUNK_SIZE = 1000               # Blocks per eth_getLogs request
+
+INDEXED_EVENTS = ["AuctionLaunched", "AuctionSold", "TokensRetrieved", "FundsRetrieved"]
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS checkpoint (
+        id              INTEGER PRIMARY KEY CHECK (id = 0),
+        block           INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS auctions (
+        address             TEXT PRIMARY KEY,
+        launch_block        INTEGER,
+        start_timestamp     TEXT,
+        end_timestamp       TEXT,
+        start_price         TEXT,
+        reservation_price   TEXT,
+        token_count         TEXT,
+        buyer               TEXT,
+        sale_price          TEXT,
+        sale_block          INTEGER,
+        tokens_retrieved    TEXT NOT NULL DEFAULT '0',
+        funds_retrieved     TEXT NOT NULL DEFAULT '0'
+    );
+    CREATE TABLE IF NOT EXISTS events (
+        tx_hash         TEXT NOT NULL,
+        log_index       INTEGER NOT NULL,
+        block           INTEGER NOT NULL,
+        address         TEXT NOT NULL,
+        event           TEXT NOT NULL,
+        PRIMARY KEY (tx_hash, log_index)
+    );
+"""
+
+
+def _event_topic(abi, name):
+    return web3.toHex(event_abi_to_log_topic(next(item for item in abi if item["type"] == "event" and item["name"] == name)))
+
+
+def _auction_row(row):
+    auction = dict(row)
+    for column in ("start_timestamp", "end_timestamp"):
+        if auction[column] is not None:
+            auction[column] = int(auction[column])
+    return auction
+
+
+class AuctionIndexer:
+    """
+        Indexes the lifecycle events of the auctions created through the given DutchAuctionFactory, and of the given
+        auction addresses, into an SQLite database. At least one of them is required.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, chunk_size=DEFAULT_CHUNK_SIZE, addresses=None, start_block=0, factory=None):
+        if factory is None and not addresses:
+            raise ValueError("An auction factory or a list of auction addresses is required")
+
+        self.db         = sqlite3.connect(db_path)
+        self.chunk_size = chunk_size
+        self.addresses  = [str(address) for address in addresses] if addresses else None
+        self.factory    = str(factory) if factory is not None else None
+
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+        self.db.execute("INSERT OR IGNORE INTO checkpoint (id, block) VALUES (0, ?)", (start_block - 1,))
+        self.db.executemany("INSERT OR IGNORE INTO auctions (address) VALUES (?)", [(address,) for address in self.addresses or []])
+        self.db.commit()
+
+        contract     = web3.eth.contract(abi=DutchAuction.abi)
+        self._events = {_event_topic(DutchAuction.abi, name): getattr(contract.events, name)() for name in INDEXED_EVENTS}
+
+        self._created_topic = _event_topic(DutchAuctionFactory.abi, "AuctionCreated")
+        self._created_event = web3.eth.contract(abi=DutchAuctionFactory.abi).events.AuctionCreated()
+
+    @property
+    def checkpoint(self):
+        return self.db.execute("SELECT block FROM checkpoint WHERE id = 0").fetchone()["block"]
+
+    def run(self, to_block=None):
+        """
+            Indexes every block from the checkpoint up to to_block (the latest block by default).
+
+            Returns a dictionary with the number of indexed blocks and logs, the elapsed time and the throughput.
+        """
+
+        if to_block is None:
+            to_block = web3.eth.block_number
+
+        start      = time.perf_counter()
+        from_block = self.checkpoint + 1
+        log_count  = 0
+
+        for chunk_start in range(from_block, to_block + 1, self.chunk_size):
+            chunk_end = min(chunk_start + self.chunk_size - 1, to_block)
+            log_count += self._index_chunk(chunk_start, chunk_end)
+
+        elapsed     = time.perf_counter() - start
+        block_count = max(to_block - from_block + 1, 0)
+
+        return {
+            "blocks"         : block_count,
+            "logs"           : log_count,
+            "elapsed"        : elapsed,
+            "blocks_per_sec" : block_count/elapsed if elapsed else 0
+        }
+
+    def _index_chunk(self, from_block, to_block):
+        block_range = {"fromBlock": from_block, "toBlock": to_block}
+
+        created_logs = []
+        if self.factory:
+            created_logs = web3.eth.get_logs({**block_range, "address": self.factory, "topics": [self._created_topic]})
+
+        # The auctions of the factory are not known in advance, so their events are filtered once fetched
+        log_filter = {**block_range, "topics": [list(self._events.keys())]}
+        if not self.factory:
+            log_filter["address"] = self.addresses
+
+        logs = web3.eth.get_logs(log_filter)
+
+        # The logs and the checkpoint are committed atomically. The auctions of the chunk are registered before applying
+        # any event, as createAndLaunchAuction emits AuctionLaunched before AuctionCreated
+        with self.db:
+            for log in created_logs:
+                self._register(self._created_event.processLog(log))
+
+            logs = [log for log in logs if self._is_registered(log["address"])]
+            for log in logs:
+                self._apply(self._events[web3.toHex(log["topics"][0])].processLog(log))
+
+            self.db.execute("UPDATE checkpoint SET block = ? WHERE id = 0", (to_block,))
+
+        return len(created_logs) + len(logs)
+
+    def _is_registered(self, address):
+        return self.db.execute("SELECT 1 FROM auctions WHERE address = ?", (address,)).fetchone() is not None
+
+    def _record(self, event):
+        # Returns False if the event has already been indexed
+        cursor = self.db.execute(
+            "INSERT OR IGNORE INTO events (tx_hash, log_index, block, address, event) VALUES (?, ?, ?, ?, ?)",
+            (event["transactionHash"].hex(), event["logIndex"], event["blockNumber"], event["address"], event["event"])
+        )
+        return cursor.rowcount > 0
+
+    def _register(self, event):
+        if self._record(event):
+            self.db.execute("INSERT OR IGNORE INTO auctions (address) VALUES (?)", (event["args"]["auction"],))
+
+    def _apply(self, event):
+        args    = event["args"]
+        address = event["address"]
+
+        if not self._record(event): return # Already indexed
+
+        if event["event"] == "AuctionLaunched":
+            self.db.execute(
+                "UPDATE auctions SET launch_block = ?, start_timestamp = ?, end_timestamp = ?, start_price = ?, "
+                "reservation_price = ?, token_count = ? WHERE address = ?",
+                (
+                    event["blockNumber"], str(args["startTimestamp"]), str(args["endTimestamp"]), str(args["startPrice"]),
+                    str(args["reservationPrice"]), str(args["tokenCount"]), address
+                )
+            )
+
+        elif event["event"] == "AuctionSold":
+            self.db.execute(
+                "UPDATE auctions SET buyer = ?, sale_price = ?, sale_block = ? WHERE address = ?",
+                (args["buyer"], str(args["price"]), event["blockNumber"], address)
+            )
+
+        elif event["event"] == "TokensRetrieved":
+            self._add(address, "tokens_retrieved", args["tokenCount"])
+
+        elif event["event"] == "FundsRetrieved":
+            self._add(address, "funds_retrieved", args["amount"])
+
+    def _add(self, address, column, value):
+        current = int(self.db.execute(f"SELECT {column} FROM auctions WHERE address = ?", (address,)).fetchone()[column])
+        self.db.execute(f"UPDATE auctions SET {column} = ? WHERE address = ?", (str(current + value), address))
+
+    def get_auction(self, address):
+        row = self.db.execute("SELECT * FROM auctions WHERE address = ?", (str(address),)).fetchone()
+        return _auction_row(row) if row else None
+
+    def get_auctions(self, outcome=None, timestamp=None):
+        """
+            Returns the indexed auctions, optionally filtered by outcome: 'sold', 'deserted' (finished at the given
+            timestamp without a buyer) or 'ongoing' (launched, not finished at the given timestamp, and without a buyer).
+        """
+
+        if outcome in ("deserted", "ongoing") and timestamp is None:
+            raise ValueError(f"A timestamp is required for the '{outcome}' outcome")
+
+        # The end timestamps are decimal strings, compared by length first so that the order is numeric
+        query, params = "SELECT * FROM auctions", (len(str(timestamp)), str(timestamp))
+
+        if outcome == "sold":
+            query, params = query + " WHERE buyer IS NOT NULL", ()
+        elif outcome == "deserted":
+            query += " WHERE buyer IS NULL AND (LENGTH(end_timestamp), end_timestamp) <= (?, ?)"
+        elif outcome == "ongoing":
+            query += " WHERE buyer IS NULL AND (LENGTH(end_timestamp), end_timestamp) > (?, ?)"
+        elif outcome is None:
+            params = ()
+        else:
+            raise ValueError(f"Unknown auction outcome '{outcome}'")
+
+        return [_auction_row(row) for row in self.db.execute(query, params)]
+
+    def close(self):
+        self.db.close()
+
+
+def main(factory_address, db_path=DEFAULT_DB_PATH):
+    indexer = AuctionIndexer(db_path, factory=factory_address)
+    stats   = indexer.run()
+
+    print(
+        f"Indexed {stats['blocks']} blocks ({stats['logs']} logs) up to block {indexer.checkpoint} in "
+        f"{stats['elapsed']:.3f} s: {stats['blocks_per_sec']:.1f} blocks/s"
+    )
+
+    indexer.close()
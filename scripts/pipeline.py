@@ -0,0 +1,199 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from brownie import web3
+from web3.exceptions import TimeExhausted
+
+# Nonce-pipelined transaction submitter.
+#
+# Rather than sending a transaction and waiting for its receipt before sending the next one (as brownie does by default), a
+# whole plan of transactions (deploys and contract calls) is built with locally assigned nonces, broadcast without waiting,
+# and the receipts are then collected concurrently. The addresses of the deployed contracts are predicted from the nonces of
+# their deployment transactions, so the later steps of the plan can already reference them.
+#
+#   pipeline = TransactionPipeline(account)
+#   auction  = pipeline.deploy(DutchAuction, token)
+#   pipeline.transact(TestToken, token, "transfer", auction, 1000)
+#   pipeline.run()
+
+DEPLOY_GAS_LIMIT = 3000000
+CALL_GAS_LIMIT   = 300000
+RECEIPT_TIMEOUT  = 120                  # Seconds to wait for each receipt before re-broadcasting the transaction
+MAX_RETRIES      = 3
+
+# Errors of nodes (geth and ganache) on re-broadcasting a transaction which is still pending, or has already been mined
+ALREADY_SENT_ERRORS = ("already known", "known transaction", "nonce too low", "replacement transaction underpriced",
+                       "doesn't have the correct nonce")
+
+
+class PipelineError(Exception):
+    pass
+
+
+class PipelineStep:
+    """
+        A single transaction of the plan. The nonce and the transaction hash are set once the step is broadcast, and
+        the receipt once it has been mined.
+    """
+
+    __slots__ = ("name", "tx", "deploy", "attempts", "tx_hash", "receipt")
+
+    def __init__(self, name, tx, deploy=False):
+        self.name     = name
+        self.tx       = tx
+        self.deploy   = deploy
+        self.attempts = 0
+        self.tx_hash  = None
+        self.receipt  = None
+
+    @property
+    def succeeded(self):
+        return self.receipt is not None and self.receipt.status == 1
+
+
+def _format_args(args):
+    # Brownie contracts and accounts are passed as their addresses
+    return [str(arg) if hasattr(arg, "address") else arg for arg in args]
+
+
+def _reverted_tx_hash(exc):
+    # Hash of the reverted transaction of a Ganache RPC error, keyed by it in the error data
+    error = exc.args[0] if exc.args else None
+    data  = error.get("data") if isinstance(error, dict) else None
+    if not isinstance(data, dict):
+        return None
+
+    return next((key for key in data if key.startswith("0x")), None)
+
+
+def _already_sent(exc):
+    error   = exc.args[0] if exc.args else None
+    message = error.get("message", "") if isinstance(error, dict) else str(error)
+    return any(known_error in message.lower() for known_error in ALREADY_SENT_ERRORS)
+
+
+class TransactionPipeline:
+    """
+        Builds and runs a plan of transactions sent from the given (brownie) account. As in the bidding agent, the
+        transactions are signed locally if the private key of the account is available, and sent through the node
+        otherwise (which only works with unlocked accounts, such as the development accounts).
+
+        Every step has a fixed gas limit (the gas cannot be estimated for calls to contracts that are not deployed yet).
+    """
+
+    def __init__(self, account, max_workers=16, receipt_timeout=RECEIPT_TIMEOUT, max_retries=MAX_RETRIES):
+        self.account         = account
+        self.max_workers     = max_workers
+        self.receipt_timeout = receipt_timeout
+        self.max_retries     = max_retries
+        self.steps           = []
+
+        self._nonce     = web3.eth.get_transaction_count(account.address, "pending")
+        self._gas_price = web3.eth.gas_price
+
+    def _next_nonce(self):
+        nonce = self._nonce
+        self._nonce += 1
+        return nonce
+
+    def deploy(self, container, *args, gas=DEPLOY_GAS_LIMIT):
+        """
+            Adds the deployment of a contract to the plan, returning the address it will be deployed at.
+        """
+
+        nonce = self._next_nonce()
+        tx    = {"data": container.deploy.encode_input(*_format_args(args)), "gas": gas, "nonce": nonce}
+
+        self.steps.append(PipelineStep(f"{container._name}.deploy", tx, deploy=True))
+
+        return str(self.account.get_deployment_address(nonce))
+
+    def transact(self, container, address, fn_name, *args, value=0, gas=CALL_GAS_LIMIT):
+        """
+            Adds a call to the fn_name function of the container contract at the given address (which may not be
+            deployed yet) to the plan.
+        """
+
+        data = web3.eth.contract(abi=container.abi).encodeABI(fn_name=fn_name, args=_format_args(args))
+        tx   = {"to": str(address), "data": data, "value": value, "gas": gas, "nonce": self._next_nonce()}
+
+        self.steps.append(PipelineStep(f"{container._name}.{fn_name}", tx))
+
+    def _send(self, step):
+        tx = {**step.tx, "from": self.account.address, "gasPrice": self._gas_price}
+
+        try:
+            if hasattr(self.account, "private_key"):
+                signed  = web3.eth.account.sign_transaction({**tx, "chainId": web3.eth.chain_id}, self.account.private_key)
+                tx_hash = web3.eth.send_raw_transaction(signed.rawTransaction)
+            else:
+                tx_hash = web3.eth.send_transaction(tx)
+        except ValueError as exc:
+            # Ganache (vmErrorsOnRPCResponse) reports reverted transactions as errors, although they are still mined: the
+            # step is then waited for as any other, and re-sent once its (reverted) receipt is collected. A re-broadcast
+            # transaction rejected as already sent is still pending (or mined), so its receipt is waited for again
+            tx_hash = _reverted_tx_hash(exc)
+            if tx_hash is None and step.tx_hash is not None and _already_sent(exc):
+                tx_hash = step.tx_hash
+            if tx_hash is None:
+                raise
+
+        step.tx_hash   = tx_hash
+        step.attempts += 1
+
+    def _wait(self, step):
+        try:
+            step.receipt = web3.eth.wait_for_transaction_receipt(step.tx_hash, timeout=self.receipt_timeout)
+        except TimeExhausted:
+            step.receipt = None
+
+        return step
+
+    def run(self):
+        """
+            Broadcasts every pending step (in nonce order, without waiting), and collects the receipts concurrently.
+
+            Failed steps are re-sent, up to max_retries times: the transactions that were not mined in time are
+            re-broadcast (with the same nonce), and the reverted ones are sent again with a new nonce, after every other
+            step (hence in the plan order). Reverted deployments cannot be re-sent, as the deployment address depends on
+            the nonce, so a PipelineError is raised.
+
+            Returns a dictionary with the number of steps and of re-sent transactions, the elapsed time and the throughput.
+        """
+
+        start   = time.perf_counter()
+        pending = [step for step in self.steps if not step.succeeded]
+        resent  = 0
+
+        while pending:
+            for step in pending:
+                self._send(step)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                steps = list(executor.map(self._wait, pending))
+
+            pending = []
+            for step in steps:
+                if step.succeeded: continue
+
+                if step.attempts > self.max_retries:
+                    raise PipelineError(f"Step '{step.name}' failed after {step.attempts} attempts")
+
+                if step.receipt is not None:
+                    if step.deploy:
+                        raise PipelineError(f"Step '{step.name}' reverted (deployments cannot be re-sent)")
+
+                    step.tx = {**step.tx, "nonce": self._next_nonce()}
+
+                pending.append(step)
+
+            resent += len(pending)
+
+        elapsed = time.perf_counter() - start
+
+        return {
+            "steps"        : len(self.steps),
+            "resent"       : resent,
+            "elapsed"      : elapsed,
+            "steps_per_sec": len(self.steps)/elapsed if elapsed else 0
+        }
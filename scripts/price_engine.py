@@ -0,0 +1,83 @@
+import numpy as np
+
+# Off-chain replica of DutchAuction.getCurrentPrice, exact to the contract's integer arithmetic.
+#
+# As in DutchAuction.getAuctionState, a price of zero means that getCurrentPrice would revert at that timestamp (the
+# auction has not been launched, has not started, has finished, has been sold, or the price has reached the reservation
+# price), as any valid price is strictly larger than the reservation price.
+
+INT64_MAX = np.iinfo(np.int64).max
+
+
+def current_price(start_timestamp, end_timestamp, start_price, reservation_price, timestamp, sold=False):
+    """
+        Returns the price of a single auction at the given timestamp (zero if getCurrentPrice would revert).
+    """
+
+    if sold or timestamp < start_timestamp or timestamp >= end_timestamp:
+        return 0
+
+    price = start_price - (start_price - reservation_price)*(timestamp - start_timestamp) // (end_timestamp - start_timestamp)
+
+    return price if price > reservation_price else 0
+
+
+def time_at_price(start_timestamp, end_timestamp, start_price, reservation_price, target_price):
+    """
+        Returns the earliest timestamp at which the price of the auction is at most target_price, or None if the price never
+        reaches target_price whilst the auction is accepting bids.
+    """
+
+    if target_price <= reservation_price:
+        return None
+
+    # price(t) <= target  <=>  floor(price_range*elapsed / duration) >= start_price - target
+    #                      <=>  elapsed >= ceil((start_price - target)*duration / price_range)
+    price_drop = max(start_price - target_price, 0)
+    elapsed    = -(-price_drop*(end_timestamp - start_timestamp) // (start_price - reservation_price))
+
+    timestamp = start_timestamp + elapsed
+    return timestamp if timestamp < end_timestamp else None
+
+
+def _exact_arrays(start_timestamps, end_timestamps, start_prices, reservation_prices, timestamps):
+    # int64 arithmetic is used whenever the largest intermediate product (price range * elapsed time) cannot overflow,
+    # falling back to (slower) arrays of Python integers otherwise
+    values = (start_timestamps, end_timestamps, start_prices, reservation_prices, timestamps)
+
+    try:
+        arrays = [np.asarray(value, dtype=np.int64) for value in values]
+    except OverflowError:
+        arrays = None
+
+    if arrays is not None:
+        max_price_range = int(np.max(arrays[2] - arrays[3], initial=0))
+        max_duration    = int(np.max(arrays[1] - arrays[0], initial=0))
+        if max_price_range*max_duration <= INT64_MAX:
+            return arrays
+
+    return [np.asarray(value, dtype=object) for value in values]
+
+
+def current_prices(start_timestamps, end_timestamps, start_prices, reservation_prices, timestamps, sold=False):
+    """
+        Vectorized current_price: every argument may be a scalar or an array, and they are broadcast together following
+        NumPy's rules. E.g. to evaluate n auctions at m timestamps, pass the auction parameters as (n, 1) arrays and the
+        timestamps as an (m,) array, getting an (n, m) array of prices.
+
+        Returns an int64 array, or an object array of Python integers if the prices may not fit in an int64.
+    """
+
+    start, end, start_price, reservation_price, timestamp = _exact_arrays(
+        start_timestamps, end_timestamps, start_prices, reservation_prices, timestamps
+    )
+
+    ongoing = (timestamp >= start) & (timestamp < end) & ~np.asarray(sold, dtype=bool)
+
+    # Neutralize the entries outside the bidding window so that they cannot divide by zero
+    elapsed  = np.where(ongoing, timestamp - start, 0)
+    duration = np.where(ongoing, end - start, 1)
+
+    price = start_price - (start_price - reservation_price)*elapsed // duration
+
+    return np.where(ongoing & (price > reservation_price), price, 0)
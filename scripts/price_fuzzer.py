@@ -0,0 +1,248 @@
+import random
+import time
+from collections import namedtuple
+
+import requests
+from brownie import accounts, web3
+
+from scripts.auction_state import ZERO_ADDRESS
+from scripts.deploy import deploy_auction
+from scripts.price_engine import current_price, time_at_price
+
+# Differential fuzzer of DutchAuction.getCurrentPrice against the off-chain price engine (scripts/price_engine.py).
+#
+# A single auction is deployed (and never launched): every case is evaluated with an eth_call to getCurrentPrice that
+# overrides the packed auction storage (state override) and the block timestamp (block override), and the calls are sent
+# in JSON-RPC batches. Any mismatch is shrunk to a minimal counterexample.
+#
+# Call-level overrides are not supported by ganache: the fuzzer requires a node that supports them, such as geth or anvil
+# (added as a brownie network, e.g. with `brownie networks add`).
+#
+#   brownie run price_fuzzer main [case_count] [batch_size] [seed] --network <network>
+
+DEFAULT_CASE_COUNT = 10000
+DEFAULT_BATCH_SIZE = 500                # eth_call requests per JSON-RPC batch
+
+UINT64_MAX  = 2**64 - 1
+UINT128_MAX = 2**128 - 1
+
+# Storage slots of the packed DutchAuction storage (slot 0 is the owner, see the Storage Layout section of the README)
+SELLER_END_SLOT   = 1                   # seller (address), endTimestamp (uint64)
+BUYER_START_SLOT  = 2                   # buyer (address), startTimestamp (uint64)
+PRICES_SLOT       = 4                   # startPrice (uint128), reservationPrice (uint128)
+
+# A launched auction (that launchAuction accepts), evaluated at a timestamp
+FuzzCase = namedtuple("FuzzCase", ["start_timestamp", "end_timestamp", "start_price", "reservation_price", "timestamp"])
+
+
+class PriceFuzzerError(Exception):
+    pass
+
+
+def reference_price(case):
+    return current_price(case.start_timestamp, case.end_timestamp, case.start_price, case.reservation_price, case.timestamp)
+
+
+def is_valid_case(case):
+    return (
+        0 < case.start_timestamp < case.end_timestamp <= UINT64_MAX and
+        0 <= case.reservation_price < case.start_price <= UINT128_MAX and
+        0 < case.timestamp <= UINT64_MAX
+    )
+
+
+def auction_storage(seller, case):
+    """
+        Returns the values of the packed auction storage slots (as ints) for the given case, without a buyer.
+    """
+
+    seller = int(str(seller), 16)
+
+    return {
+        SELLER_END_SLOT  : seller | case.end_timestamp << 160,
+        BUYER_START_SLOT : case.start_timestamp << 160,
+        PRICES_SLOT      : case.start_price | case.reservation_price << 128
+    }
+
+
+def random_case(rng):
+    """
+        Returns a random valid case, mixing realistic values with extreme ones, and timestamps close to the bounds of the
+        auction and to the times at which the price drops to a given value.
+    """
+
+    start_timestamp   = rng.choice([rng.randint(1, 2**32), rng.randint(1, UINT64_MAX - 1)])
+    duration          = rng.choice([rng.randint(1, 3600*24*365), rng.randint(1, UINT64_MAX - start_timestamp)])
+    start_price       = rng.choice([rng.randint(1, 10**20), rng.randint(1, UINT128_MAX)])
+    reservation_price = rng.choice([0, rng.randint(0, start_price - 1), start_price - 1])
+
+    end_timestamp = start_timestamp + duration
+    price_step    = time_at_price(
+        start_timestamp, end_timestamp, start_price, reservation_price, rng.randint(reservation_price + 1, start_price)
+    )
+
+    offset = rng.choice([
+        rng.randint(-2, 2),
+        duration + rng.randint(-2, 2),
+        rng.randint(0, duration - 1),
+        # Close to the first timestamp at which the price drops to a random value
+        (duration if price_step is None else price_step - start_timestamp) + rng.randint(-2, 2)
+    ])
+    timestamp = min(max(start_timestamp + offset, 1), UINT64_MAX)
+
+    return FuzzCase(start_timestamp, end_timestamp, start_price, reservation_price, timestamp)
+
+
+def _shrink_candidates(case):
+    # Simpler variants of the case, field by field. The timestamp is kept relative to the auction start, or to its end when
+    # shrinking the duration
+    start, duration = case.start_timestamp, case.end_timestamp - case.start_timestamp
+    offset          = case.timestamp - start
+
+    def smaller(value, minimum):
+        return sorted({minimum, minimum + (value - minimum)//2, value - 1} - {value}) if value > minimum else []
+
+    def towards_zero(value):
+        sign = 1 if value > 0 else -1
+        return sorted({0, sign*(abs(value)//2), value - sign} - {value}, key=abs) if value else []
+
+    for value in smaller(start, 1):
+        yield FuzzCase(value, value + duration, case.start_price, case.reservation_price, value + offset)
+    for value in smaller(duration, 1):
+        yield FuzzCase(start, start + value, case.start_price, case.reservation_price, case.timestamp)
+        yield FuzzCase(start, start + value, case.start_price, case.reservation_price, case.timestamp - duration + value)
+    for value in smaller(case.reservation_price, 0):
+        yield case._replace(reservation_price=value)
+    for value in smaller(case.start_price, case.reservation_price + 1):
+        yield case._replace(start_price=value)
+    for value in towards_zero(offset):
+        yield case._replace(timestamp=start + value)
+
+
+def shrink(case, mismatches):
+    """
+        Greedily shrinks a mismatching case to a minimal one. mismatches takes a list of cases and returns, for each of
+        them, whether it is a mismatch (so that the candidates of every shrinking step are evaluated in a single batch).
+    """
+
+    while True:
+        candidates = [candidate for candidate in _shrink_candidates(case) if is_valid_case(candidate)]
+        shrunk     = next((candidate for candidate, mismatch in zip(candidates, mismatches(candidates)) if mismatch), None)
+
+        if shrunk is None:
+            return case
+
+        case = shrunk
+
+
+class PriceFuzzer:
+    """
+        Evaluates getCurrentPrice cases on a single (not launched) auction, through batched eth_calls with state and block
+        overrides. A price of zero means that getCurrentPrice reverted (as in the price engine).
+    """
+
+    def __init__(self, auction, batch_size=DEFAULT_BATCH_SIZE, endpoint_uri=None):
+        self.auction      = auction
+        self.batch_size   = batch_size
+        self.endpoint_uri = endpoint_uri or web3.provider.endpoint_uri
+        self.seller       = auction.seller()
+
+        self._session = requests.Session()
+        self._data    = auction.getCurrentPrice.encode_input()
+
+        self._check_overrides()
+
+    def _check_overrides(self):
+        # Nodes that do not support the overrides either reject them or ignore them (then the auction is not launched)
+        case = FuzzCase(1000, 2000, 2000, 1000, 1500)
+        try:
+            supported = self.evaluate([case]) == [reference_price(case)]
+        except PriceFuzzerError:
+            supported = False
+
+        if not supported:
+            raise PriceFuzzerError("The node does not support eth_call state and block overrides")
+
+    def _request(self, request_id, case):
+        state = {
+            str(self.auction.address): {
+                "stateDiff": {
+                    web3.toHex(slot.to_bytes(32, "big")): web3.toHex(value.to_bytes(32, "big"))
+                    for slot, value in auction_storage(self.seller, case).items()
+                }
+            }
+        }
+
+        return {
+            "jsonrpc" : "2.0",
+            "id"      : request_id,
+            "method"  : "eth_call",
+            "params"  : [{"to": str(self.auction.address), "data": self._data}, "latest", state, {"time": hex(case.timestamp)}]
+        }
+
+    def evaluate(self, cases):
+        """
+            Returns the price (or zero, if the call reverted) of every case, sending one JSON-RPC batch per batch_size cases.
+        """
+
+        prices = []
+        for i in range(0, len(cases), self.batch_size):
+            batch     = cases[i:i + self.batch_size]
+            responses = self._session.post(self.endpoint_uri, json=[self._request(j, case) for j, case in enumerate(batch)]).json()
+
+            if not isinstance(responses, list):
+                raise PriceFuzzerError(f"The node does not support JSON-RPC batches: {responses}")
+
+            for response in sorted(responses, key=lambda response: response["id"]):
+                if "error" not in response:
+                    prices.append(int(response["result"], 16))
+                elif response["error"].get("code") == 3 or "revert" in response["error"].get("message", ""):
+                    prices.append(0)
+                else:
+                    raise PriceFuzzerError(f"eth_call failed: {response['error']}")
+
+        return prices
+
+    def mismatches(self, cases):
+        return [price != reference_price(case) for case, price in zip(cases, self.evaluate(cases))]
+
+    def run(self, case_count=DEFAULT_CASE_COUNT, seed=None):
+        """
+            Evaluates case_count random cases against the price engine.
+
+            Returns a dictionary with the number of cases, the elapsed time, the throughput, and the shrunk counterexample
+            (None if there were no mismatches).
+        """
+
+        rng   = random.Random(seed)
+        cases = [random_case(rng) for _ in range(case_count)]
+
+        start      = time.perf_counter()
+        mismatches = [case for case, mismatch in zip(cases, self.mismatches(cases)) if mismatch]
+        elapsed    = time.perf_counter() - start
+
+        counterexample = shrink(mismatches[0], self.mismatches) if mismatches else None
+
+        return {
+            "cases"          : case_count,
+            "mismatches"     : len(mismatches),
+            "elapsed"        : elapsed,
+            "cases_per_sec"  : case_count/elapsed if elapsed else 0,
+            "counterexample" : counterexample
+        }
+
+
+def main(case_count=DEFAULT_CASE_COUNT, batch_size=DEFAULT_BATCH_SIZE, seed=None):
+    auction = deploy_auction(accounts[0], ZERO_ADDRESS) # The token is never used by getCurrentPrice
+    fuzzer  = PriceFuzzer(auction, int(batch_size))
+    report  = fuzzer.run(int(case_count), None if seed is None else int(seed))
+
+    print(f"{report['cases']} cases in {report['elapsed']:.3f} s: {report['cases_per_sec']:.1f} cases/s")
+    if report["counterexample"] is None:
+        print("No mismatches")
+    else:
+        counterexample = report["counterexample"]
+        print(
+            f"{report['mismatches']} mismatches. Minimal counterexample: {counterexample} "
+            f"(contract: {fuzzer.evaluate([counterexample])[0]}, reference: {reference_price(counterexample)})"
+        )
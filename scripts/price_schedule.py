@@ -0,0 +1,245 @@
+import csv
+import sqlite3
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+from brownie import DutchAuctionFactory, accounts, web3
+
+from scripts.auction_reader import DEFAULT_CHUNK_SIZE, deploy_auction_reader, read_auctions
+from scripts.price_engine import current_prices
+from scripts.sweep import find_auctions
+
+# Streaming exporter of the price schedules of many auctions: the price (as getCurrentPrice would return it, see
+# scripts/price_engine.py) of every launched auction at every resolution seconds from its start until its end.
+#
+# The launch parameters are read in bulk, either from the chain (the auctions of a DutchAuctionFactory, through an
+# AuctionReader) or from an event index (scripts/indexer.py). The schedules are generated and written in chunks of at most
+# rows_per_chunk rows (a single schedule may span several chunks), so that memory stays bounded however many auctions, and
+# rows, are exported. The output is a Parquet file (one row group per chunk, requires pyarrow) or a CSV file, depending on the
+# extension of the output path. As in the index, prices are written as decimal strings, as they may not fit in an int64.
+#
+#   brownie run price_schedule main <factory address or index path> [output path] [resolution] [rows per chunk]
+
+DEFAULT_OUTPUT_PATH    = "reports/price_schedule.csv"
+DEFAULT_RESOLUTION     = 3600           # Seconds between rows
+DEFAULT_ROWS_PER_CHUNK = 100000
+
+COLUMNS = ("address", "timestamp", "price")
+
+LaunchParameters = namedtuple("LaunchParameters", ["address", "start_timestamp", "end_timestamp", "start_price", "reservation_price"])
+
+
+# Sources ***********************************************************************************************************************
+
+
+def launches_from_chain(reader, auctions, chunk_size=DEFAULT_CHUNK_SIZE, block_identifier=None):
+    """
+        Yields the launch parameters of the launched auctions (out of the given DutchAuction contracts or addresses), read
+        chunk_size auctions at a time through the reader, all at the same block.
+    """
+
+    if block_identifier is None:
+        block_identifier = web3.eth.block_number
+
+    auctions = list(auctions)
+    for i in range(0, len(auctions), chunk_size):
+        for state in read_auctions(reader, auctions[i:i + chunk_size], chunk_size, block_identifier):
+            if state is not None and state.ready:
+                yield LaunchParameters(
+                    state.address, state.start_timestamp, state.end_timestamp, state.start_price, state.reservation_price
+                )
+
+
+def launches_from_index(db_path, batch_size=DEFAULT_CHUNK_SIZE):
+    """
+        Yields the launch parameters of the launched auctions of an event index, fetching batch_size auctions at a time.
+    """
+
+    db = sqlite3.connect(db_path)
+    try:
+        cursor = db.execute(
+            "SELECT address, start_timestamp, end_timestamp, start_price, reservation_price FROM auctions "
+            "WHERE launch_block IS NOT NULL ORDER BY address"
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows: break
+
+            for address, start_timestamp, end_timestamp, start_price, reservation_price in rows:
+                yield LaunchParameters(
+                    address, int(start_timestamp), int(end_timestamp), int(start_price), int(reservation_price)
+                )
+    finally:
+        db.close()
+
+
+# Schedules *********************************************************************************************************************
+
+
+def _row_count(launch, resolution):
+    # Rows at start_timestamp + k*resolution, before end_timestamp
+    return -(-(launch.end_timestamp - launch.start_timestamp) // resolution)
+
+
+def schedule_segments(launches, resolution=DEFAULT_RESOLUTION, rows_per_chunk=DEFAULT_ROWS_PER_CHUNK):
+    """
+        Splits the schedules of the auctions into chunks of at most rows_per_chunk rows. Yields every chunk as a list of
+        (launch parameters, first row, row count) segments.
+    """
+
+    chunk, chunk_rows = [], 0
+    for launch in launches:
+        row_count, first_row = _row_count(launch, resolution), 0
+
+        while first_row < row_count:
+            segment_rows = min(row_count - first_row, rows_per_chunk - chunk_rows)
+            chunk.append((launch, first_row, segment_rows))
+            chunk_rows += segment_rows
+            first_row  += segment_rows
+
+            if chunk_rows == rows_per_chunk:
+                yield chunk
+                chunk, chunk_rows = [], 0
+
+    if chunk:
+        yield chunk
+
+
+def _column(values):
+    # int64 whenever the values fit, Python integers otherwise (as in price_engine)
+    try:
+        return np.asarray(values, dtype=np.int64)
+    except OverflowError:
+        return np.asarray(values, dtype=object)
+
+
+def schedule_columns(segments, resolution=DEFAULT_RESOLUTION):
+    """
+        Returns the (addresses, timestamps, prices) columns of a chunk of schedule segments. The prices are computed for the
+        whole chunk at once by the price engine, so they are exact to the contract's integer arithmetic.
+    """
+
+    counts = [row_count for _, _, row_count in segments]
+
+    def repeated(field):
+        return np.repeat(_column([getattr(launch, field) for launch, _, _ in segments]), counts)
+
+    addresses          = np.repeat([launch.address for launch, _, _ in segments], counts)
+    start_timestamps   = repeated("start_timestamp")
+    end_timestamps     = repeated("end_timestamp")
+    start_prices       = repeated("start_price")
+    reservation_prices = repeated("reservation_price")
+
+    rows = np.concatenate([np.arange(first_row, first_row + row_count, dtype=np.int64) for _, first_row, row_count in segments])
+    if end_timestamps.dtype == object:
+        start_timestamps, rows = start_timestamps.astype(object), rows.astype(object)
+
+    # The timestamps are below the end timestamps, so they fit in int64 whenever those do
+    timestamps = start_timestamps + rows*resolution
+    prices     = current_prices(start_timestamps, end_timestamps, start_prices, reservation_prices, timestamps)
+
+    return addresses, timestamps, prices
+
+
+# Writers ***********************************************************************************************************************
+
+
+class CSVScheduleWriter:
+
+    def __init__(self, path):
+        self._file   = open(path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(COLUMNS)
+
+    def write(self, addresses, timestamps, prices):
+        self._writer.writerows(zip(addresses.tolist(), timestamps.tolist(), prices.tolist()))
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetScheduleWriter:
+
+    def __init__(self, path):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as exc:
+            raise ImportError("Exporting to Parquet requires pyarrow: pip install pyarrow (or export to a .csv file)") from exc
+
+        self._pa     = pyarrow
+        self._schema = pyarrow.schema([("address", pyarrow.string()), ("timestamp", pyarrow.uint64()), ("price", pyarrow.string())])
+        self._writer = pyarrow.parquet.ParquetWriter(str(path), self._schema)
+
+    def write(self, addresses, timestamps, prices):
+        columns = [
+            self._pa.array(addresses, self._pa.string()),
+            self._pa.array(timestamps, self._pa.uint64()),
+            self._pa.array(prices.astype(str), self._pa.string())
+        ]
+        self._writer.write_table(self._pa.Table.from_arrays(columns, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+def open_writer(path):
+    return ParquetScheduleWriter(path) if str(path).endswith(".parquet") else CSVScheduleWriter(path)
+
+
+def export_schedules(launches, path, resolution=DEFAULT_RESOLUTION, rows_per_chunk=DEFAULT_ROWS_PER_CHUNK):
+    """
+        Streams the price schedules of the given launches (e.g. from launches_from_chain or launches_from_index) to path.
+
+        Returns a dictionary with the number of auctions, rows and chunks written, the elapsed time and the throughput.
+    """
+
+    auctions = set()
+    rows     = 0
+    chunks   = 0
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    start  = time.perf_counter()
+    writer = open_writer(path)
+    try:
+        for segments in schedule_segments(launches, resolution, rows_per_chunk):
+            columns = schedule_columns(segments, resolution)
+            writer.write(*columns)
+
+            auctions.update(launch.address for launch, _, _ in segments)
+            rows   += len(columns[0])
+            chunks += 1
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "auctions"     : len(auctions),
+        "rows"         : rows,
+        "chunks"       : chunks,
+        "elapsed"      : elapsed,
+        "rows_per_sec" : rows/elapsed if elapsed else 0
+    }
+
+
+def main(source, path=DEFAULT_OUTPUT_PATH, resolution=DEFAULT_RESOLUTION, rows_per_chunk=DEFAULT_ROWS_PER_CHUNK):
+    """
+        Exports the price schedules of the auctions of a DutchAuctionFactory (if source is an address) or of an event index
+        (if source is the path to its database).
+    """
+
+    if web3.isAddress(source):
+        auctions = find_auctions(DutchAuctionFactory.at(source))
+        launches = launches_from_chain(deploy_auction_reader(accounts[0]), auctions)
+    else:
+        launches = launches_from_index(source)
+
+    stats = export_schedules(launches, path, int(resolution), int(rows_per_chunk))
+
+    print(
+        f"Exported {stats['rows']} rows ({stats['auctions']} auctions, {stats['chunks']} chunks) to {path} in "
+        f"{stats['elapsed']:.3f} s: {stats['rows_per_sec']:.1f} rows/s"
+    )
@@ -0,0 +1,110 @@
+from brownie import AuctionReader, DutchAuctionFactory, accounts, web3
+
+from scripts.auction_reader import deploy_auction_reader, read_auctions
+
+# Batch sweep of the tokens (and funds) of the finished auctions of an owner.
+#
+# The auctions created through a DutchAuctionFactory are found from its AuctionCreated events (fetched in block ranges), their
+# states are read in bulk through an AuctionReader (all at the same block), and the eligible auctions of the owner are swept
+# through the factory (DutchAuctionFactory.sweepAuctions) in chunks whose gas stays below a gas budget. As ownership is
+# transferable, the auctions are selected by their current owner (whom sweepAuctions checks), rather than by their seller.
+#
+#   brownie run sweep main <factory address> [reader address] [gas budget]
+
+DEFAULT_GAS_BUDGET  = 8000000
+DEFAULT_BLOCK_RANGE = 1000              # Blocks per eth_getLogs request
+
+
+def find_auctions(factory, seller=None, from_block=0, to_block=None, block_range=DEFAULT_BLOCK_RANGE):
+    """
+        Returns the addresses of the auctions created by the seller (or by anyone, if None) through the factory, from
+        from_block up to to_block (the latest block by default), fetching the events block_range blocks at a time.
+    """
+
+    if to_block is None:
+        to_block = web3.eth.block_number
+
+    events   = web3.eth.contract(address=factory.address, abi=factory.abi).events.AuctionCreated
+    filters  = {} if seller is None else {"seller": str(seller)}
+    auctions = []
+
+    for range_start in range(from_block, to_block + 1, block_range):
+        range_end = min(range_start + block_range - 1, to_block)
+        logs      = events.getLogs(fromBlock=range_start, toBlock=range_end, argument_filters=filters)
+        auctions += [log["args"]["auction"] for log in logs]
+
+    return auctions
+
+
+def find_sweepable(reader, auctions, owner, block_identifier=None):
+    """
+        Returns the auctions (out of the given DutchAuction contracts or addresses) currently owned by owner that hold
+        tokens (or funds) and have finished, either sold or deserted. Auctions that have not been launched yet are not
+        swept, although DutchAuction.retrieveTokens would allow it.
+    """
+
+    sweepable = []
+    for state in read_auctions(reader, auctions, block_identifier=block_identifier):
+        if state is None or state.owner != str(owner): continue
+
+        finished = state.finished or state.has_buyer
+        if finished and (state.token_balance > 0 or state.balance > 0):
+            sweepable.append(state.address)
+
+    return sweepable
+
+
+def _chunk_gas(factory, owner, chunk):
+    # Chunks too large to be estimated (e.g. over the block gas limit) are reported as not fitting in any budget, unless
+    # they cannot be split any further
+    try:
+        return factory.sweepAuctions.estimate_gas(chunk, {"from": owner})
+    except ValueError:
+        if len(chunk) == 1: raise
+        return None
+
+
+def sweep(factory, owner, auctions, gas_budget=DEFAULT_GAS_BUDGET):
+    """
+        Sweeps the given auctions (all of them owned by owner and eligible, see find_sweepable) through the factory,
+        in chunks whose estimated gas stays below gas_budget.
+
+        The chunk size is estimated from the gas of sweeping a single auction, and halved whilst a chunk exceeds the budget.
+
+        Returns the list of sweep transactions.
+    """
+
+    auctions = [str(auction) for auction in auctions]
+    if not auctions: return []
+
+    chunk_size = max(gas_budget // _chunk_gas(factory, owner, auctions[:1]), 1)
+
+    txs, i = [], 0
+    while i < len(auctions):
+        chunk = auctions[i:i + chunk_size]
+        gas   = _chunk_gas(factory, owner, chunk)
+
+        if gas is None or (gas > gas_budget and len(chunk) > 1):
+            chunk_size = max(len(chunk) // 2, 1)
+            continue
+
+        txs.append(factory.sweepAuctions(chunk, {"from": owner}))
+        i += len(chunk)
+
+    return txs
+
+
+def main(factory_address, reader_address=None, gas_budget=DEFAULT_GAS_BUDGET):
+    owner   = accounts[0]
+    factory = DutchAuctionFactory.at(factory_address)
+    reader  = deploy_auction_reader(owner) if reader_address is None else AuctionReader.at(reader_address)
+
+    # Every auction of the factory, as the owner may have been transferred auctions created by other sellers
+    auctions  = find_auctions(factory)
+    sweepable = find_sweepable(reader, auctions, owner)
+    txs       = sweep(factory, owner, sweepable, int(gas_budget))
+
+    print(
+        f"Swept {len(sweepable)} of the {len(auctions)} auctions of the factory for {owner} in {len(txs)} transactions "
+        f"({sum(tx.gas_used for tx in txs)} gas)"
+    )
@@ -0,0 +1,323 @@
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from brownie import web3
+from brownie.network.state import _find_contract
+
+# Opt-in transaction tracing, to find out where the time of the scripts and tests goes (RPC latency, mining, waiting for
+# receipts, or the Python side, e.g. hypothesis).
+#
+# A web3 middleware records every JSON-RPC request (count and time per method) and every transaction: its submit -> receipt
+# latency, gas used, status and revert reason. Transactions and request times are attributed to the open spans: the
+# scripts/deploy.py helpers (see traced) and, in the tests, every fixture setup and test call. The buy and launchAuction
+# transactions are also traced (debug_traceTransaction) to find their gas hot spots, per opcode and per contract function.
+#
+# Tracing is enabled by setting AUCTION_TRACE to the path of the trace file (written at exit), or with
+# `brownie test --trace-file <path>`. To summarize a trace file, run:
+#
+#   python -m scripts.tracing <path> [top]
+
+TRACE_ENV_VAR   = "AUCTION_TRACE"
+DEFAULT_TOP     = 10
+HOT_SPOT_NAMES  = ("DutchAuction.buy", "DutchAuction.launchAuction")
+EXTERNAL_CALLS  = "<external calls>"
+TRACE_OPTIONS   = {"disableStorage": True, "disableMemory": True, "disableStack": True}
+
+
+def _int(value):
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+class Tracer:
+
+    def __init__(self, path):
+        self.path         = path
+        self.start        = time.perf_counter()
+        self.transactions = {}              # txid -> record
+        self.spans        = []
+        self.rpc          = {}              # method -> {"calls", "time"}
+        self.hot_spots    = {}              # function -> {"transactions", "gas", "by_opcode", "by_function"}
+
+        self._open_spans  = []
+        self._lock        = threading.RLock()
+
+    def _now(self):
+        return time.perf_counter() - self.start
+
+    # Spans
+    @contextmanager
+    def span(self, name):
+        span = {"name": name, "start": self._now(), "elapsed": 0, "rpc_calls": 0, "rpc_time": 0, "transactions": 0}
+        with self._lock:
+            self._open_spans.append(span)
+        try:
+            yield span
+        finally:
+            with self._lock:
+                self._open_spans.remove(span)
+                span["elapsed"] = self._now() - span["start"]
+                self.spans.append(span)
+
+    # Middleware
+    def middleware(self, make_request, w3):
+        def trace_request(method, params):
+            start    = time.perf_counter()
+            response = make_request(method, params)
+            elapsed  = time.perf_counter() - start
+
+            with self._lock:
+                stats = self.rpc.setdefault(method, {"calls": 0, "time": 0})
+                stats["calls"] += 1
+                stats["time"]  += elapsed
+                for span in self._open_spans:
+                    span["rpc_calls"] += 1
+                    span["rpc_time"]  += elapsed
+
+            if method in ("eth_sendTransaction", "eth_sendRawTransaction"):
+                self._submitted(method, params, response, start)
+            elif method == "eth_getTransactionReceipt" and response.get("result"):
+                self._mined(make_request, response["result"])
+
+            return response
+
+        return trace_request
+
+    def _submitted(self, method, params, response, start):
+        error = response.get("error")
+        if "result" in response:
+            txid, reason = response["result"], None
+        elif isinstance(error, dict) and isinstance(error.get("data"), dict):
+            # Ganache reports reverted transactions (which are still mined) as errors, keyed by their hash
+            txid, data = next(((key, value) for key, value in error["data"].items() if key.startswith("0x")), (None, None))
+            reason     = data.get("reason") if data else None
+        else:
+            return
+
+        if txid is None:
+            return
+
+        transaction = params[0] if method == "eth_sendTransaction" else {}
+        with self._lock:
+            self.transactions[txid] = {
+                "txid"          : txid,
+                "name"          : None,
+                "to"            : transaction.get("to"),
+                "data"          : transaction.get("data"),
+                "span"          : self._open_spans[-1]["name"] if self._open_spans else None,
+                "submitted"     : start - self.start,
+                "latency"       : None,
+                "gas_used"      : None,
+                "status"        : None,
+                "revert_reason" : reason,
+                "block"         : None
+            }
+            for span in self._open_spans:
+                span["transactions"] += 1
+
+    def _mined(self, make_request, receipt):
+        with self._lock:
+            record = self.transactions.get(receipt["transactionHash"])
+            if record is None or record["latency"] is not None:
+                return
+
+            record["latency"]  = self._now() - record["submitted"]
+            record["gas_used"] = _int(receipt["gasUsed"])
+            record["status"]   = _int(receipt["status"])
+            record["block"]    = _int(receipt["blockNumber"])
+
+        if record["to"] is None and receipt.get("to"):
+            # Raw transactions: the calldata is only known once mined
+            transaction    = make_request("eth_getTransactionByHash", [record["txid"]]).get("result") or {}
+            record["to"]   = transaction.get("to")
+            record["data"] = transaction.get("input")
+
+        record["name"] = self._name(record, receipt)
+
+        if record["name"] in HOT_SPOT_NAMES and record["status"] == 1:
+            self._trace_hot_spots(make_request, record)
+
+    def _name(self, record, receipt):
+        if receipt.get("contractAddress"):
+            return "deployment"
+
+        contract = _find_contract(record["to"])
+        if contract is None:
+            return "transfer" if not record["data"] or record["data"] == "0x" else "unknown"
+
+        return f"{contract._name}.{contract.get_method(record['data'] or '0x') or 'fallback'}"
+
+    def _trace_hot_spots(self, make_request, record):
+        response = make_request("debug_traceTransaction", [record["txid"], TRACE_OPTIONS])
+        steps    = (response.get("result") or {}).get("structLogs")
+        if not steps:
+            return
+
+        contract = _find_contract(record["to"])
+        pc_map   = contract._build.get("pcMap", {}) if contract else {}
+        depth    = steps[0]["depth"]
+
+        with self._lock:
+            spots = self.hot_spots.setdefault(record["name"], {"transactions": 0, "gas": 0, "by_opcode": {}, "by_function": {}})
+            spots["transactions"] += 1
+            spots["gas"]          += record["gas_used"]
+
+            for step in steps:
+                gas_cost = _int(step["gasCost"])
+                op       = step["op"]
+                function = pc_map.get(_int(step["pc"]), {}).get("fn", "<unknown>") if step["depth"] == depth else EXTERNAL_CALLS
+
+                spots["by_opcode"][op]         = spots["by_opcode"].get(op, 0) + gas_cost
+                spots["by_function"][function] = spots["by_function"].get(function, 0) + gas_cost
+
+    # Export
+    def as_dict(self):
+        with self._lock:
+            return {
+                "elapsed"      : self._now(),
+                "transactions" : [
+                    {field: value for field, value in record.items() if field not in ("to", "data")}
+                    for record in self.transactions.values()
+                ],
+                "spans"        : list(self.spans),
+                "rpc"          : dict(self.rpc),
+                "hot_spots"    : dict(self.hot_spots)
+            }
+
+    def write(self, path=None):
+        path = Path(path or self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as trace_file:
+            json.dump(self.as_dict(), trace_file, indent=2)
+
+
+_tracer = None
+
+
+def enable(path):
+    """
+        Starts tracing the transactions and RPC requests sent through brownie's web3, to be written to path at exit.
+    """
+
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(path)
+        web3.middleware_onion.add(_tracer.middleware, name="auction_tracer")
+        atexit.register(_tracer.write)
+
+    return _tracer
+
+
+def get_tracer():
+    return _tracer
+
+
+@contextmanager
+def span(name):
+    if _tracer is None:
+        yield None
+    else:
+        with _tracer.span(name) as opened_span:
+            yield opened_span
+
+
+def traced(fn):
+    # Runs the function in a span named after it, if tracing is enabled
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if _tracer is None:
+            return fn(*args, **kwargs)
+        with _tracer.span(fn.__name__):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+if os.environ.get(TRACE_ENV_VAR):
+    enable(os.environ[TRACE_ENV_VAR])
+
+
+# Summary ***********************************************************************************************************************
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(fraction*len(values)), len(values) - 1)] if values else 0
+
+
+def summarize(trace, top=DEFAULT_TOP):
+    """
+        Returns the summary of a trace (as written by Tracer.write) as a list of lines.
+    """
+
+    lines = [f"Traced {len(trace['transactions'])} transactions in {trace['elapsed']:.2f} s", ""]
+
+    by_name = {}
+    for record in trace["transactions"]:
+        by_name.setdefault(record["name"], []).append(record)
+
+    lines.append(f"{'Transaction':<40} {'Count':>6} {'Reverted':>8} {'p50 (ms)':>9} {'p95 (ms)':>9} {'Max gas':>9}")
+    for name, records in sorted(by_name.items(), key=lambda item: -len(item[1])):
+        latencies = [record["latency"]*1000 for record in records if record["latency"] is not None]
+        gas       = [record["gas_used"] for record in records if record["gas_used"] is not None]
+        reverted  = sum(record["status"] == 0 for record in records)
+        lines.append(
+            f"{str(name):<40} {len(records):>6} {reverted:>8} {_percentile(latencies, 0.5):>9.1f} "
+            f"{_percentile(latencies, 0.95):>9.1f} {max(gas, default=0):>9}"
+        )
+
+    reasons = {}
+    for record in trace["transactions"]:
+        if record["status"] == 0:
+            reason = (record["name"], record["revert_reason"] or "<no reason>")
+            reasons[reason] = reasons.get(reason, 0) + 1
+    if reasons:
+        lines += ["", f"{'Reverted transaction':<40} {'Count':>6}   Reason"]
+        for (name, reason), count in sorted(reasons.items(), key=lambda item: -item[1])[:top]:
+            lines.append(f"{str(name):<40} {count:>6}   {reason}")
+
+    spans = {}
+    for span in trace["spans"]:
+        totals = spans.setdefault(span["name"], {"count": 0, "elapsed": 0, "rpc_time": 0, "transactions": 0})
+        totals["count"]        += 1
+        totals["elapsed"]      += span["elapsed"]
+        totals["rpc_time"]     += span["rpc_time"]
+        totals["transactions"] += span["transactions"]
+    if spans:
+        lines += ["", f"{'Span':<60} {'Count':>6} {'Time (s)':>9} {'RPC (s)':>8} {'RPC %':>6} {'Txs':>6}"]
+        for name, totals in sorted(spans.items(), key=lambda item: -item[1]["elapsed"])[:top]:
+            share = totals["rpc_time"]/totals["elapsed"] if totals["elapsed"] else 0
+            lines.append(
+                f"{name[-60:]:<60} {totals['count']:>6} {totals['elapsed']:>9.2f} {totals['rpc_time']:>8.2f} "
+                f"{share:>6.0%} {totals['transactions']:>6}"
+            )
+
+    lines += ["", f"{'RPC method':<32} {'Calls':>8} {'Time (s)':>9} {'Mean (ms)':>10}"]
+    for method, stats in sorted(trace["rpc"].items(), key=lambda item: -item[1]["time"])[:top]:
+        lines.append(f"{method:<32} {stats['calls']:>8} {stats['time']:>9.2f} {stats['time']/stats['calls']*1000:>10.2f}")
+
+    for name, spots in trace["hot_spots"].items():
+        lines += ["", f"{name}: {spots['transactions']} transactions, {spots['gas']/spots['transactions']:.0f} gas on average"]
+        for key in ("by_opcode", "by_function"):
+            for item, gas in sorted(spots[key].items(), key=lambda item: -item[1])[:top]:
+                lines.append(f"    {item:<56} {gas/spots['transactions']:>10.0f} gas")
+            lines.append("")
+
+    return lines
+
+
+def main(path, top=DEFAULT_TOP):
+    with open(path) as trace_file:
+        trace = json.load(trace_file)
+
+    print("\n".join(summarize(trace, int(top))))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -1,14 +1,18 @@
-from pytest import fixture
-from brownie import accounts, TestToken, DutchAuction, network, config
+import os
+
+from pytest import fixture, hookimpl
+from brownie import accounts, chain, TestToken, network, config
 from web3 import Web3
+from scripts import tracing
+from scripts.deploy import deploy_auction, deploy_and_fund_auction, deploy_auction_house, create_funded_lot
 
 STANDARD_TEST_START_DELAY         = 3600*24*3               # Delay to start the auction (from chain.time() - in seconds)
 STANDARD_TEST_DURATION            = 3600*24*7               # Auction duration (in seconds)
 STANDARD_TEST_START_PRICE         = Web3.toWei(10, "gwei")  # Auction start price
 STANDARD_TEST_RESERVATION_PRICE   = Web3.toWei(1, "gwei")   # Auction reservation price
 STANDARD_TEST_TOKEN_COUNT         = 1000                    # Auctioned tokens count
-STANDARD_TEST_PRICE_CHECK_MARGIN  = 15                      # Allowed margin for auction price check (in seconds)
 STANDARD_TEST_END_MAX_CHECK_DELAY = 3600*1                  # Max margin for checks after auction completion
+STARTED_TEST_START_DELAY          = 60                      # Delay to start the auction of the started_auction fixture
 
 
 @fixture(autouse=True)
@@ -17,8 +21,152 @@ def shared_setup(fn_isolation):
 
 
 @fixture(scope="module")
-def test_token():
-    if len(TestToken) <= 0:
-        TestToken.deploy("TestToken", "TT", {"from": accounts[0]})
-    
-    return TestToken[-1]
+def test_token(module_isolation):
+    # The chain is reset at the start of every module (and every xdist worker runs its own chain), so the token is deployed
+    # on the chain of the current module/worker rather than looked up in the TestToken container
+    return TestToken.deploy("TestToken", "TT", {"from": accounts[0]})
+
+
+# Pre-built auctions ************************************************************************************************************
+# Auctions (all sold by accounts[0]) built once per module. As module scoped fixtures run before the isolation snapshots are
+# taken, every test (and every hypothesis example, see brownie.test.given) reverts the chain to the state in which the auctions
+# were built, rather than deploying its own auction.
+
+
+@fixture(scope="module")
+def deployed_auction(module_isolation, test_token):
+    return deploy_auction(accounts[0], test_token)
+
+
+@fixture(scope="module")
+def funded_auction(module_isolation, test_token):
+    return deploy_and_fund_auction(accounts[0], test_token, STANDARD_TEST_TOKEN_COUNT)
+
+
+@fixture(scope="module")
+def launched_auction(module_isolation, test_token):
+    dutch_auction = deploy_and_fund_auction(accounts[0], test_token, STANDARD_TEST_TOKEN_COUNT)
+
+    start_timestamp = chain.time() + STANDARD_TEST_START_DELAY
+    end_timestamp   = start_timestamp + STANDARD_TEST_DURATION
+    dutch_auction.launchAuction(start_timestamp, end_timestamp, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE, {"from": accounts[0]})
+
+    return dutch_auction
+
+
+@fixture(scope="module")
+def started_auction(module_isolation, test_token, launched_auction):
+    # Built after launched_auction (whatever the order in which the tests request them), so that the time jump never shifts
+    # its timestamps. A short start delay is used so that the auctions of the other fixtures are barely affected by the jump
+    dutch_auction = deploy_and_fund_auction(accounts[0], test_token, STANDARD_TEST_TOKEN_COUNT)
+
+    start_timestamp = chain.time() + STARTED_TEST_START_DELAY
+    end_timestamp   = start_timestamp + STANDARD_TEST_DURATION
+    dutch_auction.launchAuction(start_timestamp, end_timestamp, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE, {"from": accounts[0]})
+
+    chain.sleep(STARTED_TEST_START_DELAY)
+    chain.mine()
+
+    return dutch_auction
+
+
+@fixture(scope="module")
+def auction_house(module_isolation):
+    return deploy_auction_house(accounts[0])
+
+
+@fixture(scope="module")
+def funded_lot(module_isolation, test_token, auction_house):
+    return create_funded_lot(accounts[0], auction_house, test_token, STANDARD_TEST_TOKEN_COUNT)
+
+
+@fixture(scope="module")
+def launched_lot(module_isolation, test_token, auction_house):
+    lot_id = create_funded_lot(accounts[0], auction_house, test_token, STANDARD_TEST_TOKEN_COUNT)
+
+    start_timestamp = chain.time() + STANDARD_TEST_START_DELAY
+    end_timestamp   = start_timestamp + STANDARD_TEST_DURATION
+    auction_house.launch(lot_id, start_timestamp, end_timestamp, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE, {"from": accounts[0]})
+
+    return lot_id
+
+
+# EVM backend *******************************************************************************************************************
+# The tests run on Brownie's Ganache by default. With `--evm in-process`, the contracts are run in-process by py-evm instead
+# (see scripts/in_process_evm.py), connecting before Brownie would launch Ganache.
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--evm", choices=["ganache", "in-process"], default="ganache", help="EVM backend the tests are run on"
+    )
+    parser.addoption(
+        "--trace-file", default=None, help="Trace the transactions of the tests into this file (see scripts/tracing.py)"
+    )
+
+
+def pytest_collection_finish(session):
+    if session.config.getoption("evm") == "in-process" and session.items and not network.is_connected():
+        from scripts import in_process_evm # Optional dependency (eth-tester)
+        in_process_evm.connect()
+
+
+# Tracing ***********************************************************************************************************************
+# With `--trace-file <path>`, every fixture setup and test call is a tracing span. Each xdist worker writes its own trace file,
+# suffixed with the worker id.
+
+
+def pytest_configure(config):
+    path = config.getoption("trace_file")
+    if path:
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+        tracing.enable(f"{path}.{worker}" if worker else path)
+
+
+@hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef):
+    with tracing.span(f"fixture {fixturedef.argname}"):
+        yield
+
+
+@hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    with tracing.span(item.nodeid):
+        yield
+
+
+def pytest_sessionfinish(session):
+    if tracing.get_tracer():
+        tracing.get_tracer().write()
+
+
+# Test timings ******************************************************************************************************************
+
+_test_durations = {}
+
+
+def pytest_runtest_logreport(report):
+    if report.when in ("setup", "call"):
+        _test_durations.setdefault(report.nodeid, {"setup": 0, "call": 0})[report.when] = report.duration
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+        Reports the setup (fixtures) and call time of every test, and the total time of every testing stage (module).
+    """
+
+    if not _test_durations: return
+
+    terminalreporter.section("test timings")
+
+    stages = {}
+    for nodeid, durations in _test_durations.items():
+        stage = nodeid.split("::")[0]
+        stages[stage] = stages.get(stage, 0) + durations["setup"] + durations["call"]
+
+        terminalreporter.write_line(f"{durations['setup']:>9.2f}s setup {durations['call']:>9.2f}s call   {nodeid}")
+
+    terminalreporter.write_line("")
+    for stage, duration in stages.items():
+        terminalreporter.write_line(f"{duration:>9.2f}s   {stage}")
+    terminalreporter.write_line(f"{sum(stages.values()):>9.2f}s   total")
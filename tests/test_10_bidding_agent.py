@@ -0,0 +1,96 @@
+import asyncio
+
+from brownie import accounts, chain
+from scripts.auction_state import get_auction_state, ZERO_ADDRESS
+from scripts.bidding_agent import BiddingAgent
+from scripts.deploy import deploy_and_fund_auction
+from scripts.price_engine import current_price
+
+from conftest import (
+    STANDARD_TEST_TOKEN_COUNT,
+    STANDARD_TEST_DURATION,
+    STANDARD_TEST_START_PRICE,
+    STANDARD_TEST_RESERVATION_PRICE,
+    STARTED_TEST_START_DELAY
+)
+
+# Bidding agent tests ***********************************************************************************************************
+
+
+def _price_in(dutch_auction, seconds):
+    state = get_auction_state(dutch_auction)
+    return current_price(state.start_timestamp, state.end_timestamp, state.start_price, state.reservation_price, state.timestamp + seconds)
+
+
+def test_bid_at_target_price(launched_auction):
+    """
+        Tests that a bid is placed once the price reaches the target price, jumping close to the target time with chain.sleep.
+    """
+
+    buyer_account = accounts[1]
+    target_price  = (STANDARD_TEST_START_PRICE + STANDARD_TEST_RESERVATION_PRICE) // 2
+
+    agent     = BiddingAgent(buyer_account)
+    timestamp = agent.target_timestamp(launched_auction, target_price)
+
+    chain.sleep(timestamp - chain.time() - 2)
+    chain.mine()
+
+    receipt = asyncio.run(agent.run([(launched_auction, target_price)]))[0]
+
+    assert(receipt.status == 1)
+    assert(receipt.timestamp >= timestamp)
+    assert(receipt.return_value <= target_price)
+    assert(launched_auction.buyer() == buyer_account)
+
+
+def test_bid_many_auctions(test_token, started_auction):
+    """
+        Tests that an agent watches several auctions concurrently.
+    """
+
+    seller_account = accounts[0]
+    buyer_account  = accounts[1]
+
+    other_auction   = deploy_and_fund_auction(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT)
+    start_timestamp = chain.time() + STARTED_TEST_START_DELAY
+    other_auction.launchAuction(start_timestamp, start_timestamp + STANDARD_TEST_DURATION, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE, {"from": seller_account})
+
+    chain.sleep(STARTED_TEST_START_DELAY)
+    chain.mine()
+
+    auctions      = [started_auction, other_auction]
+    target_prices = [_price_in(started_auction, 4), _price_in(other_auction, 2)]
+
+    receipts = asyncio.run(BiddingAgent(buyer_account).run(list(zip(auctions, target_prices))))
+
+    for dutch_auction, target_price, receipt in zip(auctions, target_prices, receipts):
+        assert(receipt.status == 1)
+        assert(receipt.return_value <= target_price)
+        assert(dutch_auction.buyer() == buyer_account)
+        assert(test_token.balanceOf(buyer_account) >= STANDARD_TEST_TOKEN_COUNT)
+
+
+def test_bid_unreachable_target(test_token, started_auction):
+    """
+        Tests that a bid whose target price is never reached gets its error, without aborting the other bids.
+    """
+
+    seller_account = accounts[0]
+    buyer_account  = accounts[1]
+
+    other_auction   = deploy_and_fund_auction(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT)
+    start_timestamp = chain.time() + STARTED_TEST_START_DELAY
+    other_auction.launchAuction(start_timestamp, start_timestamp + STANDARD_TEST_DURATION, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE, {"from": seller_account})
+
+    chain.sleep(STARTED_TEST_START_DELAY)
+    chain.mine()
+
+    # The price of other_auction never drops to the reservation price
+    bids    = [(started_auction, _price_in(started_auction, 2)), (other_auction, STANDARD_TEST_RESERVATION_PRICE)]
+    results = asyncio.run(BiddingAgent(buyer_account).run(bids))
+
+    assert(results[0].status == 1)
+    assert(started_auction.buyer() == buyer_account)
+    assert(isinstance(results[1], ValueError))
+    assert(other_auction.buyer() == ZERO_ADDRESS)
@@ -0,0 +1,91 @@
+from brownie import TestToken, accounts, chain
+from scripts.deploy import deploy_fund_and_launch_pipelined
+from scripts.pipeline import TransactionPipeline
+
+from conftest import (
+    STANDARD_TEST_TOKEN_COUNT,
+    STANDARD_TEST_START_DELAY,
+    STANDARD_TEST_DURATION,
+    STANDARD_TEST_START_PRICE,
+    STANDARD_TEST_RESERVATION_PRICE
+)
+
+# Transaction pipeline tests ****************************************************************************************************
+
+
+def test_deploy_fund_and_launch_pipelined(test_token):
+    """
+        Tests that a plan of pipelined auction deployments, fundings and launches is fully mined.
+    """
+
+    seller_account = accounts[0]
+    auction_count  = 5
+
+    start_timestamp   = chain.time() + STANDARD_TEST_START_DELAY
+    end_timestamp     = start_timestamp + STANDARD_TEST_DURATION
+    launch_parameters = [
+        (start_timestamp + i, end_timestamp, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE) for i in range(auction_count)
+    ]
+
+    auctions = deploy_fund_and_launch_pipelined(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT, launch_parameters)
+
+    assert(len(set(auctions)) == auction_count)
+    for i, dutch_auction in enumerate(auctions):
+        assert(dutch_auction.seller() == seller_account)
+        assert(dutch_auction.getTokenBalance() == STANDARD_TEST_TOKEN_COUNT)
+        assert(dutch_auction.startTimestamp() == start_timestamp + i)
+        assert(dutch_auction.endTimestamp() == end_timestamp)
+
+
+def test_pipeline_resends_reverted_steps(test_token):
+    """
+        Tests that a reverted step is re-sent (after the rest of the plan), and that the deployment addresses are predicted.
+    """
+
+    account   = accounts[1]
+    recipient = accounts[2]
+
+    pipeline = TransactionPipeline(account)
+
+    # The transfer reverts, as the tokens are minted by a later step
+    pipeline.transact(TestToken, test_token, "transfer", recipient, STANDARD_TEST_TOKEN_COUNT)
+    pipeline.transact(TestToken, test_token, "getTokens", STANDARD_TEST_TOKEN_COUNT)
+    token_address = pipeline.deploy(TestToken, "PipelineToken", "PT")
+
+    stats = pipeline.run()
+
+    assert(stats["steps"] == 3)
+    assert(stats["resent"] == 1)
+    assert(all(step.succeeded for step in pipeline.steps))
+    assert(pipeline.steps[0].attempts == 2)
+    assert(test_token.balanceOf(recipient) == STANDARD_TEST_TOKEN_COUNT)
+    assert(TestToken.at(token_address).symbol() == "PT")
+
+
+def test_pipeline_rebroadcasts_timed_out_steps(test_token):
+    """
+        Tests that a step whose receipt is not collected in time is re-broadcast, and that the node rejecting the already
+        mined transaction does not abort the run.
+    """
+
+    account  = accounts[1]
+    pipeline = TransactionPipeline(account)
+    pipeline.transact(TestToken, test_token, "getTokens", STANDARD_TEST_TOKEN_COUNT)
+    pipeline.transact(TestToken, test_token, "getTokens", STANDARD_TEST_TOKEN_COUNT)
+
+    # The first receipt of the first step times out
+    timed_out = []
+    def wait(step):
+        if step is pipeline.steps[0] and not timed_out:
+            timed_out.append(step.tx_hash)
+            return step
+        return TransactionPipeline._wait(pipeline, step)
+    pipeline._wait = wait
+
+    stats = pipeline.run()
+
+    assert(stats["resent"] == 1)
+    assert(all(step.succeeded for step in pipeline.steps))
+    assert(pipeline.steps[0].attempts == 2)
+    assert(pipeline.steps[0].tx_hash == timed_out[0])
+    assert(test_token.balanceOf(account) == 2*STANDARD_TEST_TOKEN_COUNT)
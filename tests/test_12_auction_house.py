@@ -0,0 +1,287 @@
+from brownie import TestToken, accounts, chain, reverts
+from brownie.test import given, strategy
+from scripts.deploy import create_funded_lot
+from scripts.price_engine import current_price
+
+from conftest import (
+    STANDARD_TEST_TOKEN_COUNT,
+    STANDARD_TEST_START_DELAY,
+    STANDARD_TEST_DURATION,
+    STANDARD_TEST_START_PRICE,
+    STANDARD_TEST_RESERVATION_PRICE,
+    STANDARD_TEST_END_MAX_CHECK_DELAY
+)
+
+# Auction house tests ***********************************************************************************************************
+# The DutchAuction property tests, ported to the lots of an AuctionHouse.
+
+
+@given(
+    start_timestamp_delta = strategy('int256', min_value=-3600*12, max_value=3600*12),
+    end_timestamp_delta   = strategy('int256', min_value=-3600*12, max_value=3600*12),
+)
+def test_launch_timestamps(auction_house, funded_lot, start_timestamp_delta, end_timestamp_delta):
+    """
+        Tests the start and end timestamps when launching a lot.
+    """
+
+    seller_account = accounts[0]
+
+    current_timestamp = chain.time()
+    start_timestamp   = current_timestamp + start_timestamp_delta
+    end_timestamp     = current_timestamp + end_timestamp_delta
+    start_price       = STANDARD_TEST_START_PRICE
+    reservation_price = STANDARD_TEST_RESERVATION_PRICE
+
+    # If launch shouldn't be successful
+    if start_timestamp <= current_timestamp or end_timestamp <= start_timestamp:
+        with reverts():
+            auction_house.launch(funded_lot, start_timestamp, end_timestamp, start_price, reservation_price, {"from": seller_account})
+
+    # If launch should be successful
+    else:
+        auction_house.launch(funded_lot, start_timestamp, end_timestamp, start_price, reservation_price, {"from": seller_account})
+
+        lot = auction_house.getLot(funded_lot)
+        assert(lot["startTimestamp"] == start_timestamp)
+        assert(lot["endTimestamp"] == end_timestamp)
+
+
+@given(
+    start_price       = strategy('int256', min_value=0, max_value=STANDARD_TEST_START_PRICE),
+    reservation_price = strategy('int256', min_value=0, max_value=STANDARD_TEST_START_PRICE)
+)
+def test_launch_prices(auction_house, funded_lot, start_price, reservation_price):
+    """
+        Tests the start and reservation price when launching a lot.
+    """
+
+    seller_account = accounts[0]
+
+    current_timestamp = chain.time()
+    start_timestamp   = current_timestamp + STANDARD_TEST_START_DELAY
+    end_timestamp     = start_timestamp   + STANDARD_TEST_DURATION
+
+    # If launch shouldn't be successful
+    if start_price == 0 or reservation_price >= start_price:
+        with reverts():
+            auction_house.launch(funded_lot, start_timestamp, end_timestamp, start_price, reservation_price, {"from": seller_account})
+
+    # If launch should be successful
+    else:
+        auction_house.launch(funded_lot, start_timestamp, end_timestamp, start_price, reservation_price, {"from": seller_account})
+
+        lot = auction_house.getLot(funded_lot)
+        assert(lot["startPrice"] == start_price)
+        assert(lot["reservationPrice"] == reservation_price)
+
+
+@given(
+    seller_account = strategy('address'),
+    launch_account = strategy('address')
+)
+def test_launch_account(test_token, auction_house, seller_account, launch_account):
+    """
+        Tests that a lot can only be launched (once) by its seller.
+    """
+
+    lot_id = create_funded_lot(seller_account, auction_house, test_token, STANDARD_TEST_TOKEN_COUNT)
+
+    current_timestamp = chain.time()
+    start_timestamp   = current_timestamp + STANDARD_TEST_START_DELAY
+    end_timestamp     = start_timestamp   + STANDARD_TEST_DURATION
+    start_price       = STANDARD_TEST_START_PRICE
+    reservation_price = STANDARD_TEST_RESERVATION_PRICE
+
+    # If launch shouldn't be successful
+    if seller_account != launch_account:
+        with reverts():
+            auction_house.launch(lot_id, start_timestamp, end_timestamp, start_price, reservation_price, {"from": launch_account})
+
+    # If launch should be successful
+    else:
+        auction_house.launch(lot_id, start_timestamp, end_timestamp, start_price, reservation_price, {"from": launch_account})
+
+        # Relaunch should always fail
+        with reverts():
+            auction_house.launch(lot_id, start_timestamp, end_timestamp, start_price, reservation_price, {"from": launch_account})
+
+
+@given(
+    buyDelayAfterDeploy = strategy('uint32', min_value=0, max_value=STANDARD_TEST_START_DELAY + STANDARD_TEST_DURATION),
+    buyPriceDelta       = strategy('int256', min_value=-STANDARD_TEST_START_PRICE, max_value=STANDARD_TEST_START_PRICE)
+)
+def test_buy_time_and_price(test_token, auction_house, launched_lot, buyDelayAfterDeploy, buyPriceDelta):
+    """
+        Tests the time and price when placing a bid to a lot.
+    """
+
+    seller_account            = accounts[0]
+    seller_start_balance      = seller_account.balance()
+
+    buyer_account             = accounts[1]
+    buyer_start_balance       = buyer_account.balance()
+    buyer_start_token_balance = test_token.balanceOf(buyer_account)
+
+    lot = auction_house.getLot(launched_lot)
+
+    start_timestamp   = lot["startTimestamp"]
+    end_timestamp     = lot["endTimestamp"]
+    start_price       = STANDARD_TEST_START_PRICE
+    reservation_price = STANDARD_TEST_RESERVATION_PRICE
+
+    # Simulate time delay
+    chain.sleep(buyDelayAfterDeploy)
+    chain.mine()
+
+    buy_timestamp = chain.time()
+
+    # If the auction isn't active, a bid price shouldn't be returned
+    if buy_timestamp < start_timestamp or buy_timestamp >= end_timestamp:
+        with reverts():
+            auction_house.getCurrentPrice(launched_lot)
+        return
+
+    auctionPrice = auction_house.getCurrentPrice(launched_lot)
+
+    # Place a bid
+    buy_price = max(auctionPrice + buyPriceDelta, 0) # Modify the bid price by buyPriceDelta
+
+    try:
+        buyTx = auction_house.buy(launched_lot, {"from": buyer_account, "value": buy_price})
+        buyTx.wait(1)
+
+        bought_price = buyTx.events["LotSold"]["price"] # Get the actual price payed
+
+    except:
+        # If the bid was invalid
+        if buy_timestamp >= end_timestamp or buy_price < auctionPrice: return
+
+        # If the bid was valid
+        else: raise Exception('Should not have reverted')
+
+    # If the bid was invalid
+    if bought_price > buy_price: raise Exception('Insufficient funds, Should have reverted.')
+
+    # Compare the price payed with the one computed off-chain, at the exact timestamp of the bid
+    assert(bought_price == current_price(start_timestamp, end_timestamp, start_price, reservation_price, buyTx.timestamp))
+
+    # Check seller got funds
+    assert(seller_account.balance() == seller_start_balance + bought_price)
+
+    # Check buyer got tokens + excess refund
+    assert(buyer_account.balance() == buyer_start_balance - bought_price)
+    assert(test_token.balanceOf(buyer_account) == buyer_start_token_balance + STANDARD_TEST_TOKEN_COUNT)
+    assert(auction_house.getTokenCount(launched_lot) == 0)
+
+
+def test_buyer(auction_house, launched_lot):
+    """
+        Tests that the buyer is not the seller.
+    """
+
+    chain.sleep(STANDARD_TEST_START_DELAY)
+    chain.mine()
+
+    with reverts():
+        auction_house.buy(launched_lot, {"from": accounts[0], "value": STANDARD_TEST_START_PRICE})
+
+    auction_house.buy(launched_lot, {"from": accounts[1], "value": STANDARD_TEST_START_PRICE})
+
+    # The lot cannot be bought twice
+    with reverts():
+        auction_house.buy(launched_lot, {"from": accounts[2], "value": STANDARD_TEST_START_PRICE})
+
+
+@given(
+    buyDelay = strategy('uint32', min_value=STANDARD_TEST_START_DELAY, max_value=STANDARD_TEST_START_DELAY + STANDARD_TEST_DURATION + STANDARD_TEST_END_MAX_CHECK_DELAY),
+)
+def test_retrieve_tokens(test_token, auction_house, launched_lot, buyDelay):
+    """
+        Tests that the auctioned tokens of a lot can be retrieved by its seller (if available), and only when the lot is
+        not ongoing.
+    """
+
+    seller_account = accounts[0]
+    buyer_account  = accounts[1]
+
+    end_timestamp = auction_house.getLot(launched_lot)["endTimestamp"]
+    start_price   = STANDARD_TEST_START_PRICE
+
+    # Tokens cannot be recovered whilst the auction is launched
+    with reverts():
+        auction_house.retrieveTokens(launched_lot, {"from": seller_account})
+
+    chain.sleep(buyDelay)
+    chain.mine()
+
+    buy_timestamp = chain.time()
+    auctionDeserted = False
+
+    # If the auction is deserted
+    if buy_timestamp >= end_timestamp:
+        with reverts():
+            auction_house.buy(launched_lot, {"from": buyer_account, "value": start_price})
+        auctionDeserted = True
+
+    # If a buyer places a valid bid
+    else:
+        buyTx = auction_house.buy(launched_lot, {"from": buyer_account, "value": start_price})
+        buyTx.wait(1)
+
+    assert(auctionDeserted == auction_house.isLotDeserted(launched_lot))
+
+    # Only the seller can retrieve the tokens
+    with reverts():
+        auction_house.retrieveTokens(launched_lot, {"from": buyer_account})
+
+    # Check tokens
+    sellerTokenBalance = test_token.balanceOf(seller_account)
+    auction_house.retrieveTokens(launched_lot, {"from": seller_account})
+    newSellerTokenBalance = test_token.balanceOf(seller_account)
+    assert(
+        newSellerTokenBalance == sellerTokenBalance + (STANDARD_TEST_TOKEN_COUNT if auctionDeserted else 0)
+    )
+
+
+def test_independent_lots(test_token, auction_house):
+    """
+        Tests that lots of different tokens and sellers, held by the same auction house, are independent.
+    """
+
+    other_token = TestToken.deploy("OtherToken", "OT", {"from": accounts[2]})
+
+    lot_ids = [
+        create_funded_lot(accounts[0], auction_house, test_token, STANDARD_TEST_TOKEN_COUNT),
+        create_funded_lot(accounts[2], auction_house, test_token, 2*STANDARD_TEST_TOKEN_COUNT),
+        create_funded_lot(accounts[2], auction_house, other_token, 3*STANDARD_TEST_TOKEN_COUNT)
+    ]
+    assert(len(set(lot_ids)) == 3)
+    assert(test_token.balanceOf(auction_house) == 3*STANDARD_TEST_TOKEN_COUNT)
+
+    start_timestamp = chain.time() + STANDARD_TEST_START_DELAY
+    end_timestamp   = start_timestamp + STANDARD_TEST_DURATION
+    for lot_id, seller_account in zip(lot_ids, [accounts[0], accounts[2], accounts[2]]):
+        auction_house.launch(lot_id, start_timestamp, end_timestamp, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE, {"from": seller_account})
+
+    chain.sleep(STANDARD_TEST_START_DELAY)
+    chain.mine()
+
+    # Buying a lot leaves the lots of the same token untouched
+    auction_house.buy(lot_ids[1], {"from": accounts[1], "value": STANDARD_TEST_START_PRICE})
+
+    assert(test_token.balanceOf(accounts[1]) == 2*STANDARD_TEST_TOKEN_COUNT)
+    assert(auction_house.getTokenCount(lot_ids[0]) == STANDARD_TEST_TOKEN_COUNT)
+    assert(auction_house.getTokenCount(lot_ids[2]) == 3*STANDARD_TEST_TOKEN_COUNT)
+    assert(auction_house.getCurrentPrice(lot_ids[0]) > 0)
+
+    # Once finished, every seller retrieves the tokens of its own deserted lots only
+    chain.sleep(STANDARD_TEST_DURATION)
+    chain.mine()
+
+    with reverts():
+        auction_house.retrieveTokens(lot_ids[0], {"from": accounts[2]})
+
+    auction_house.retrieveTokens(lot_ids[2], {"from": accounts[2]})
+    assert(other_token.balanceOf(accounts[2]) == 3*STANDARD_TEST_TOKEN_COUNT)
+    assert(test_token.balanceOf(auction_house) == STANDARD_TEST_TOKEN_COUNT)
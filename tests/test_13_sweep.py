@@ -0,0 +1,113 @@
+from brownie import accounts, chain, reverts
+from scripts.auction_reader import deploy_auction_reader
+from scripts.deploy import deploy_and_fund_auction, deploy_auction_factory, deploy_auctions_batch
+from scripts.sweep import find_auctions, find_sweepable, sweep
+
+from conftest import (
+    STANDARD_TEST_TOKEN_COUNT,
+    STANDARD_TEST_START_DELAY,
+    STANDARD_TEST_DURATION,
+    STANDARD_TEST_START_PRICE,
+    STANDARD_TEST_RESERVATION_PRICE
+)
+
+# Auction sweep tests ***********************************************************************************************************
+
+
+def test_sweep(test_token):
+    """
+        Tests that only the finished auctions of an owner are found as sweepable, and swept in gas-bounded chunks.
+    """
+
+    seller_account    = accounts[0]
+    buyer_account     = accounts[1]
+    new_owner_account = accounts[3]
+
+    factory  = deploy_auction_factory(seller_account)
+    reader   = deploy_auction_reader(seller_account)
+    auctions = deploy_auctions_batch(seller_account, test_token, 7, factory)
+
+    # Auctions of another seller
+    deploy_auctions_batch(accounts[2], test_token, 2, factory)
+
+    test_token.getTokens(len(auctions)*STANDARD_TEST_TOKEN_COUNT, {"from": seller_account})
+    for dutch_auction in auctions:
+        test_token.transfer(dutch_auction, STANDARD_TEST_TOKEN_COUNT, {"from": seller_account})
+
+    # The first auction is never launched, the second one is bought, and the rest of them are deserted but the last one,
+    # which is launched later on
+    start_timestamp = chain.time() + STANDARD_TEST_START_DELAY
+    end_timestamp   = start_timestamp + STANDARD_TEST_DURATION
+    for dutch_auction in auctions[1:-1]:
+        dutch_auction.launchAuction(start_timestamp, end_timestamp, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE, {"from": seller_account})
+
+    chain.sleep(STANDARD_TEST_START_DELAY)
+    chain.mine()
+    auctions[1].buy({"from": buyer_account, "value": STANDARD_TEST_START_PRICE})
+
+    chain.sleep(STANDARD_TEST_DURATION)
+    chain.mine()
+    auctions[-1].launchAuction(chain.time() + STANDARD_TEST_START_DELAY, chain.time() + STANDARD_TEST_START_DELAY + STANDARD_TEST_DURATION, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE, {"from": seller_account})
+
+    found = find_auctions(factory, seller_account)
+    assert(found == [dutch_auction.address for dutch_auction in auctions])
+    assert(find_auctions(factory, seller_account, block_range=1) == found)
+    assert(len(find_auctions(factory)) == len(auctions) + 2)
+
+    # Ownership is transferable: the auctions are swept by their current owner, whatever their seller
+    auctions[2].transferOwnership(new_owner_account, {"from": seller_account})
+    assert(find_sweepable(reader, find_auctions(factory), new_owner_account) == [auctions[2].address])
+
+    # The sold auction holds no tokens
+    sweepable = find_sweepable(reader, find_auctions(factory), seller_account)
+    assert(sweepable == [dutch_auction.address for dutch_auction in auctions[3:-1]])
+
+    # Sweep in chunks of (at most) two auctions
+    seller_start_token_balance = test_token.balanceOf(seller_account)
+    single_gas = factory.sweepAuctions.estimate_gas(sweepable[:1], {"from": seller_account})
+    txs = sweep(factory, seller_account, sweepable, gas_budget=2*single_gas)
+
+    assert(len(txs) >= 2)
+    assert(test_token.balanceOf(seller_account) == seller_start_token_balance + len(sweepable)*STANDARD_TEST_TOKEN_COUNT)
+    assert(find_sweepable(reader, found, seller_account) == [])
+
+    # The tokens are always retrieved to the seller
+    sweep(factory, new_owner_account, [auctions[2]])
+    assert(test_token.balanceOf(seller_account) == seller_start_token_balance + (len(sweepable) + 1)*STANDARD_TEST_TOKEN_COUNT)
+
+    for dutch_auction in auctions[2:-1]:
+        assert(dutch_auction.getTokenBalance() == 0)
+
+
+def test_sweep_permissions(test_token):
+    """
+        Tests that the factory only sweeps its own clones, on behalf of their owner, and never ongoing auctions.
+    """
+
+    seller_account = accounts[0]
+
+    factory       = deploy_auction_factory(seller_account)
+    dutch_auction = deploy_auctions_batch(seller_account, test_token, 1, factory)[0]
+    plain_auction = deploy_and_fund_auction(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT)
+
+    # Not the owner
+    with reverts('The caller is not the owner of the auction'):
+        factory.sweepAuctions([dutch_auction], {"from": accounts[1]})
+
+    # Auctions deployed via the constructor cannot be managed by the factory
+    with reverts():
+        factory.sweepAuctions([plain_auction], {"from": seller_account})
+
+    # Nor by any other factory
+    other_factory = deploy_auction_factory(seller_account)
+    with reverts():
+        other_factory.sweepAuctions([dutch_auction], {"from": seller_account})
+
+    # Ongoing auctions cannot be swept
+    test_token.getTokens(STANDARD_TEST_TOKEN_COUNT, {"from": seller_account})
+    test_token.transfer(dutch_auction, STANDARD_TEST_TOKEN_COUNT, {"from": seller_account})
+    start_timestamp = chain.time() + STANDARD_TEST_START_DELAY
+    dutch_auction.launchAuction(start_timestamp, start_timestamp + STANDARD_TEST_DURATION, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE, {"from": seller_account})
+
+    with reverts():
+        factory.sweepAuctions([dutch_auction], {"from": seller_account})
@@ -0,0 +1,139 @@
+from brownie import accounts, chain, history
+from brownie.exceptions import VirtualMachineError
+from brownie.test import strategy
+from scripts.auction_model import AuctionModel
+from scripts.auction_state import get_auction_state
+
+from conftest import (
+    STANDARD_TEST_TOKEN_COUNT,
+    STANDARD_TEST_DURATION,
+    STANDARD_TEST_START_PRICE
+)
+
+# Stateful auction tests ********************************************************************************************************
+# Random sequences of transitions (fund, launch, sleep, buy and retrieve) on a single auction, checked step by step against a
+# pure Python reference model (scripts/auction_model.py). The auction is deployed once, and the chain is reverted to that
+# point before every sequence (see brownie.test.stateful).
+
+ACCOUNT_COUNT = 4                       # accounts[0] is the seller
+
+
+class AuctionStateMachine:
+
+    caller         = strategy('address', length=ACCOUNT_COUNT)
+    token_count    = strategy('uint256', max_value=STANDARD_TEST_TOKEN_COUNT)
+    start_delta    = strategy('int256', min_value=-3600, max_value=3600*24)
+    duration       = strategy('int256', min_value=-3600, max_value=STANDARD_TEST_DURATION)
+    start_price    = strategy('uint256', max_value=STANDARD_TEST_START_PRICE)
+    price_fraction = strategy('uint8')
+    sleep_time     = strategy('uint32', max_value=STANDARD_TEST_DURATION)
+    value_delta    = strategy('int256', min_value=-STANDARD_TEST_START_PRICE//10, max_value=STANDARD_TEST_START_PRICE//10)
+
+    def __init__(cls, test_token, deployed_auction):
+        cls.token   = test_token
+        cls.auction = deployed_auction
+
+    def setup(self):
+        self.model  = AuctionModel(accounts[0])
+        self.minted = self.token.totalSupply()
+
+    def _transact(self, fn, *args):
+        # Returns the receipt of the transaction, and whether it succeeded (reverted transactions are still mined)
+        try:
+            return fn(*args), True
+        except VirtualMachineError:
+            return history[-1], False
+
+    def rule_fund(self, caller, token_count):
+        self.token.getTokens(token_count, {"from": caller})
+        self.token.transfer(self.auction, token_count, {"from": caller})
+
+        self.minted += token_count
+        self.model.fund(token_count)
+
+    def rule_launch(self, caller, start_delta, duration, start_price, price_fraction):
+        start_timestamp   = chain.time() + start_delta
+        end_timestamp     = start_timestamp + duration
+        reservation_price = start_price*price_fraction // 200 # Up to (but not including) 1.275 times the start price
+
+        tx, success = self._transact(
+            self.auction.launchAuction, start_timestamp, end_timestamp, start_price, reservation_price, {"from": caller}
+        )
+
+        assert(success == self.model.launch(caller, start_timestamp, end_timestamp, start_price, reservation_price, tx.timestamp))
+
+    def rule_sleep(self, sleep_time):
+        chain.sleep(sleep_time)
+        chain.mine()
+
+    def rule_buy(self, caller, value_delta):
+        value = max(self.model.price(chain.time()) + value_delta, 0)
+
+        seller_balance        = accounts[0].balance()
+        buyer_token_balance   = self.token.balanceOf(caller)
+        auction_token_balance = self.model.token_balance
+
+        tx, success = self._transact(self.auction.buy, {"from": caller, "value": value})
+        price = self.model.buy(caller, value, tx.timestamp)
+
+        assert(success == (price > 0))
+        if success:
+            assert(tx.return_value == price)
+            assert(accounts[0].balance() == seller_balance + price)
+            assert(self.token.balanceOf(caller) == buyer_token_balance + auction_token_balance)
+
+    def rule_retrieve_tokens(self, caller):
+        seller_token_balance  = self.token.balanceOf(accounts[0])
+        auction_token_balance = self.model.token_balance
+
+        tx, success = self._transact(self.auction.retrieveTokens, {"from": caller})
+
+        assert(success == self.model.retrieve_tokens(caller, tx.timestamp))
+        if success:
+            assert(self.token.balanceOf(accounts[0]) == seller_token_balance + auction_token_balance)
+
+    def rule_retrieve_funds(self, caller):
+        _, success = self._transact(self.auction.retrieveFunds, {"from": caller})
+
+        assert(success == self.model.retrieve_funds(caller))
+
+    def rule_send_funds(self, caller):
+        _, success = self._transact(caller.transfer, self.auction, 1)
+
+        assert(not success)
+
+    def invariant_state(self):
+        state = get_auction_state(self.auction)
+        model = self.model
+
+        assert(state.ready == model.ready)
+        assert(state.started == model.started(state.timestamp))
+        assert(state.finished == model.finished(state.timestamp))
+        assert(state.ongoing == model.ongoing(state.timestamp))
+        assert(state.deserted == model.deserted(state.timestamp))
+        assert(state.buyer == model.buyer)
+        assert(state.start_timestamp == model.start_timestamp)
+        assert(state.end_timestamp == model.end_timestamp)
+        assert(state.start_price == model.start_price)
+        assert(state.reservation_price == model.reservation_price)
+        assert(state.current_price == model.price(state.timestamp))
+        assert(state.token_balance == model.token_balance)
+
+    def invariant_tokens(self):
+        # Tokens are only ever moved between the auction and the accounts
+        balances = sum(self.token.balanceOf(account) for account in accounts[:ACCOUNT_COUNT])
+        assert(self.token.balanceOf(self.auction) + balances == self.minted)
+
+        # The auction never holds ETH
+        assert(self.auction.balance() == 0)
+
+
+def test_auction_lifecycle(state_machine, test_token, deployed_auction):
+    """
+        Runs random sequences of auction transitions against the reference model.
+    """
+
+    state_machine(
+        AuctionStateMachine, test_token, deployed_auction,
+        settings={"max_examples": 25, "stateful_step_count": 40}
+    )
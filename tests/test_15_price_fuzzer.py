@@ -0,0 +1,71 @@
+import random
+
+from pytest import skip
+from brownie import web3
+from scripts.price_fuzzer import (
+    FuzzCase, PriceFuzzer, PriceFuzzerError, auction_storage, is_valid_case, random_case, reference_price, shrink
+)
+
+# Price fuzzer tests ************************************************************************************************************
+
+
+def test_auction_storage(launched_auction):
+    """
+        Tests that the storage overrides of the fuzzer match the storage layout of a launched auction.
+    """
+
+    dutch_auction = launched_auction
+
+    case = FuzzCase(
+        dutch_auction.startTimestamp(), dutch_auction.endTimestamp(), dutch_auction.startPrice(),
+        dutch_auction.reservationPrice(), 0
+    )
+
+    for slot, value in auction_storage(dutch_auction.seller(), case).items():
+        assert(int.from_bytes(web3.eth.get_storage_at(dutch_auction.address, slot), "big") == value)
+
+
+def test_random_cases():
+    """
+        Tests that the random cases are valid launches, and cover the prices before, during and after the auction.
+    """
+
+    rng   = random.Random(0)
+    cases = [random_case(rng) for _ in range(10000)]
+
+    assert(all(is_valid_case(case) for case in cases))
+    assert(any(case.timestamp < case.start_timestamp for case in cases))
+    assert(any(case.timestamp >= case.end_timestamp for case in cases))
+    assert(sum(reference_price(case) > 0 for case in cases) > 1000)
+
+
+def test_shrink():
+    """
+        Tests that a mismatching case is shrunk to a minimal one.
+    """
+
+    # A fake mismatch, on the last second of the auctions with a price range larger than 10
+    def mismatches(cases):
+        return [
+            case.timestamp == case.end_timestamp - 1 and case.start_price - case.reservation_price > 10 for case in cases
+        ]
+
+    case = FuzzCase(1640995200, 1640995200 + 3600*24*7, 10**19, 10**18, 1640995200 + 3600*24*7 - 1)
+
+    assert(shrink(case, mismatches) == FuzzCase(1, 2, 11, 0, 1))
+
+
+def test_price_fuzzer(deployed_auction):
+    """
+        Tests the contract prices against the price engine, if the node supports eth_call overrides (ganache does not).
+    """
+
+    try:
+        fuzzer = PriceFuzzer(deployed_auction)
+    except PriceFuzzerError as exc:
+        skip(str(exc))
+
+    report = fuzzer.run(2000, seed=0)
+
+    assert(report["mismatches"] == 0)
+    assert(report["counterexample"] is None)
@@ -0,0 +1,93 @@
+from brownie import accounts, chain, reverts
+from scripts.auction_cache import AuctionClient, LRUCache
+
+from conftest import (
+    STANDARD_TEST_START_DELAY,
+    STANDARD_TEST_START_PRICE
+)
+
+# Auction read cache tests ******************************************************************************************************
+
+
+def test_block_cache(launched_auction):
+    """
+        Tests that the views are read once per block, and read again after a new block is mined.
+    """
+
+    dutch_auction = launched_auction
+    client        = AuctionClient()
+
+    client.refresh()
+    for _ in range(5):
+        assert(client.call(dutch_auction, "getTokenBalance") == dutch_auction.getTokenBalance())
+        assert(client.get_auction_state(dutch_auction).ready)
+
+    assert(client.misses == 2)
+    assert(client.hits == 8)
+
+    # Same block
+    client.refresh()
+    client.call(dutch_auction, "getTokenBalance")
+    assert(client.misses == 2)
+
+    chain.mine()
+    client.refresh()
+    client.call(dutch_auction, "getTokenBalance")
+    assert(client.misses == 3)
+
+
+def test_final_views(deployed_auction, test_token):
+    """
+        Tests that the launch parameters are only cached across blocks once the auction has been launched.
+    """
+
+    dutch_auction = deployed_auction
+    client        = AuctionClient()
+
+    assert(client.call(dutch_auction, "seller") == accounts[0])
+    assert(client.call(dutch_auction, "startPrice") == 0)
+
+    test_token.getTokens(1, {"from": accounts[0]})
+    test_token.transfer(dutch_auction, 1, {"from": accounts[0]})
+    start_timestamp = chain.time() + STANDARD_TEST_START_DELAY
+    dutch_auction.launchAuction(start_timestamp, start_timestamp + 3600, STANDARD_TEST_START_PRICE, 0, {"from": accounts[0]})
+
+    client.refresh()
+    assert(client.call(dutch_auction, "startPrice") == STANDARD_TEST_START_PRICE)
+    misses = client.misses
+
+    chain.mine()
+    client.refresh()
+    assert(client.call(dutch_auction, "seller") == accounts[0])
+    assert(client.call(dutch_auction, "startPrice") == STANDARD_TEST_START_PRICE)
+    assert(client.call(dutch_auction, "reservationPrice") == 0)
+    assert(client.misses == misses + 1) # Only reservationPrice, as the auction is known to be launched
+
+
+def test_cached_reverts(launched_auction):
+    """
+        Tests that the reverts of the views are cached (and raised) as well.
+    """
+
+    client = AuctionClient()
+
+    for _ in range(3):
+        with reverts():
+            client.call(launched_auction, "getCurrentPrice")
+
+    assert(client.misses == 1)
+
+
+def test_lru_cache():
+    """
+        Tests that the least recently used entries are evicted first.
+    """
+
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert("a" in cache and "c" in cache and "b" not in cache)
+    assert(cache.evictions == 1)
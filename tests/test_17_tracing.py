@@ -0,0 +1,56 @@
+from brownie import accounts, chain, reverts, web3
+from scripts.deploy import deploy_and_fund_auction
+from scripts.tracing import Tracer, summarize
+
+from conftest import (
+    STANDARD_TEST_TOKEN_COUNT,
+    STANDARD_TEST_START_DELAY,
+    STANDARD_TEST_DURATION,
+    STANDARD_TEST_START_PRICE,
+    STANDARD_TEST_RESERVATION_PRICE
+)
+
+# Tracing tests *****************************************************************************************************************
+
+
+def test_tracing(test_token, tmp_path):
+    """
+        Tests that the transactions are recorded with their span, latency, gas and status, and that the launchAuction hot
+        spots are traced.
+    """
+
+    tracer = Tracer(tmp_path / "trace.json")
+    web3.middleware_onion.add(tracer.middleware, name="test_tracer")
+
+    try:
+        with tracer.span("setup") as span:
+            dutch_auction = deploy_and_fund_auction(accounts[0], test_token, STANDARD_TEST_TOKEN_COUNT)
+
+            start_timestamp = chain.time() + STANDARD_TEST_START_DELAY
+            dutch_auction.launchAuction(start_timestamp, start_timestamp + STANDARD_TEST_DURATION, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE, {"from": accounts[0]})
+
+        with reverts():
+            dutch_auction.buy({"from": accounts[1], "value": STANDARD_TEST_START_PRICE})
+    finally:
+        web3.middleware_onion.remove("test_tracer")
+
+    trace   = tracer.as_dict()
+    records = trace["transactions"]
+
+    assert(span["transactions"] == 4)
+    assert(span["rpc_calls"] > 0 and span["elapsed"] >= span["rpc_time"])
+    assert([record["name"] for record in records] == [
+        "deployment", "TestToken.getTokens", "TestToken.transfer", "DutchAuction.launchAuction", "DutchAuction.buy"
+    ])
+    assert(all(record["latency"] > 0 and record["gas_used"] > 0 for record in records))
+    assert([record["span"] for record in records] == ["setup"]*4 + [None])
+
+    assert(records[-1]["status"] == 0)
+
+    if web3.supports_traces:
+        spots = trace["hot_spots"]["DutchAuction.launchAuction"]
+        assert(spots["transactions"] == 1)
+        assert(spots["by_opcode"]["SSTORE"] > 0)
+
+    tracer.write()
+    assert(summarize(trace))
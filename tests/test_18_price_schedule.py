@@ -0,0 +1,62 @@
+import csv
+import random
+
+from brownie import accounts
+from scripts.auction_reader import deploy_auction_reader
+from scripts.indexer import AuctionIndexer
+from scripts.price_engine import current_price
+from scripts.price_schedule import LaunchParameters, export_schedules, launches_from_chain, launches_from_index
+
+# Price schedule exporter tests *************************************************************************************************
+
+
+def test_export_schedules(tmp_path):
+    """
+        Tests that the exported schedules match the price engine row by row, including prices which do not fit in an int64,
+        with schedules split across chunks.
+    """
+
+    rng      = random.Random(0)
+    launches = []
+    for i in range(20):
+        start_timestamp = rng.randint(1, 2**32)
+        start_price     = rng.choice([rng.randint(1, 10**20), rng.randint(1, 2**128 - 1)])
+        launches.append(LaunchParameters(
+            f"0x{i:040x}", start_timestamp, start_timestamp + rng.randint(1, 10**5), start_price, rng.randint(0, start_price - 1)
+        ))
+
+    path  = tmp_path / "schedule.csv"
+    stats = export_schedules(launches, path, resolution=997, rows_per_chunk=250)
+
+    with open(path, newline="") as schedule_file:
+        rows = list(csv.reader(schedule_file))[1:]
+
+    expected_rows = [
+        [launch.address, str(timestamp), str(current_price(*launch[1:], timestamp))]
+        for launch in launches for timestamp in range(launch.start_timestamp, launch.end_timestamp, 997)
+    ]
+
+    assert(rows == expected_rows)
+    assert(stats["rows"] == len(rows) and stats["auctions"] == len(launches))
+    assert(stats["chunks"] == -(-len(rows) // 250))
+
+
+def test_launch_sources(launched_auction, deployed_auction, tmp_path):
+    """
+        Tests that the launch parameters of the launched auctions are read from the chain and from the event index.
+    """
+
+    expected = [LaunchParameters(
+        launched_auction.address, launched_auction.startTimestamp(), launched_auction.endTimestamp(),
+        launched_auction.startPrice(), launched_auction.reservationPrice()
+    )]
+
+    reader = deploy_auction_reader(accounts[0])
+    assert(list(launches_from_chain(reader, [deployed_auction, launched_auction], chunk_size=1)) == expected)
+
+    db_path = tmp_path / "auctions.db"
+    indexer = AuctionIndexer(db_path, addresses=[launched_auction, deployed_auction])
+    indexer.run()
+    indexer.close()
+
+    assert(list(launches_from_index(db_path)) == expected)
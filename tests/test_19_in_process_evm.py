@@ -0,0 +1,22 @@
+import subprocess
+
+from pytest import importorskip
+
+# In-process EVM backend tests **************************************************************************************************
+
+SMOKE_TEST_MODULES = ["tests/test_1_launch_stage.py", "tests/test_4_misc.py"]
+
+
+def test_in_process_evm():
+    """
+        Tests that existing test modules (deployments, launches, time jumps, isolation and reverts) pass on the in-process
+        EVM backend. Skipped if eth-tester is not installed.
+    """
+
+    importorskip("eth_tester")
+
+    result = subprocess.run(
+        ["brownie", "test", *SMOKE_TEST_MODULES, "--evm", "in-process"], capture_output=True, text=True
+    )
+
+    assert(result.returncode == 0), result.stdout[-5000:]
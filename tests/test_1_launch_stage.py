@@ -17,14 +17,14 @@ from conftest import (
     start_timestamp_delta = strategy('int256', min_value=-3600*12, max_value=3600*12),
     end_timestamp_delta   = strategy('int256', min_value=-3600*12, max_value=3600*12),
 )
-def test_launch_timestamps(test_token, start_timestamp_delta, end_timestamp_delta):
+def test_launch_timestamps(funded_auction, start_timestamp_delta, end_timestamp_delta):
     """
         Tests the start and end timestamps when launching the auction.
     """
 
     seller_account = accounts[0]
 
-    dutch_auction = deploy_and_fund_auction(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT)
+    dutch_auction = funded_auction
 
     current_timestamp = chain.time()
     start_timestamp   = current_timestamp + start_timestamp_delta
@@ -51,14 +51,14 @@ def test_launch_timestamps(test_token, start_timestamp_delta, end_timestamp_delt
     start_price       = strategy('int256', min_value=0, max_value=STANDARD_TEST_START_PRICE),
     reservation_price = strategy('int256', min_value=0, max_value=STANDARD_TEST_START_PRICE)
 )
-def test_launch_prices(test_token, start_price, reservation_price):
+def test_launch_prices(funded_auction, start_price, reservation_price):
     """
         Tests the start and reservation price when launching the auction.
     """
 
     seller_account = accounts[0]
 
-    dutch_auction = deploy_and_fund_auction(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT)
+    dutch_auction = funded_auction
 
     current_timestamp = chain.time()
     start_timestamp   = current_timestamp + STANDARD_TEST_START_DELAY
@@ -1,14 +1,15 @@
 from brownie import accounts, chain, reverts
 from brownie.test import given, strategy
 from scripts.deploy import deploy_and_fund_auction
+from scripts.auction_state import get_auction_state
+from scripts.price_engine import current_price
 
 from conftest import (
     STANDARD_TEST_TOKEN_COUNT,
     STANDARD_TEST_START_DELAY,
     STANDARD_TEST_DURATION,
     STANDARD_TEST_START_PRICE,
-    STANDARD_TEST_RESERVATION_PRICE,
-    STANDARD_TEST_PRICE_CHECK_MARGIN
+    STANDARD_TEST_RESERVATION_PRICE
 )
 
 # Bidding auction stage tests ***************************************************************************************************
@@ -18,7 +19,7 @@ from conftest import (
     buyDelayAfterDeploy = strategy('uint32', min_value=0, max_value=STANDARD_TEST_START_DELAY + STANDARD_TEST_DURATION),
     buyPriceDelta       = strategy('int256', min_value=-STANDARD_TEST_START_PRICE, max_value=STANDARD_TEST_START_PRICE)
 )
-def test_buy_time_and_price(test_token, buyDelayAfterDeploy, buyPriceDelta):
+def test_buy_time_and_price(test_token, launched_auction, buyDelayAfterDeploy, buyPriceDelta):
     """
         Tests the time and price when placing a bid to the auction.
     """
@@ -30,17 +31,13 @@ def test_buy_time_and_price(test_token, buyDelayAfterDeploy, buyPriceDelta):
     buyer_start_balance       = buyer_account.balance()
     buyer_start_token_balance = test_token.balanceOf(buyer_account)
 
-    dutch_auction = deploy_and_fund_auction(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT)
+    dutch_auction = launched_auction
 
-    current_timestamp = chain.time()
-    start_timestamp   = current_timestamp + STANDARD_TEST_START_DELAY
-    end_timestamp     = start_timestamp + STANDARD_TEST_DURATION
+    start_timestamp   = dutch_auction.startTimestamp()
+    end_timestamp     = dutch_auction.endTimestamp()
     start_price       = STANDARD_TEST_START_PRICE
     reservation_price = STANDARD_TEST_RESERVATION_PRICE
 
-    launch_tx = dutch_auction.launchAuction(start_timestamp, end_timestamp, start_price, reservation_price, {"from": seller_account})
-    launch_tx.wait(1)
-
     # Simulate time delay
     chain.sleep(buyDelayAfterDeploy)
     chain.mine()
@@ -53,15 +50,11 @@ def test_buy_time_and_price(test_token, buyDelayAfterDeploy, buyPriceDelta):
             dutch_auction.getCurrentPrice()
         return
     
-    # Compare the returned bid price with a calculated one. Note that a small error defined by 
-    # STANDARD_TEST_PRICE_CHECK_MARGIN is allowed
-    auctionPrice = dutch_auction.getCurrentPrice()
+    # Compare the auction price with the one computed off-chain, at the exact timestamp of the snapshot
+    state = get_auction_state(dutch_auction)
+    assert(state.current_price == current_price(start_timestamp, end_timestamp, start_price, reservation_price, state.timestamp))
 
-    ellapsedTime = buy_timestamp - start_timestamp
-    expectedPriceMax = start_price - int((start_price - reservation_price)/(end_timestamp - start_timestamp)*(ellapsedTime - STANDARD_TEST_PRICE_CHECK_MARGIN))
-    expectedPriceMin = start_price - int((start_price - reservation_price)/(end_timestamp - start_timestamp)*(ellapsedTime + STANDARD_TEST_PRICE_CHECK_MARGIN))
-    
-    assert (auctionPrice <= expectedPriceMax and auctionPrice >= expectedPriceMin)
+    auctionPrice = dutch_auction.getCurrentPrice()
 
 
     # Place a bid
@@ -85,6 +78,9 @@ def test_buy_time_and_price(test_token, buyDelayAfterDeploy, buyPriceDelta):
     # If the bid was invalid
     if bought_price > buy_price: raise Exception('Insufficient funds, Should have reverted.')
 
+    # Compare the price payed with the one computed off-chain, at the exact timestamp of the bid
+    assert(bought_price == current_price(start_timestamp, end_timestamp, start_price, reservation_price, buyTx.timestamp))
+
 
     # Check seller got funds
     assert(seller_account.balance() == seller_start_balance + bought_price)
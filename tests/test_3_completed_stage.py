@@ -47,23 +47,16 @@ def test_relaunch(test_token, seller_account, relaunch_account):
     initial_buy_delay = strategy('uint32', min_value=STANDARD_TEST_START_DELAY, max_value=STANDARD_TEST_START_DELAY + STANDARD_TEST_DURATION),
     after_completion_buy_delay = strategy('uint32', min_value=0, max_value=STANDARD_TEST_END_MAX_CHECK_DELAY),
 )
-def test_buy(test_token, initial_buy_delay, after_completion_buy_delay):
+def test_buy(launched_auction, initial_buy_delay, after_completion_buy_delay):
     """
         Tests that a bid price cannot be returned by the auction nor that a bid can be placed after the auction completes
     """
-    seller_account = accounts[0]
     buyer_account  = accounts[1]
 
-    dutch_auction = deploy_and_fund_auction(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT)
+    dutch_auction = launched_auction
 
-    current_timestamp = chain.time()
-    start_timestamp   = current_timestamp + STANDARD_TEST_START_DELAY
-    end_timestamp     = start_timestamp   + STANDARD_TEST_DURATION
+    end_timestamp     = dutch_auction.endTimestamp()
     start_price       = STANDARD_TEST_START_PRICE
-    reservation_price = STANDARD_TEST_RESERVATION_PRICE
-
-    launch_tx = dutch_auction.launchAuction(start_timestamp, end_timestamp, start_price, reservation_price, {"from": seller_account})
-    launch_tx.wait(1)
 
     chain.sleep(initial_buy_delay)
     chain.mine()
@@ -95,7 +88,7 @@ def test_buy(test_token, initial_buy_delay, after_completion_buy_delay):
 @given(
     buyDelay = strategy('uint32', min_value=STANDARD_TEST_START_DELAY, max_value=STANDARD_TEST_START_DELAY + STANDARD_TEST_DURATION + STANDARD_TEST_END_MAX_CHECK_DELAY),
 )
-def test_retrieve_tokens(test_token, buyDelay):
+def test_retrieve_tokens(test_token, launched_auction, buyDelay):
     """
         Tests that the auctioned tokens can be retrieved by the seller (if available).
     """
@@ -103,16 +96,10 @@ def test_retrieve_tokens(test_token, buyDelay):
     seller_account = accounts[0]
     buyer_account  = accounts[1]
 
-    dutch_auction = deploy_and_fund_auction(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT)
+    dutch_auction = launched_auction
 
-    current_timestamp = chain.time()
-    start_timestamp   = current_timestamp + STANDARD_TEST_START_DELAY
-    end_timestamp     = start_timestamp   + STANDARD_TEST_DURATION
+    end_timestamp     = dutch_auction.endTimestamp()
     start_price       = STANDARD_TEST_START_PRICE
-    reservation_price = STANDARD_TEST_RESERVATION_PRICE
-
-    launch_tx = dutch_auction.launchAuction(start_timestamp, end_timestamp, start_price, reservation_price, {"from": seller_account})
-    launch_tx.wait(1)
 
     chain.sleep(buyDelay)
     chain.mine()
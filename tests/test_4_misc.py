@@ -7,13 +7,13 @@ from conftest import STANDARD_TEST_TOKEN_COUNT
 # Misc tests ********************************************************************************************************************
 
 
-def test_send_funds_to_contract(test_token):
+def test_send_funds_to_contract(funded_auction):
     """
         Tests that ETH cannot be sent to the contract via a transfer call.
     """
 
     seller_account = accounts[0]
-    dutch_auction = deploy_and_fund_auction(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT)
+    dutch_auction = funded_auction
 
     with reverts():
         seller_account.transfer(dutch_auction, 1)
@@ -0,0 +1,178 @@
+from brownie import DutchAuction, accounts, chain, reverts
+from brownie.test import given, strategy
+from scripts.deploy import deploy_auction_factory, deploy_auctions_batch, deploy_fund_and_launch
+
+from conftest import (
+    STANDARD_TEST_TOKEN_COUNT,
+    STANDARD_TEST_START_DELAY,
+    STANDARD_TEST_DURATION,
+    STANDARD_TEST_START_PRICE,
+    STANDARD_TEST_RESERVATION_PRICE
+)
+
+# Auction factory tests *********************************************************************************************************
+
+
+@given(
+    seller_account = strategy('address'),
+    auction_count  = strategy('uint8', min_value=1, max_value=10)
+)
+def test_deploy_auctions_batch(test_token, seller_account, auction_count):
+    """
+        Tests that a batch of auction clones is created in a single transaction, owned by the caller.
+    """
+
+    factory  = deploy_auction_factory(accounts[0])
+    auctions = deploy_auctions_batch(seller_account, test_token, auction_count, factory)
+
+    assert(len(auctions) == auction_count)
+    assert(len(set(auctions)) == auction_count)
+
+    for dutch_auction in auctions:
+        assert(dutch_auction.seller() == seller_account)
+        assert(dutch_auction.owner() == seller_account)
+        assert(dutch_auction.token() == test_token)
+        assert(not dutch_auction.isAuctionReady())
+
+
+@given(
+    initialize_account = strategy('address')
+)
+def test_initialize_once(test_token, initialize_account):
+    """
+        Tests that neither the clones nor the implementation can be (re)initialized by anyone.
+    """
+
+    factory = deploy_auction_factory(accounts[0])
+    dutch_auction = deploy_auctions_batch(accounts[0], test_token, 1, factory)[0]
+
+    with reverts():
+        dutch_auction.initialize(test_token, initialize_account, {"from": initialize_account})
+
+    with reverts():
+        DutchAuction.at(factory.implementation()).initialize(test_token, initialize_account, {"from": initialize_account})
+
+
+def test_clone_auction(test_token):
+    """
+        Tests a full auction (fund, launch and buy) on a clone.
+    """
+
+    seller_account = accounts[0]
+    buyer_account  = accounts[1]
+
+    dutch_auction = deploy_auctions_batch(seller_account, test_token, 1)[0]
+
+    test_token.getTokens(STANDARD_TEST_TOKEN_COUNT, {"from": seller_account})
+    test_token.transfer(dutch_auction, STANDARD_TEST_TOKEN_COUNT, {"from": seller_account})
+
+    start_timestamp = chain.time() + STANDARD_TEST_START_DELAY
+    end_timestamp   = start_timestamp + STANDARD_TEST_DURATION
+
+    dutch_auction.launchAuction(start_timestamp, end_timestamp, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE, {"from": seller_account})
+
+    chain.sleep(STANDARD_TEST_START_DELAY)
+    chain.mine()
+
+    buyer_start_token_balance = test_token.balanceOf(buyer_account)
+    dutch_auction.buy({"from": buyer_account, "value": STANDARD_TEST_START_PRICE})
+
+    assert(test_token.balanceOf(buyer_account) == buyer_start_token_balance + STANDARD_TEST_TOKEN_COUNT)
+    assert(dutch_auction.buyer() == buyer_account)
+
+
+@given(
+    seller_account = strategy('address'),
+    token_count    = strategy('uint256', min_value=1, max_value=10**24)
+)
+def test_deploy_fund_and_launch(test_token, seller_account, token_count):
+    """
+        Tests that an auction is created, funded and launched in a single transaction (after a one-off approval).
+    """
+
+    factory = deploy_auction_factory(accounts[0])
+    test_token.getTokens(token_count, {"from": seller_account})
+    seller_start_token_balance = test_token.balanceOf(seller_account)
+
+    start_timestamp = chain.time() + STANDARD_TEST_START_DELAY
+    end_timestamp   = start_timestamp + STANDARD_TEST_DURATION
+
+    dutch_auction = deploy_fund_and_launch(
+        seller_account, test_token, token_count, start_timestamp, end_timestamp,
+        STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE, factory
+    )
+
+    assert(dutch_auction.seller() == seller_account)
+    assert(dutch_auction.owner() == seller_account)
+    assert(dutch_auction.isAuctionReady())
+    assert(dutch_auction.startTimestamp() == start_timestamp)
+    assert(dutch_auction.endTimestamp() == end_timestamp)
+    assert(dutch_auction.startPrice() == STANDARD_TEST_START_PRICE)
+    assert(dutch_auction.reservationPrice() == STANDARD_TEST_RESERVATION_PRICE)
+    assert(dutch_auction.getTokenBalance() == token_count)
+    assert(test_token.balanceOf(seller_account) == seller_start_token_balance - token_count)
+    assert(test_token.allowance(seller_account, factory) == 0)
+
+
+def test_create_and_launch_auction_checks(test_token):
+    """
+        Tests that the single transaction path requires the factory allowance, and applies the launchAuction checks.
+    """
+
+    seller_account = accounts[0]
+
+    factory = deploy_auction_factory(seller_account)
+    test_token.getTokens(STANDARD_TEST_TOKEN_COUNT, {"from": seller_account})
+
+    start_timestamp = chain.time() + STANDARD_TEST_START_DELAY
+    end_timestamp   = start_timestamp + STANDARD_TEST_DURATION
+
+    # No allowance
+    with reverts():
+        factory.createAndLaunchAuction(
+            test_token, STANDARD_TEST_TOKEN_COUNT, start_timestamp, end_timestamp, STANDARD_TEST_START_PRICE,
+            STANDARD_TEST_RESERVATION_PRICE, {"from": seller_account}
+        )
+
+    test_token.approve(factory, STANDARD_TEST_TOKEN_COUNT, {"from": seller_account})
+
+    with reverts('There are no tokens to auction'):
+        factory.createAndLaunchAuction(
+            test_token, 0, start_timestamp, end_timestamp, STANDARD_TEST_START_PRICE,
+            STANDARD_TEST_RESERVATION_PRICE, {"from": seller_account}
+        )
+
+    with reverts('The start date cannot be after the end date'):
+        factory.createAndLaunchAuction(
+            test_token, STANDARD_TEST_TOKEN_COUNT, end_timestamp, start_timestamp, STANDARD_TEST_START_PRICE,
+            STANDARD_TEST_RESERVATION_PRICE, {"from": seller_account}
+        )
+
+    with reverts('The reservation price must be smaller than the start price.'):
+        factory.createAndLaunchAuction(
+            test_token, STANDARD_TEST_TOKEN_COUNT, start_timestamp, end_timestamp, STANDARD_TEST_RESERVATION_PRICE,
+            STANDARD_TEST_START_PRICE, {"from": seller_account}
+        )
+
+
+def test_initialize_and_launch_once(test_token):
+    """
+        Tests that the created auctions cannot be initialized (nor launched) again through initializeAndLaunch.
+    """
+
+    seller_account = accounts[0]
+    test_token.getTokens(STANDARD_TEST_TOKEN_COUNT, {"from": seller_account})
+
+    start_timestamp = chain.time() + STANDARD_TEST_START_DELAY
+    end_timestamp   = start_timestamp + STANDARD_TEST_DURATION
+
+    dutch_auction = deploy_fund_and_launch(
+        seller_account, test_token, STANDARD_TEST_TOKEN_COUNT, start_timestamp, end_timestamp,
+        STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE
+    )
+
+    with reverts('The auction has already been initialized'):
+        dutch_auction.initializeAndLaunch(
+            test_token, accounts[1], start_timestamp, end_timestamp, STANDARD_TEST_START_PRICE,
+            STANDARD_TEST_RESERVATION_PRICE, {"from": accounts[1]}
+        )
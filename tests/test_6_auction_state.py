@@ -0,0 +1,106 @@
+from brownie import DutchAuction, accounts, chain
+from brownie.test import given, strategy
+from scripts.deploy import deploy_auction_factory
+from scripts.auction_state import get_auction_state, ZERO_ADDRESS
+
+from conftest import (
+    STANDARD_TEST_TOKEN_COUNT,
+    STANDARD_TEST_START_DELAY,
+    STANDARD_TEST_DURATION,
+    STANDARD_TEST_START_PRICE,
+    STANDARD_TEST_RESERVATION_PRICE,
+    STANDARD_TEST_END_MAX_CHECK_DELAY
+)
+
+# Auction state snapshot tests **************************************************************************************************
+
+
+def test_state_before_launch(test_token, funded_auction):
+    """
+        Tests the auction snapshot before the auction is launched.
+    """
+
+    seller_account = accounts[0]
+    dutch_auction = funded_auction
+
+    state = get_auction_state(dutch_auction)
+
+    assert(not state.ready and not state.started and not state.finished and not state.ongoing and not state.deserted)
+    assert(state.seller == seller_account and state.owner == seller_account)
+    assert(state.buyer == ZERO_ADDRESS)
+    assert(state.token == test_token)
+    assert(state.current_price == 0)
+    assert(state.token_balance == STANDARD_TEST_TOKEN_COUNT and state.balance == 0)
+
+
+def test_state_without_token():
+    """
+        Tests that the snapshot of an auction without a token (the implementation contract of a factory) does not revert.
+    """
+
+    factory = deploy_auction_factory(accounts[0])
+
+    state = get_auction_state(DutchAuction.at(factory.implementation()))
+
+    assert(not state.ready and not state.started and not state.finished)
+    assert(state.token == ZERO_ADDRESS)
+    assert(state.token_balance == 0)
+
+
+def test_state_with_invalid_token():
+    """
+        Tests that the snapshot of an auction whose token has no code (an EOA) or whose balanceOf reverts does not revert.
+    """
+
+    factory = deploy_auction_factory(accounts[0])
+
+    for token in [accounts[5], factory]:
+        tx = factory.createAuction(token, {"from": accounts[0]})
+
+        state = get_auction_state(DutchAuction.at(tx.events["AuctionCreated"]["auction"]))
+
+        assert(not state.ready)
+        assert(state.token == token)
+        assert(state.token_balance == 0)
+
+
+@given(
+    delay = strategy('uint32', min_value=0, max_value=STANDARD_TEST_START_DELAY + STANDARD_TEST_DURATION + STANDARD_TEST_END_MAX_CHECK_DELAY),
+    bid   = strategy('bool')
+)
+def test_state_matches_views(launched_auction, delay, bid):
+    """
+        Tests that the auction snapshot matches the individual auction views, without reverting.
+    """
+
+    buyer_account = accounts[1]
+    dutch_auction = launched_auction
+
+    start_timestamp = dutch_auction.startTimestamp()
+    end_timestamp   = dutch_auction.endTimestamp()
+
+    chain.sleep(delay)
+    chain.mine()
+
+    if bid and dutch_auction.isAuctionOngoing():
+        dutch_auction.buy({"from": buyer_account, "value": STANDARD_TEST_START_PRICE})
+
+    state = get_auction_state(dutch_auction)
+    now   = state.timestamp # Timestamp at which the snapshot was taken
+
+    assert(state.ready)
+    assert(state.started == (now >= start_timestamp))
+    assert(state.finished == (now >= end_timestamp))
+    assert(state.ongoing == (start_timestamp <= now < end_timestamp))
+    assert(state.buyer == dutch_auction.buyer())
+    assert(state.token_balance == dutch_auction.getTokenBalance())
+    assert(state.start_timestamp == start_timestamp and state.end_timestamp == end_timestamp)
+    assert(state.deserted == (state.finished and not state.has_buyer))
+
+    if state.ongoing and not state.has_buyer:
+        expected_price = STANDARD_TEST_START_PRICE - (
+            (STANDARD_TEST_START_PRICE - STANDARD_TEST_RESERVATION_PRICE)*(now - start_timestamp) // STANDARD_TEST_DURATION
+        )
+        assert(state.current_price == expected_price)
+    else:
+        assert(state.current_price == 0)
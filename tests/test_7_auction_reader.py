@@ -0,0 +1,48 @@
+from brownie import TestFallback, accounts, chain
+from brownie.test import given, strategy
+from scripts.auction_reader import deploy_auction_reader, read_auctions
+from scripts.auction_state import get_auction_state
+
+from conftest import STANDARD_TEST_TOKEN_COUNT
+
+# Batched auction reader tests **************************************************************************************************
+
+
+@given(
+    chunk_size = strategy('uint8', min_value=1, max_value=4)
+)
+def test_read_auctions(test_token, started_auction, funded_auction, deployed_auction, chunk_size):
+    """
+        Tests that a batch of auctions (launched or not) is read in chunks, skipping the addresses which are not auctions:
+        a contract which reverts, an account without code, and contracts returning data which is not an auction state.
+    """
+
+    seller_account = accounts[0]
+
+    # getCurrentPrice reverts for all but the started auction
+    auctions = [started_auction, funded_auction, deployed_auction]
+
+    # Data of a wrong size, and of the right size which cannot be decoded (the flags are not booleans)
+    non_auctions = [
+        test_token,
+        accounts[5],
+        TestFallback.deploy(b"\x01"*32, {"from": seller_account}),
+        TestFallback.deploy(b"\xff"*17*32, {"from": seller_account})
+    ]
+
+    reader = deploy_auction_reader(seller_account)
+    states = read_auctions(reader, auctions + non_auctions, chunk_size)
+
+    assert(len(states) == len(auctions) + len(non_auctions))
+    assert(states[len(auctions):] == [None]*len(non_auctions))
+
+    for dutch_auction, state in zip(auctions, states):
+        expected_state = get_auction_state(dutch_auction, chain.height)
+
+        assert(state.address == dutch_auction.address)
+        assert(state.ready == expected_state.ready)
+        assert(state.token_balance == expected_state.token_balance)
+
+    assert(states[0].ongoing and states[0].current_price > 0)
+    assert(states[1].current_price == 0 and states[2].current_price == 0)
+    assert(states[1].token_balance == STANDARD_TEST_TOKEN_COUNT and states[2].token_balance == 0)
@@ -0,0 +1,97 @@
+import numpy as np
+
+from brownie import accounts, chain
+from brownie.test import given, strategy
+from scripts.auction_reader import deploy_auction_reader, read_auctions
+from scripts.deploy import deploy_and_fund_auction
+from scripts.price_engine import current_price, current_prices, time_at_price
+
+from conftest import (
+    STANDARD_TEST_TOKEN_COUNT,
+    STANDARD_TEST_START_DELAY,
+    STANDARD_TEST_DURATION,
+    STANDARD_TEST_START_PRICE
+)
+
+# Off-chain price engine tests **************************************************************************************************
+
+
+@given(
+    start_timestamp   = strategy('uint64', max_value=2**63),
+    duration          = strategy('uint32', min_value=1),
+    start_price       = strategy('uint128', min_value=1),
+    reservation_seed  = strategy('uint128'),
+    timestamp_deltas  = strategy('int32[10]')
+)
+def test_vectorized_prices(start_timestamp, duration, start_price, reservation_seed, timestamp_deltas):
+    """
+        Tests that the vectorized prices match the scalar ones, for int64 and arbitrarily large prices.
+    """
+
+    end_timestamp     = start_timestamp + duration
+    reservation_price = reservation_seed % start_price
+    timestamps        = [max(start_timestamp + delta, 0) for delta in timestamp_deltas] + [start_timestamp, end_timestamp - 1, end_timestamp]
+
+    prices = current_prices(start_timestamp, end_timestamp, start_price, reservation_price, timestamps)
+
+    assert(list(prices) == [current_price(start_timestamp, end_timestamp, start_price, reservation_price, t) for t in timestamps])
+    assert(not np.any(current_prices(start_timestamp, end_timestamp, start_price, reservation_price, timestamps, sold=True)))
+
+
+@given(
+    start_timestamp  = strategy('uint64', max_value=2**63),
+    duration         = strategy('uint32', min_value=1),
+    start_price      = strategy('uint128', min_value=1),
+    reservation_seed = strategy('uint128'),
+    target_seed      = strategy('uint128')
+)
+def test_time_at_price(start_timestamp, duration, start_price, reservation_seed, target_seed):
+    """
+        Tests that the price reaches the target price exactly at the returned timestamp.
+    """
+
+    end_timestamp     = start_timestamp + duration
+    reservation_price = reservation_seed % start_price
+    target_price      = target_seed % (2*start_price)
+
+    timestamp = time_at_price(start_timestamp, end_timestamp, start_price, reservation_price, target_price)
+    if timestamp is None:
+        assert(target_price <= reservation_price or current_price(start_timestamp, end_timestamp, start_price, reservation_price, end_timestamp - 1) > target_price)
+        return
+
+    assert(0 < current_price(start_timestamp, end_timestamp, start_price, reservation_price, timestamp) <= target_price)
+    if timestamp > start_timestamp:
+        assert(current_price(start_timestamp, end_timestamp, start_price, reservation_price, timestamp - 1) > target_price)
+
+
+@given(
+    start_prices = strategy('uint64[4]', min_value=2, max_value=STANDARD_TEST_START_PRICE),
+    durations    = strategy('uint32[4]', min_value=1, max_value=STANDARD_TEST_DURATION),
+    delay        = strategy('uint32', max_value=STANDARD_TEST_DURATION)
+)
+def test_prices_match_contract(test_token, start_prices, durations, delay):
+    """
+        Tests that the prices of many auctions, computed off-chain in a single call, exactly match the contract's.
+    """
+
+    seller_account = accounts[0]
+
+    start_timestamp    = chain.time() + STANDARD_TEST_START_DELAY
+    end_timestamps     = [start_timestamp + duration for duration in durations]
+    reservation_prices = [start_price // 2 for start_price in start_prices]
+
+    auctions = []
+    for end_timestamp, start_price, reservation_price in zip(end_timestamps, start_prices, reservation_prices):
+        dutch_auction = deploy_and_fund_auction(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT)
+        dutch_auction.launchAuction(start_timestamp, end_timestamp, start_price, reservation_price, {"from": seller_account})
+        auctions.append(dutch_auction)
+
+    chain.sleep(STANDARD_TEST_START_DELAY + delay)
+    chain.mine()
+
+    states = read_auctions(deploy_auction_reader(seller_account), auctions)
+    prices = current_prices(
+        [start_timestamp]*len(auctions), end_timestamps, start_prices, reservation_prices, [state.timestamp for state in states]
+    )
+
+    assert(list(prices) == [state.current_price for state in states])
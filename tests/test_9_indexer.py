@@ -0,0 +1,133 @@
+from brownie import accounts, chain
+from pytest import raises
+from scripts.deploy import deploy_and_fund_auction, deploy_auction_factory, deploy_fund_and_launch
+from scripts.indexer import AuctionIndexer
+
+from conftest import (
+    STANDARD_TEST_TOKEN_COUNT,
+    STANDARD_TEST_START_DELAY,
+    STANDARD_TEST_DURATION,
+    STANDARD_TEST_START_PRICE,
+    STANDARD_TEST_RESERVATION_PRICE
+)
+
+# Event indexer tests ***********************************************************************************************************
+
+
+def test_indexer(test_token, tmp_path):
+    """
+        Tests that the auction events are indexed incrementally, resuming from the stored checkpoint.
+    """
+
+    seller_account = accounts[0]
+    buyer_account  = accounts[1]
+    db_path        = tmp_path / "auctions.db"
+
+    sold_auction     = deploy_and_fund_auction(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT)
+    deserted_auction = deploy_and_fund_auction(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT)
+    first_block      = sold_auction.tx.block_number
+
+    start_timestamp = chain.time() + STANDARD_TEST_START_DELAY
+    end_timestamp   = start_timestamp + STANDARD_TEST_DURATION
+    for dutch_auction in [sold_auction, deserted_auction]:
+        dutch_auction.launchAuction(start_timestamp, end_timestamp, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE, {"from": seller_account})
+
+    # Index the launches (in chunks of 2 blocks)
+    indexer = AuctionIndexer(db_path, chunk_size=2, addresses=[sold_auction, deserted_auction], start_block=first_block)
+    stats   = indexer.run()
+    assert(stats["logs"] == 2)
+    assert(indexer.checkpoint == chain.height)
+    assert(len(indexer.get_auctions(outcome="ongoing", timestamp=start_timestamp)) == 2)
+    indexer.close()
+
+    chain.sleep(STANDARD_TEST_START_DELAY)
+    chain.mine()
+    buy_tx = sold_auction.buy({"from": buyer_account, "value": STANDARD_TEST_START_PRICE})
+
+    chain.sleep(STANDARD_TEST_DURATION)
+    chain.mine()
+    deserted_auction.retrieveTokens({"from": seller_account})
+
+    # Resume from the checkpoint (with a new indexer), and check that indexing again is a no-op
+    indexer = AuctionIndexer(db_path, chunk_size=2, addresses=[sold_auction, deserted_auction])
+    assert(indexer.run()["logs"] == 2)
+    assert(indexer.run()["logs"] == 0)
+
+    sold = indexer.get_auction(sold_auction)
+    assert(sold["buyer"] == buyer_account)
+    assert(int(sold["sale_price"]) == buy_tx.return_value)
+    assert(int(sold["token_count"]) == STANDARD_TEST_TOKEN_COUNT)
+    assert(sold["start_timestamp"] == start_timestamp and sold["end_timestamp"] == end_timestamp)
+
+    deserted = indexer.get_auction(deserted_auction)
+    assert(deserted["buyer"] is None)
+    assert(int(deserted["tokens_retrieved"]) == STANDARD_TEST_TOKEN_COUNT)
+
+    assert([auction["address"] for auction in indexer.get_auctions(outcome="sold")] == [sold_auction.address])
+    assert([auction["address"] for auction in indexer.get_auctions(outcome="deserted", timestamp=end_timestamp)] == [deserted_auction.address])
+    indexer.close()
+
+
+def test_indexer_factory(test_token, tmp_path):
+    """
+        Tests that only the auctions created by the given factory are indexed, ignoring the events of other contracts.
+    """
+
+    seller_account = accounts[0]
+    db_path        = tmp_path / "auctions.db"
+
+    factory     = deploy_auction_factory(seller_account)
+    first_block = chain.height + 1
+    test_token.getTokens(STANDARD_TEST_TOKEN_COUNT, {"from": seller_account})
+
+    start_timestamp = chain.time() + STANDARD_TEST_START_DELAY
+    end_timestamp   = start_timestamp + STANDARD_TEST_DURATION
+    launch_args     = (start_timestamp, end_timestamp, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE)
+
+    factory_auction = deploy_fund_and_launch(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT, *launch_args, factory)
+
+    # Auction deployed outside the factory, emitting the same events
+    other_auction = deploy_and_fund_auction(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT)
+    other_auction.launchAuction(*launch_args, {"from": seller_account})
+
+    indexer = AuctionIndexer(db_path, factory=factory, start_block=first_block)
+    assert(indexer.run()["logs"] == 2) # AuctionCreated and AuctionLaunched
+
+    assert([auction["address"] for auction in indexer.get_auctions()] == [factory_auction.address])
+    assert(indexer.get_auction(other_auction) is None)
+
+    indexed = indexer.get_auction(factory_auction)
+    assert(indexed["start_timestamp"] == start_timestamp and indexed["end_timestamp"] == end_timestamp)
+    assert(int(indexed["start_price"]) == STANDARD_TEST_START_PRICE)
+    indexer.close()
+
+
+def test_indexer_large_timestamps(test_token, tmp_path):
+    """
+        Tests that a launch with an end timestamp which does not fit in an SQLite integer is indexed, and compared numerically.
+    """
+
+    seller_account = accounts[0]
+    db_path        = tmp_path / "auctions.db"
+
+    dutch_auction = deploy_and_fund_auction(seller_account, test_token, STANDARD_TEST_TOKEN_COUNT)
+    first_block   = dutch_auction.tx.block_number
+
+    start_timestamp = chain.time() + STANDARD_TEST_START_DELAY
+    end_timestamp   = 2**64 - 1
+    dutch_auction.launchAuction(start_timestamp, end_timestamp, STANDARD_TEST_START_PRICE, STANDARD_TEST_RESERVATION_PRICE, {"from": seller_account})
+
+    indexer = AuctionIndexer(db_path, addresses=[dutch_auction], start_block=first_block)
+    assert(indexer.run()["logs"] == 1)
+    assert(indexer.checkpoint == chain.height)
+
+    indexed = indexer.get_auction(dutch_auction)
+    assert(indexed["start_timestamp"] == start_timestamp and indexed["end_timestamp"] == end_timestamp)
+
+    assert(len(indexer.get_auctions(outcome="ongoing", timestamp=2**63)) == 1)
+    assert(len(indexer.get_auctions(outcome="deserted", timestamp=10**19)) == 0)
+    assert(len(indexer.get_auctions(outcome="deserted", timestamp=end_timestamp)) == 1)
+
+    with raises(ValueError):
+        indexer.get_auctions(outcome="ongoing")
+    indexer.close()